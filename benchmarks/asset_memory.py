@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Asset Memory Benchmark
+
+Measures peak Python memory of validating and packaging one skill (sharing a
+SkillTree, as `brandctl pipeline` does) as its assets/templates/ directory
+grows. Large files are streamed in chunks rather than read whole, so the peak
+should stay flat while the bytes packaged grow with the template count.
+
+Template files are hard links to one generated file where the filesystem
+allows it, so large runs cost little disk space.
+
+Usage:
+    python benchmarks/asset_memory.py                                # 10, 50 and 200 templates of 2 MB
+    python benchmarks/asset_memory.py --counts 10 100 1000 --file-size 8
+    python benchmarks/asset_memory.py --output memory.json
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from catalog import generate_skill
+from package_skill import DEFAULT_EXCLUDE_PATTERNS, package_skill
+from run_benchmarks import quiet
+from skill_model import SkillTree
+from validate_brand_assets import validate_brand_skill
+
+DEFAULT_COUNTS = (10, 50, 200)
+
+# Template size in MB; above the SkillTree cache limit, so every template is streamed
+DEFAULT_FILE_SIZE = 2
+
+# Peak growth (largest count vs smallest) still reported as flat
+FLAT_RATIO = 1.5
+
+
+def write_template(path: Path, size: int, seed: int):
+    """Incompressible content, like an already-zipped .pptx"""
+    block = random.Random(seed).randbytes(64 * 1024)
+    with open(path, 'wb') as f:
+        for _ in range(size // len(block)):
+            f.write(block)
+        f.write(block[:size % len(block)])
+
+
+def add_templates(skill_path: Path, count: int, source: Path):
+    templates = skill_path / 'assets' / 'templates'
+    templates.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        target = templates / f'template-{index:05d}.pptx'
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+
+
+def measure(skill_path: Path, dist_dir: Path) -> tuple[int, float]:
+    """(peak traced bytes, seconds) for validating and packaging a skill"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    with quiet():
+        tree = SkillTree(skill_path)
+        validate_brand_skill(skill_path, verbose=False, tree=tree)
+        package_skill(skill_path, dist_dir, DEFAULT_EXCLUDE_PATTERNS, tree=tree)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def run_memory_benchmark(counts, file_size: int, seed: int, workdir: Path = None) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory(prefix='brand-memory-', dir=workdir) as tmp:
+        tmp = Path(tmp)
+        source = tmp / 'template.pptx'
+        write_template(source, file_size, seed)
+
+        print(f"{'Templates':>9}  {'Packaged':>10}  {'Peak memory':>11}  {'Time':>7}")
+        for count in counts:
+            skills_dir = tmp / f'skills-{count}'
+            skills_dir.mkdir()
+            skill_path, _ = generate_skill(0, skills_dir, seed)
+            add_templates(skill_path, count, source)
+
+            peak, elapsed = measure(skill_path, tmp / f'dist-{count}')
+            packaged = sum(entry.stat().st_size for entry in os.scandir(tmp / f'dist-{count}'))
+            results.append({'templates': count, 'package_bytes': packaged, 'peak_bytes': peak,
+                            'seconds': round(elapsed, 3)})
+            print(f"{count:>9}  {packaged / 1024 / 1024:>8.1f}MB  {peak / 1024 / 1024:>9.2f}MB  {elapsed:>6.2f}s")
+
+            shutil.rmtree(skills_dir)
+            shutil.rmtree(tmp / f'dist-{count}')
+    return results
+
+
+def main():
+    parser = create_parser(
+        description='Measure peak memory of validate + package as a skill\'s template count grows',
+        epilog='Example: python asset_memory.py --counts 10 100 1000'
+    )
+
+    parser.add_argument('--counts', type=int, nargs='+', default=list(DEFAULT_COUNTS),
+                        help='Template counts to measure (default: 10 50 200)')
+    parser.add_argument('--file-size', type=float, default=DEFAULT_FILE_SIZE,
+                        help=f'Size of each template in MB (default: {DEFAULT_FILE_SIZE})')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--workdir', help='Directory for the temporary skill (default: system temp)')
+    parser.add_argument('--output', help='Write results as JSON to this file')
+
+    args = parse_args(parser)
+
+    counts = sorted(args.counts)
+    results = run_memory_benchmark(counts, int(args.file_size * 1024 * 1024), args.seed, args.workdir)
+    print()
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + '\n')
+        print(f"✓ Results written to {args.output}")
+
+    if len(results) > 1:
+        ratio = results[-1]['peak_bytes'] / max(results[0]['peak_bytes'], 1)
+        if ratio > FLAT_RATIO:
+            print(f"✗ Peak memory grew {ratio:.1f}x from {counts[0]} to {counts[-1]} templates")
+            return 1
+        print(f"✓ Peak memory flat: {ratio:.2f}x from {counts[0]} to {counts[-1]} templates")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
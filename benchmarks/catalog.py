@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Synthetic Brand Catalog Generator
+
+Builds a catalog of N brand skills by driving init_brand_skill() with varied
+colors, fonts and names, then grows each skill to realistic proportions:
+longer SKILL.md and reference files (sized like hand-written guidelines) and
+logos of varied pixel dimensions. Generation is deterministic for a given
+seed, so catalogs built on different commits are identical.
+
+Usage:
+    python benchmarks/catalog.py 1000 --output /tmp/catalog-1k
+    python benchmarks/catalog.py 10 --output /tmp/catalog-10 --seed 7
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import argparse
+import contextlib
+import functools
+import os
+import random
+import time
+
+from init_brand_skill import init_brand_skill, render_initials_png, slugify
+from skill_model import iter_tree
+
+FONTS = ('Inter', 'Roboto', 'Montserrat', 'Open Sans', 'Lato', 'Playfair Display', 'Source Sans Pro',
+         'Poppins', 'Merriweather', 'Nunito', 'Work Sans', 'IBM Plex Sans')
+
+NAME_WORDS = ('Acme', 'Northwind', 'Blue', 'Summit', 'Harbor', 'Pixel', 'Granite', 'Willow', 'Vector',
+              'Atlas', 'Cedar', 'Lumen', 'Orbit', 'Quartz', 'Maple', 'Nimbus', 'Forge', 'Silver')
+NAME_SUFFIXES = ('Corp', 'Labs', 'Studio', 'Group', 'Health', 'Foods', 'Logistics', 'Media', 'Bank', 'Sites')
+
+# Logo sizes seen in client hand-offs, from favicon exports to print masters
+LOGO_SIZES = ((120, 60), (400, 200), (500, 500), (800, 400), (1200, 614), (2000, 1000), (3000, 3000), (4800, 2400))
+
+LOGO_BACKGROUNDS = ('#0052CC', '#1E3A8A', '#FF5733', '#10B981')
+
+# Extra bytes of guideline prose added per file: (min, max)
+EXTRA_SIZES = {
+    'SKILL.md': (1_000, 12_000),
+    'references/color-system.md': (2_000, 30_000),
+    'references/typography.md': (1_000, 20_000),
+    'references/logo-usage.md': (1_000, 40_000),
+}
+
+PROSE_POOL_SIZE = 500
+
+PROSE_WORDS = (
+    'brand', 'logo', 'color', 'palette', 'contrast', 'typography', 'heading', 'body', 'spacing', 'grid',
+    'clearspace', 'background', 'accessible', 'consistent', 'primary', 'secondary', 'accent', 'print',
+    'digital', 'usage', 'avoid', 'always', 'never', 'minimum', 'size', 'weight', 'layout', 'imagery',
+    'tone', 'voice', 'campaign', 'social', 'presentation', 'document', 'template', 'the', 'and', 'with',
+    'for', 'on', 'in', 'of', 'use', 'keep', 'ensure', 'match', 'apply', 'review', 'approved',
+)
+
+
+def skill_args(rng: random.Random, path: Path) -> argparse.Namespace:
+    """Arguments for init_brand_skill(), as the CLI would pass them"""
+    def color():
+        return '#{:06X}'.format(rng.randrange(0x1000000))
+
+    return argparse.Namespace(
+        primary_color=color(),
+        secondary_color=color() if rng.random() < 0.8 else None,
+        accent_color=color() if rng.random() < 0.5 else None,
+        font_heading=rng.choice(FONTS),
+        font_subheading=rng.choice(FONTS) if rng.random() < 0.4 else None,
+        font_body=rng.choice(FONTS),
+        path=str(path),
+        force=True,
+        tokens=rng.random() < 0.3,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def prose_sections(seed: int) -> tuple[str, ...]:
+    """A pool of filler guideline sections; skills draw from it instead of generating text"""
+    rng = random.Random(seed)
+    sections = []
+    for _ in range(PROSE_POOL_SIZE):
+        sentences = []
+        for _ in range(rng.randint(3, 8)):
+            words = [rng.choice(PROSE_WORDS) for _ in range(rng.randint(8, 20))]
+            sentences.append(' '.join(words).capitalize() + '.')
+        bullets = ''.join(f"- {rng.choice(PROSE_WORDS).capitalize()} {' '.join(rng.choice(PROSE_WORDS) for _ in range(6))}\n"
+                          for _ in range(rng.randint(0, 5)))
+        sections.append(' '.join(sentences) + '\n' + bullets)
+    return tuple(sections)
+
+
+def prose(rng: random.Random, size: int, seed: int) -> str:
+    """Markdown sections of filler guideline text, about size bytes long"""
+    pool = prose_sections(seed)
+    parts = []
+    written = 0
+    while written < size:
+        parts.append(f"\n## Additional Guidance {len(parts) + 1}\n\n{rng.choice(pool)}")
+        written += len(parts[-1])
+    return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def logo_png(width: int, height: int, background: str) -> bytes:
+    # Encoding a multi-megapixel PNG dominates generation time; logos of one
+    # size and color are shared across skills
+    return render_initials_png('BC', width, height, '#FFFFFF', background)
+
+
+def generate_skill(index: int, root: Path, seed: int) -> tuple[Path, float]:
+    """Create skill number index below root; returns (skill path, seconds spent in init_brand_skill)"""
+    rng = random.Random(f'{seed}:{index}')
+    client_name = f"{rng.choice(NAME_WORDS)} {rng.choice(NAME_SUFFIXES)} {index:05d}"
+    args = skill_args(rng, root)
+
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        init_brand_skill(client_name, args)
+    elapsed = time.perf_counter() - start
+
+    skill_path = root / slugify(client_name)
+    for rel, (low, high) in EXTRA_SIZES.items():
+        with open(skill_path / rel, 'a') as f:
+            f.write(prose(rng, rng.randint(low, high), seed))
+
+    width, height = rng.choice(LOGO_SIZES)
+    (skill_path / 'assets' / 'logo.png').write_bytes(logo_png(width, height, rng.choice(LOGO_BACKGROUNDS)))
+    return skill_path, elapsed
+
+
+def generate_catalog(root: Path, count: int, seed: int = 0) -> tuple[list[Path], float]:
+    """Create count skills below root; returns (skill paths, total init_brand_skill seconds)"""
+    root.mkdir(parents=True, exist_ok=True)
+    skills = []
+    init_seconds = 0.0
+    for index in range(count):
+        skill_path, elapsed = generate_skill(index, root, seed)
+        skills.append(skill_path)
+        init_seconds += elapsed
+    return skills, init_seconds
+
+
+def catalog_size(skills) -> tuple[int, int]:
+    """(file count, total bytes) of a catalog"""
+    files = total = 0
+    for skill_path in skills:
+        for _, entry in iter_tree(skill_path):
+            if entry.is_file():
+                files += 1
+                total += entry.stat().st_size
+    return files, total
+
+
+def main():
+    parser = create_parser(
+        description='Generate a synthetic catalog of brand skills for benchmarking',
+        epilog='Example: python catalog.py 1000 --output /tmp/catalog-1k'
+    )
+
+    parser.add_argument('count', type=int, help='Number of skills to generate')
+    parser.add_argument('--output', required=True, help='Directory to create the skills in')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+
+    args = parse_args(parser)
+
+    start = time.perf_counter()
+    skills, init_seconds = generate_catalog(Path(args.output), args.count, args.seed)
+    elapsed = time.perf_counter() - start
+    files, total = catalog_size(skills)
+
+    print(f"✓ Generated {len(skills)} skill(s) in {args.output} ({elapsed:.1f}s, {init_seconds:.1f}s in init_brand_skill)")
+    print(f"  {files} files, {total / 1024 / 1024:.1f} MB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
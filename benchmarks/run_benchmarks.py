@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Brand Skill Benchmarks
+
+Times the core pipeline over synthetic catalogs (see catalog.py):
+
+- init       init_brand_skill() for every skill
+- validate   validate_brand_skill() for every skill
+- package    package_skill() for every skill into .skill files
+- extract    unzipping every .skill file
+
+Results are written as JSON with the commit, Python version and machine, so
+runs on different commits can be compared with --compare.
+
+Usage:
+    python benchmarks/run_benchmarks.py                          # 10 and 1k skills
+    python benchmarks/run_benchmarks.py --sizes 10 1000 10000 --output before.json
+    python benchmarks/run_benchmarks.py --compare before.json after.json
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import contextlib
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+
+from catalog import catalog_size, generate_catalog
+from package_skill import DEFAULT_EXCLUDE_PATTERNS, package_skill
+from validate_brand_assets import validate_brand_skill
+
+DEFAULT_SIZES = (10, 1000)
+
+PHASES = ('init', 'validate', 'package', 'extract')
+
+# Slowdown (percent) that --compare reports as a regression
+DEFAULT_THRESHOLD = 10.0
+
+RESULTS_VERSION = 1
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the progress output of the scripts being timed"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def best_of(repeat: int, function) -> float:
+    """Fastest of repeat timed calls, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark_catalog(count: int, workdir: Path, repeat: int, seed: int) -> dict:
+    """Timings for one catalog size"""
+    skills_dir = workdir / 'skills'
+    dist_dir = workdir / 'dist'
+    extract_dir = workdir / 'extracted'
+
+    skills, init_seconds = generate_catalog(skills_dir, count, seed)
+    files, total_bytes = catalog_size(skills)
+
+    def validate():
+        for skill_path in skills:
+            validate_brand_skill(skill_path, verbose=False)
+
+    def package():
+        with quiet():
+            for skill_path in skills:
+                package_skill(skill_path, dist_dir, DEFAULT_EXCLUDE_PATTERNS)
+
+    def extract():
+        import zipfile
+
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        for package in sorted(dist_dir.glob('*.skill')):
+            with zipfile.ZipFile(package) as zf:
+                zf.extractall(extract_dir)
+
+    seconds = {
+        'init': init_seconds,
+        'validate': best_of(repeat, validate),
+        'package': best_of(repeat, package),
+        'extract': best_of(repeat, extract),
+    }
+    package_bytes = sum(p.stat().st_size for p in dist_dir.glob('*.skill'))
+
+    return {
+        'skills': count,
+        'files': files,
+        'bytes': total_bytes,
+        'package_bytes': package_bytes,
+        'phases': {
+            phase: {'seconds': round(value, 4), 'ms_per_skill': round(value * 1000 / count, 3)}
+            for phase, value in seconds.items()
+        },
+    }
+
+
+def run_benchmarks(sizes, repeat: int, seed: int, workdir: Path = None) -> dict:
+    results = {
+        'version': RESULTS_VERSION,
+        'commit': git_commit(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': seed,
+        'repeat': repeat,
+        'catalogs': {},
+    }
+    for count in sizes:
+        print(f"Benchmarking {count} skill(s)...")
+        with tempfile.TemporaryDirectory(prefix=f'brand-bench-{count}-', dir=workdir) as tmp:
+            catalog = benchmark_catalog(count, Path(tmp), repeat, seed)
+        results['catalogs'][str(count)] = catalog
+        for phase in PHASES:
+            timing = catalog['phases'][phase]
+            print(f"  {phase:<9} {timing['seconds']:>9.3f}s  {timing['ms_per_skill']:>8.3f} ms/skill")
+    return results
+
+
+def compare_results(old: dict, new: dict, threshold: float) -> int:
+    """Print per-phase changes between two result files; returns the number of regressions"""
+    print(f"Comparing {old.get('commit', '?')} ({old.get('date', '?')}) -> {new.get('commit', '?')} ({new.get('date', '?')})")
+    if old.get('platform') != new.get('platform') or old.get('python') != new.get('python'):
+        print("⚠ Results come from different machines or Python versions")
+    print()
+
+    regressions = 0
+    for count in sorted(set(old['catalogs']) & set(new['catalogs']), key=int):
+        print(f"{count} skill(s):")
+        for phase in PHASES:
+            before = old['catalogs'][count]['phases'][phase]['ms_per_skill']
+            after = new['catalogs'][count]['phases'][phase]['ms_per_skill']
+            change = (after - before) / before * 100 if before else 0.0
+            if change > threshold:
+                mark = '❌'
+                regressions += 1
+            elif change < -threshold:
+                mark = '✅'
+            else:
+                mark = '  '
+            print(f"  {mark} {phase:<9} {before:>9.3f} -> {after:>9.3f} ms/skill  ({change:+.1f}%)")
+        print()
+
+    if regressions:
+        print(f"✗ {regressions} phase(s) slower by more than {threshold:g}%")
+    else:
+        print(f"✓ No phase slower by more than {threshold:g}%")
+    return regressions
+
+
+def main():
+    parser = create_parser(
+        description='Benchmark init, validation, packaging and extraction over synthetic skill catalogs',
+        epilog='Example: python run_benchmarks.py --sizes 10 1000 --output results.json'
+    )
+
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Catalog sizes to benchmark (default: 10 1000)')
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Runs per phase; the fastest is kept (default: 1; init always runs once)')
+    parser.add_argument('--seed', type=int, default=0, help='Catalog random seed (default: 0)')
+    parser.add_argument('--workdir', help='Directory for temporary catalogs (default: system temp)')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='Compare two result files instead of running')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Percent slowdown reported as a regression (default: {DEFAULT_THRESHOLD:g})')
+
+    args = parse_args(parser)
+
+    if args.compare:
+        try:
+            old, new = (json.loads(Path(path).read_text()) for path in args.compare)
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not read results: {e}")
+            return 1
+        return 1 if compare_results(old, new, args.threshold) else 0
+
+    results = run_benchmarks(args.sizes, args.repeat, args.seed, args.workdir)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + '\n')
+        print()
+        print(f"✓ Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
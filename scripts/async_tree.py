@@ -0,0 +1,165 @@
+"""
+Async Skill Tree Loader
+
+Fills SkillTree snapshots with concurrent I/O, for skills on network
+filesystems (NFS, SMB) where every directory listing, stat() and open() is a
+round trip. A SkillTree answers existence checks from one listing per
+directory, but still issues those listings, the stat of each file and the
+reads one after another. Here each level of directories is listed
+concurrently, every file is stat()ed and every file validation needs is read
+as soon as its directory listing arrives. All of this goes through one bounded
+thread pool, so a skill costs roughly the slowest chain of round trips instead
+of their sum.
+
+prefetch_trees() extends this across skills: it keeps the next few skills
+loading in the background while the caller validates or packages the current
+one. The snapshots match a sequentially scanned SkillTree, including file
+order, so packages are byte-identical.
+"""
+
+import asyncio
+import fnmatch
+import os
+import threading
+from collections import deque
+from pathlib import Path
+
+from skill_model import CACHE_MAX_BYTES, SkillTree
+
+# Filesystem operations in flight at once
+DEFAULT_IO_WORKERS = 32
+
+# Skills loading ahead of the one being processed
+DEFAULT_AHEAD = 4
+
+# Files validate_brand_skill() reads; None reads every small file (packaging)
+VALIDATION_READS = ('SKILL.md', 'references/*.md', 'assets/*')
+
+
+def _list_dir(path: str) -> list:
+    with os.scandir(path) as it:
+        return [(entry, entry.is_dir(), entry.is_symlink()) for entry in it]
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class AsyncTreeLoader:
+    """Loads SkillTree snapshots through a bounded pool of I/O threads"""
+
+    def __init__(self, workers: int = DEFAULT_IO_WORKERS):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='skill-io')
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    async def _io(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def load(self, skill_path: Path, reads: tuple = VALIDATION_READS) -> SkillTree:
+        """Snapshot of a skill: every directory listed, every file stat()ed, matching small files read"""
+        root = str(skill_path)
+        listings = {}
+        stats = {}
+        content = {}
+
+        def wanted(rel: str) -> bool:
+            return reads is None or any(fnmatch.fnmatchcase(rel, pattern) for pattern in reads)
+
+        async def load_file(rel: str, entry):
+            try:
+                stats[rel] = await self._io(entry.stat)
+            except OSError:
+                return  # Dangling symlink
+            if stats[rel].st_size <= CACHE_MAX_BYTES and wanted(rel):
+                try:
+                    content[rel] = await self._io(_read_file, entry.path)
+                except OSError:
+                    pass  # Left for the reader to report
+
+        async def load_dir(rel_dir: str):
+            try:
+                entries = await self._io(_list_dir, os.path.join(root, rel_dir))
+            except OSError:
+                return
+            listings[rel_dir] = entries
+            tasks = []
+            for entry, is_dir, is_symlink in entries:
+                rel = rel_dir + entry.name
+                if not is_dir:
+                    tasks.append(load_file(rel, entry))
+                elif not is_symlink:
+                    tasks.append(load_dir(rel + '/'))
+            await asyncio.gather(*tasks)
+
+        # A missing root shows up as a failed listing rather than an extra stat() round trip
+        await load_dir('')
+
+        # Assemble in the order of a sequential top-down walk (see skill_model.iter_tree)
+        files = {}
+        dirs = {''} if '' in listings else set()
+        stack = ['']
+        while stack:
+            rel_dir = stack.pop()
+            subdirs = []
+            for entry, is_dir, is_symlink in listings.get(rel_dir, ()):
+                rel = rel_dir + entry.name
+                if is_dir:
+                    dirs.add(rel)
+                    if not is_symlink:
+                        subdirs.append(rel + '/')
+                elif rel in stats:
+                    files[rel] = stats[rel]
+            stack.extend(reversed(subdirs))
+        return SkillTree.from_snapshot(skill_path, files, dirs, content)
+
+
+def load_tree(skill_path: Path, reads: tuple = VALIDATION_READS, workers: int = DEFAULT_IO_WORKERS) -> SkillTree:
+    """Load one skill with concurrent I/O"""
+    loader = AsyncTreeLoader(workers)
+    try:
+        return asyncio.run(loader.load(Path(skill_path), reads))
+    finally:
+        loader.close()
+
+
+def prefetch_trees(skill_paths, reads: tuple = VALIDATION_READS, workers: int = DEFAULT_IO_WORKERS,
+                   ahead: int = DEFAULT_AHEAD):
+    """Yield (skill path, SkillTree) in order while the next skills load in the background
+
+    The event loop runs in its own thread so loading continues while the
+    caller works on the current skill.
+    """
+    loader = AsyncTreeLoader(workers)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name='skill-io-loop', daemon=True)
+    thread.start()
+
+    paths = iter(skill_paths)
+    pending = deque()
+
+    def submit():
+        path = next(paths, None)
+        if path is not None:
+            pending.append((path, asyncio.run_coroutine_threadsafe(loader.load(Path(path), reads), loop)))
+
+    try:
+        for _ in range(max(ahead, 1)):
+            submit()
+        while pending:
+            path, future = pending.popleft()
+            tree = future.result()
+            submit()
+            yield path, tree
+    finally:
+        # Loads already started (at most `ahead`) finish before the loop stops
+        for _, future in pending:
+            future.exception()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        loader.close()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Brand Registry
+
+SQLite index of every skill in a skills directory: frontmatter, declared
+colors and fonts, asset inventory, validation status and the hash of the last
+package built from it. Questions like "which clients use Montserrat" are then
+answered by one indexed query instead of parsing every SKILL.md.
+
+The registry lives next to the skills (brand-skills/.brand-registry.sqlite3)
+and is refreshed incrementally: each skill directory is stat-walked, and only
+skills whose file sizes or mtimes changed are re-parsed and re-validated.
+The packager records each package it builds, so --stale can list skills
+edited since they were last packaged.
+
+Usage:
+    python scripts/brand_registry.py --refresh
+    python scripts/brand_registry.py --font Montserrat
+    python scripts/brand_registry.py --color "#0066CC" --tolerance 5
+    python scripts/brand_registry.py --invalid --json
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from color_space import delta_e, hex_to_lab
+from design_tokens import FRONTMATTER_FIELD_RE, parse_brand_content
+from skill_model import SkillTree
+
+QUERY_COLOR_RE = re.compile(r'#?([0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})')
+
+REGISTRY_NAME = '.brand-registry.sqlite3'
+
+# Bump when the schema changes; an older registry is rebuilt from scratch
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE skills (
+    name TEXT PRIMARY KEY,
+    client_name TEXT,
+    description TEXT,
+    license TEXT,
+    signature TEXT NOT NULL,
+    file_count INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL,
+    valid INTEGER NOT NULL,
+    errors TEXT NOT NULL,
+    warnings TEXT NOT NULL,
+    indexed_at REAL NOT NULL,
+    package_sha256 TEXT,
+    package_signature TEXT,
+    packaged_at REAL
+);
+CREATE TABLE colors (
+    skill TEXT NOT NULL REFERENCES skills(name) ON DELETE CASCADE,
+    role TEXT NOT NULL,
+    hex TEXT NOT NULL
+);
+CREATE TABLE fonts (
+    skill TEXT NOT NULL REFERENCES skills(name) ON DELETE CASCADE,
+    role TEXT NOT NULL,
+    family TEXT NOT NULL
+);
+CREATE TABLE assets (
+    skill TEXT NOT NULL REFERENCES skills(name) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX colors_hex ON colors(hex);
+CREATE INDEX colors_skill ON colors(skill);
+CREATE INDEX fonts_family ON fonts(family COLLATE NOCASE);
+CREATE INDEX fonts_skill ON fonts(skill);
+CREATE INDEX assets_path ON assets(path);
+CREATE INDEX assets_skill ON assets(skill);
+"""
+
+
+def registry_path(base_path: Path) -> Path:
+    return Path(base_path) / REGISTRY_NAME
+
+
+def connect(path: Path):
+    """Open (creating or rebuilding if the schema is outdated) a registry database"""
+    import sqlite3
+
+    db = sqlite3.connect(str(path))
+    db.row_factory = sqlite3.Row
+    db.execute('PRAGMA foreign_keys = ON')
+    if db.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+        for table in ('assets', 'fonts', 'colors', 'skills'):
+            db.execute(f'DROP TABLE IF EXISTS {table}')
+        db.executescript(SCHEMA)
+        db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        db.commit()
+    return db
+
+
+def tree_signature(tree: SkillTree) -> str:
+    """Hash of every file's path, size and mtime; changes whenever a file is added, removed or edited"""
+    digest = hashlib.sha256()
+    for rel, file_stat in sorted(tree.files.items()):
+        digest.update(f'{rel}\0{file_stat.st_size}\0{file_stat.st_mtime_ns}\n'.encode())
+    return digest.hexdigest()
+
+
+def index_skill(db, skill_path: Path, tree: SkillTree, signature: str):
+    """Parse and validate one skill and replace its rows"""
+    # Validation pulls in the image checks; only skills that changed pay for it
+    from validate_brand_assets import Severity, validate_brand_skill
+
+    name = skill_path.name
+    try:
+        content = tree.read_text('SKILL.md')
+    except (OSError, UnicodeDecodeError, KeyError):
+        content = ''
+    brand = parse_brand_content(content, default_name=name)
+    frontmatter = dict(FRONTMATTER_FIELD_RE.findall(content.split('---', 2)[1])) if content.startswith('---') else {}
+
+    # Only errors and warnings are stored, so lower severities are never created
+    result = validate_brand_skill(skill_path, verbose=False, tree=tree, min_severity=Severity.WARNING)
+    files = tree.files
+
+    # Keep the packaging record across re-indexing
+    previous = db.execute('SELECT package_sha256, package_signature, packaged_at FROM skills WHERE name = ?',
+                          (name,)).fetchone()
+    db.execute('DELETE FROM skills WHERE name = ?', (name,))
+    db.execute(
+        'INSERT INTO skills VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        (name, brand['client_name'], frontmatter.get('description'), brand['license'], signature,
+         len(files), sum(s.st_size for s in files.values()),
+         int(result.is_valid()), json.dumps(result.errors), json.dumps(result.warnings), time.time(),
+         *(tuple(previous) if previous else (None, None, None)))
+    )
+    db.executemany('INSERT INTO colors VALUES (?, ?, ?)',
+                   [(name, role, hex_color) for role, hex_color in brand['colors'].items()])
+    db.executemany('INSERT INTO fonts VALUES (?, ?, ?)',
+                   [(name, role, family) for role, family in brand['fonts'].items()])
+    db.executemany('INSERT INTO assets VALUES (?, ?, ?)',
+                   [(name, rel, s.st_size) for rel, s in files.items() if rel.startswith('assets/')])
+
+
+def refresh_registry(base_path: Path, db=None) -> dict:
+    """Bring the registry up to date with base_path; returns counts of added/updated/removed/unchanged skills"""
+    base_path = Path(base_path)
+    db = db if db is not None else connect(registry_path(base_path))
+    known = dict(db.execute('SELECT name, signature FROM skills').fetchall())
+    counts = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+    seen = set()
+    with os.scandir(base_path) as entries:
+        for entry in entries:
+            if not entry.is_dir() or entry.name.startswith('.'):
+                continue
+            skill_path = Path(entry.path)
+            tree = SkillTree(skill_path)
+            if not tree.is_file('SKILL.md'):
+                continue
+            seen.add(entry.name)
+            signature = tree_signature(tree)
+            if known.get(entry.name) == signature:
+                counts['unchanged'] += 1
+                continue
+            counts['updated' if entry.name in known else 'added'] += 1
+            index_skill(db, skill_path, tree, signature)
+
+    removed = sorted(set(known) - seen)
+    db.executemany('DELETE FROM skills WHERE name = ?', [(name,) for name in removed])
+    counts['removed'] = len(removed)
+    db.commit()
+    return counts
+
+
+def record_packaged(skill_path: Path, package_file: Path, tree: SkillTree):
+    """Store the hash of a freshly built package, if the skills directory has a registry"""
+    path = registry_path(Path(skill_path).parent)
+    if not path.exists():
+        return
+    digest = hashlib.sha256()
+    with open(package_file, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    signature = tree_signature(tree)
+    db = connect(path)
+    try:
+        # Re-index a skill edited since the last refresh, so --stale and the validation status match the package
+        row = db.execute('SELECT signature FROM skills WHERE name = ?', (Path(skill_path).name,)).fetchone()
+        if row is None or row[0] != signature:
+            index_skill(db, Path(skill_path), tree, signature)
+        db.execute('UPDATE skills SET package_sha256 = ?, package_signature = ?, packaged_at = ? WHERE name = ?',
+                   (digest.hexdigest(), signature, time.time(), Path(skill_path).name))
+        db.commit()
+    finally:
+        db.close()
+
+
+def query_skills(db, font: str = None, color: str = None, tolerance: float = 0.0, license: str = None,
+                 asset: str = None, valid: bool = None, stale: bool = False) -> list[dict]:
+    """Skills matching every given filter, sorted by name"""
+    where = []
+    params = []
+    if font:
+        where.append('name IN (SELECT skill FROM fonts WHERE family LIKE ?)')
+        params.append(f'%{font}%')
+    if color and tolerance <= 0:
+        where.append('name IN (SELECT skill FROM colors WHERE hex = ?)')
+        params.append(color.upper())
+    elif color:
+        target = hex_to_lab(color)
+        db.create_function('delta_e', 1, lambda hex_color: delta_e(target, hex_to_lab(hex_color)), deterministic=True)
+        where.append('name IN (SELECT skill FROM colors WHERE delta_e(hex) <= ?)')
+        params.append(tolerance)
+    if license:
+        where.append('license LIKE ?')
+        params.append(f'%{license}%')
+    if asset:
+        where.append("name IN (SELECT skill FROM assets WHERE path = ? OR path LIKE ?)")
+        params.extend([asset, f'%/{asset}'])
+    if valid is not None:
+        where.append('valid = ?')
+        params.append(int(valid))
+    if stale:
+        where.append('package_signature IS NOT signature')
+
+    matched = 'FROM skills' + (' WHERE ' + ' AND '.join(where) if where else '')
+    skills = {}
+    for row in db.execute(f'SELECT * {matched} ORDER BY name', params):
+        skill = dict(row)
+        skill['valid'] = bool(skill['valid'])
+        skill['errors'] = json.loads(skill['errors'])
+        skill['warnings'] = json.loads(skill['warnings'])
+        skill['colors'] = {}
+        skill['fonts'] = {}
+        skills[skill['name']] = skill
+
+    # One query per table for all matches, rather than one per skill
+    for table, column in (('colors', 'hex'), ('fonts', 'family')):
+        for name, role, value in db.execute(
+                f'SELECT skill, role, {column} FROM {table} WHERE skill IN (SELECT name {matched}) ORDER BY rowid', params):
+            skills[name][table][role] = value
+    skills = list(skills.values())
+    return skills
+
+
+def normalize_query_color(value: str):
+    """'#RRGGBB' for a 3- or 6-digit hex code with or without '#', None if it is not one"""
+    match = QUERY_COLOR_RE.fullmatch(value.strip())
+    if not match:
+        return None
+    digits = match.group(1)
+    if len(digits) == 3:
+        digits = ''.join(c * 2 for c in digits)
+    return '#' + digits.upper()
+
+
+def add_query_arguments(parser):
+    """Register registry query arguments (shared with brandctl query)"""
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-scan the skills directory first; otherwise queries read the last snapshot '
+                             '(always re-scanned when no registry exists yet)')
+    parser.add_argument('--font', help='Skills using this font family (case-insensitive substring)')
+    parser.add_argument('--color', metavar='HEX', help='Skills declaring this color (#RRGGBB, RRGGBB or #RGB)')
+    parser.add_argument('--tolerance', type=float, default=0.0,
+                        help='Match --color within this delta E instead of exactly (default: 0)')
+    parser.add_argument('--license', help='Skills whose license contains this text')
+    parser.add_argument('--asset', help='Skills with this asset (e.g., logo.svg or assets/logo-white.png)')
+    status = parser.add_mutually_exclusive_group()
+    status.add_argument('--valid', dest='valid', action='store_const', const=True, help='Only skills that pass validation')
+    status.add_argument('--invalid', dest='valid', action='store_const', const=False, help='Only skills that fail validation')
+    parser.add_argument('--stale', action='store_true', help='Only skills changed since they were last packaged')
+    parser.add_argument('--json', action='store_true', help='Print matching skills as JSON')
+
+
+def run_query(args) -> int:
+    base_path = Path(args.path)
+    if not base_path.is_dir():
+        print(f"Error: Skills directory not found: {base_path}")
+        return 1
+
+    color = None
+    if args.color:
+        color = normalize_query_color(args.color)
+        if color is None:
+            print(f"Error: Invalid hex color: {args.color} (expected #RRGGBB or #RGB)")
+            return 1
+
+    path = registry_path(base_path)
+    exists = path.exists()
+    refreshed = args.refresh or not exists
+    db = connect(path)
+    try:
+        if refreshed:
+            start = time.perf_counter()
+            counts = refresh_registry(base_path, db)
+            elapsed = time.perf_counter() - start
+            if not args.json:
+                print(f"✓ Registry refreshed in {elapsed * 1000:.0f} ms: "
+                      + ', '.join(f"{count} {state}" for state, count in counts.items()))
+
+        start = time.perf_counter()
+        skills = query_skills(db, args.font, color, args.tolerance, args.license, args.asset,
+                              args.valid, args.stale)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+
+    if args.json:
+        print(json.dumps(skills, indent=2))
+        return 0
+
+    print(f"{len(skills)} skill(s) matched ({elapsed * 1000:.1f} ms)")
+    if not refreshed:
+        updated = time.strftime('%Y-%m-%d %H:%M', time.localtime(path.stat().st_mtime))
+        print(f"   (registry snapshot from {updated}; pass --refresh to pick up edited skills)")
+    for skill in skills:
+        mark = '✓' if skill['valid'] else '✗'
+        fonts = ', '.join(dict.fromkeys(skill['fonts'].values()))
+        colors = ' '.join(skill['colors'].values())
+        print(f"   {mark} {skill['name']:<24} {fonts:<40} {colors}")
+    return 0
+
+
+def main():
+    parser = create_parser(
+        description='Query an indexed registry of brand skills by font, color, license or status. '
+                    'Queries read the last registry snapshot; pass --refresh after editing skills.',
+        epilog='Example: python brand_registry.py --font Montserrat'
+    )
+
+    add_query_arguments(parser)
+
+    args = parse_args(parser)
+
+    return run_query(args)
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+brandctl - Brand Skill Control
+
+Single entry point for the brand skill tools. Subcommands run in one process
+and share one in-process skill model, so `pipeline` walks and reads each skill
+once for both validation and packaging.
+
+Usage:
+    python scripts/brandctl.py init "Acme Corp" --primary-color "#0066CC"
+    python scripts/brandctl.py validate acme-corp --strict
+    python scripts/brandctl.py package acme-corp
+    python scripts/brandctl.py pipeline --all
+    python scripts/brandctl.py scan pro-sites ~/src/client-web
+    python scripts/brandctl.py query --font Montserrat
+    python scripts/brandctl.py search "web agency blue"
+    python scripts/brandctl.py install dist --prune
+    python scripts/brandctl.py budget --all --top 20
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import sys
+from pathlib import Path
+
+from brand_registry import add_query_arguments, run_query
+from context_budget import add_budget_arguments, run_budget
+from init_brand_skill import add_init_arguments, run_init
+from install_skills import add_install_arguments, run_install
+from package_skill import (
+    add_package_arguments,
+    package_skill,
+    print_packaging_summary,
+    resolve_skills,
+    run_package,
+    update_search_index,
+)
+from scan_colors import add_scan_arguments, run_scan
+from skill_search import add_search_arguments, run_search
+from skill_model import iter_trees
+from validate_brand_assets import (
+    add_level_argument,
+    add_validate_arguments,
+    level_severity,
+    run_validate,
+    validate_brand_skill,
+)
+
+
+def run_pipeline(args, parser) -> int:
+    """Validate then package each skill, sharing one SkillTree per skill"""
+    skills = resolve_skills(args, parser)
+    if skills is None:
+        return 1
+
+    output_dir = Path(args.output)
+
+    print("=" * 70)
+    print("BRAND SKILL PIPELINE")
+    print("=" * 70)
+    print()
+
+    successful = []
+    failed = []
+
+    # --all reports warnings and above unless --level says otherwise
+    min_severity = level_severity(args, catalog=args.all)
+
+    # With --io-workers the next skills load in the background while this one is processed
+    for skill_path, tree in iter_trees(skills, args.io_workers):
+        result = validate_brand_skill(skill_path, args.strict, tree=tree, min_severity=min_severity)
+        result.print_results()
+
+        if not result.is_valid(strict=args.strict):
+            print(f"❌ Skipping packaging for {skill_path.name}: validation failed")
+            failed.append(skill_path.name)
+        else:
+            # Files already read during validation are reused, not re-read
+            success, output_file = package_skill(skill_path, output_dir, args.exclude, tree=tree, lean=args.lean)
+            if success:
+                successful.append(output_file)
+            else:
+                failed.append(skill_path.name)
+
+        print()
+        print("-" * 70)
+        print()
+
+    print_packaging_summary(successful, failed)
+    update_search_index(Path(args.path))
+
+    return 0 if not failed else 1
+
+
+def main():
+    parser = create_parser(
+        description='Initialize, validate, package and audit brand skills from one process',
+        epilog='Example: python brandctl.py pipeline --all'
+    )
+
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    init_parser = subparsers.add_parser('init', help='Create a new brand skill',
+                                        formatter_class=parser.formatter_class)
+    add_init_arguments(init_parser)
+
+    validate_parser = subparsers.add_parser('validate', help='Validate a brand skill',
+                                            formatter_class=parser.formatter_class)
+    add_validate_arguments(validate_parser)
+
+    package_parser = subparsers.add_parser('package', help='Package skills into .skill files',
+                                           formatter_class=parser.formatter_class)
+    add_package_arguments(package_parser)
+
+    pipeline_parser = subparsers.add_parser('pipeline', help='Validate and package skills in one pass',
+                                            formatter_class=parser.formatter_class)
+    add_package_arguments(pipeline_parser)
+    pipeline_parser.add_argument('--strict', action='store_true',
+                                 help='Treat validation warnings as errors (skip packaging)')
+    add_level_argument(pipeline_parser)
+
+    scan_parser = subparsers.add_parser('scan', help='Scan a source tree for off-palette colors',
+                                        formatter_class=parser.formatter_class)
+    add_scan_arguments(scan_parser)
+
+    query_parser = subparsers.add_parser('query', help='Find skills by font, color, license or status',
+                                         formatter_class=parser.formatter_class)
+    add_query_arguments(query_parser)
+
+    search_parser = subparsers.add_parser('search', help='Find the skills that best match a request',
+                                          formatter_class=parser.formatter_class)
+    add_search_arguments(search_parser)
+
+    install_parser = subparsers.add_parser('install', aliases=['sync'],
+                                           help='Install or sync .skill files into ~/.claude/skills',
+                                           formatter_class=parser.formatter_class)
+    add_install_arguments(install_parser)
+
+    budget_parser = subparsers.add_parser('budget', help='Estimate the context cost of skills',
+                                          formatter_class=parser.formatter_class)
+    add_budget_arguments(budget_parser)
+
+    args = parse_args(parser)
+
+    if args.command == 'init':
+        return run_init(args)
+    if args.command == 'validate':
+        return run_validate(args)
+    if args.command == 'package':
+        return run_package(args, package_parser)
+    if args.command == 'pipeline':
+        return run_pipeline(args, pipeline_parser)
+    if args.command == 'scan':
+        return run_scan(args)
+    if args.command == 'query':
+        return run_query(args)
+    if args.command == 'search':
+        return run_search(args)
+    if args.command in ('install', 'sync'):
+        return run_install(args)
+    if args.command == 'budget':
+        return run_budget(args, budget_parser)
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
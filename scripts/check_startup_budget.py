@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Startup Budget Check
+
+Measures the cold-start cost of every CLI script in scripts/ and fails when a
+script goes over its budget. Intended to run in CI next to the other checks.
+
+Cost is measured as wall-clock time of `python script.py --help` minus the time
+of a bare `python -c pass`, so the budget tracks what the script itself adds
+(imports and argparse setup) rather than the speed of the CI machine.
+
+Usage:
+    python scripts/check_startup_budget.py
+    python scripts/check_startup_budget.py --budget-ms 50 --runs 15
+    python scripts/check_startup_budget.py package_skill validate_brand_assets
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Default overhead budget over a bare interpreter, in milliseconds
+DEFAULT_BUDGET_MS = 60.0
+
+# Scripts with a deliberately larger import footprint
+BUDGET_OVERRIDES_MS = {
+    'serve_brand_skills': 150.0,
+}
+
+# Modules that must never be imported at startup by any CLI script
+FORBIDDEN_STARTUP_MODULES = ('PIL', 'numpy')
+
+
+def discover_scripts() -> list[str]:
+    """Scripts that go through the shared CLI runtime"""
+    names = []
+    for path in sorted(SCRIPTS_DIR.glob('*.py')):
+        if path.stem in ('cli_runtime', Path(__file__).stem):
+            continue
+        if 'run_cli(main)' in path.read_text():
+            names.append(path.stem)
+    return names
+
+
+def measurement_env() -> dict:
+    """Environment with bytecode caching enabled, as on a warmed-up CI runner"""
+    env = os.environ.copy()
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def time_command(command: list[str], runs: int) -> float:
+    """Median wall-clock time of a command in milliseconds, after one warm-up run"""
+    env = measurement_env()
+    samples = []
+    for i in range(runs + 1):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False, env=env)
+        if i:
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def startup_modules(script: str) -> set[str]:
+    """Top-level module names imported while a script starts up"""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', str(SCRIPTS_DIR / f'{script}.py'), '--help'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False, env=measurement_env()
+    )
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            modules.add(line.rsplit('|', 1)[1].strip().split('.')[0])
+    return modules
+
+
+def main():
+    parser = create_parser(
+        description='Fail when a CLI script exceeds its cold-start budget',
+        epilog='Example: python check_startup_budget.py --budget-ms 60'
+    )
+
+    parser.add_argument('scripts', nargs='*', help='Script names to check (default: all CLI scripts)')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'Startup overhead budget in ms (default: {DEFAULT_BUDGET_MS:g})')
+    parser.add_argument('--runs', type=int, default=9, help='Runs per script; the median is used (default: 9)')
+
+    args = parse_args(parser)
+
+    scripts = args.scripts or discover_scripts()
+
+    baseline = time_command([sys.executable, '-c', 'pass'], args.runs)
+    print(f"Interpreter baseline: {baseline:.1f} ms")
+    print()
+
+    failed = []
+    for script in scripts:
+        budget = BUDGET_OVERRIDES_MS.get(script, args.budget_ms)
+        elapsed = time_command([sys.executable, str(SCRIPTS_DIR / f'{script}.py'), '--help'], args.runs)
+        overhead = elapsed - baseline
+
+        forbidden = sorted(startup_modules(script) & set(FORBIDDEN_STARTUP_MODULES))
+        ok = overhead <= budget and not forbidden
+        status = '✓' if ok else '✗'
+        print(f"  {status} {script:<28} {overhead:7.1f} ms  (budget {budget:g} ms)")
+        if forbidden:
+            print(f"      imports heavy module(s) at startup: {', '.join(forbidden)}")
+        if not ok:
+            failed.append(script)
+
+    print()
+    if failed:
+        print(f"✗ {len(failed)} script(s) over startup budget: {', '.join(failed)}")
+        return 1
+
+    print(f"✓ All {len(scripts)} script(s) within startup budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
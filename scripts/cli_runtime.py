@@ -0,0 +1,270 @@
+"""
+Shared CLI Runtime
+
+Lightweight entry point shared by every script in scripts/. Scripts import this
+module first so that --timing can split a run into import, parse and execute
+time. run_cli() also gives every script two diagnostic flags:
+
+    --profile[=FILE]       cProfile the run; print the top functions (count set
+                           with --profile-top=N) or dump pstats data to FILE
+    --trace-malloc[=N]     Report peak traced memory and the top N allocation sites
+
+Code inside a script can time named phases with `with phase('package.read'):`;
+the totals are printed with --timing or --profile.
+
+Keep this module light: everything imported here is paid by every CLI
+invocation, which CI runs thousands of times. Heavy optional modules (Pillow,
+NumPy, ...) go through optional_import() instead.
+"""
+
+import time
+
+IMPORT_START = time.perf_counter()
+
+import argparse
+import importlib
+import os
+import sys
+
+TIMING_FLAG = '--timing'
+PROFILE_FLAG = '--profile'
+PROFILE_TOP_FLAG = '--profile-top'
+TRACE_MALLOC_FLAG = '--trace-malloc'
+
+DEFAULT_PROFILE_TOP = 25
+DEFAULT_MALLOC_TOP = 10
+
+_optional_modules = {}
+
+
+class PhaseTimer:
+    """Accumulates wall-clock time per named phase"""
+
+    def __init__(self):
+        self.phases = {}
+        self.counts = {}
+        self.last = IMPORT_START
+
+    def mark(self, phase: str):
+        """Attribute time since the previous mark to phase"""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self.last)
+        self.last = now
+
+    def add(self, phase: str, seconds: float):
+        """Attribute a measured duration to phase"""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def report(self, stream=None):
+        stream = stream or sys.stderr
+        total = sum(self.phases.values())
+        print("Timing:", file=stream)
+        for phase, seconds in self.phases.items():
+            print(f"  {phase:<10} {seconds * 1000:8.2f} ms", file=stream)
+        print(f"  {'total':<10} {total * 1000:8.2f} ms", file=stream)
+
+    def report_phases(self, stream=None):
+        """Per-phase totals recorded with add(), slowest first"""
+        stream = stream or sys.stderr
+        width = max(len(phase) for phase in self.phases)
+        print("Phases:", file=stream)
+        for phase, seconds in sorted(self.phases.items(), key=lambda item: -item[1]):
+            print(f"  {phase:<{width}} {seconds * 1000:10.2f} ms  ({self.counts[phase]}x)", file=stream)
+
+
+# Startup phases (import/setup/parse/execute) and phases timed inside scripts
+TIMER = PhaseTimer()
+PHASES = PhaseTimer()
+
+
+class phase:
+    """Context manager that adds the time spent in a block to a named phase
+
+        with phase('package.compress'):
+            ...
+    """
+
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        PHASES.add(self.name, time.perf_counter() - self.start)
+
+
+def optional_import(name: str):
+    """Import an optional (often heavy) module on first use; None if unavailable
+
+    The result is cached, so callers can ask per file without paying the import
+    machinery or the failure cost more than once per process.
+    """
+    if name not in _optional_modules:
+        try:
+            _optional_modules[name] = importlib.import_module(name)
+        except ImportError:
+            _optional_modules[name] = None
+    return _optional_modules[name]
+
+
+class FastHelpFormatter(argparse.HelpFormatter):
+    """HelpFormatter that sizes itself without importing shutil
+
+    argparse builds a throwaway formatter for every add_argument() call, and the
+    stock formatter imports shutil (and with it bz2/lzma) to find the terminal
+    width. Only --help output needs the real width.
+    """
+
+    def __init__(self, prog, indent_increment=2, max_help_position=24, width=None):
+        if width is None:
+            width = terminal_width() - 2
+        super().__init__(prog, indent_increment, max_help_position, width)
+
+
+def terminal_width() -> int:
+    """Terminal width from $COLUMNS or the stdout tty, defaulting to 80"""
+    try:
+        return int(os.environ['COLUMNS'])
+    except (KeyError, ValueError):
+        pass
+    try:
+        return os.get_terminal_size(sys.__stdout__.fileno()).columns
+    except (AttributeError, ValueError, OSError):
+        return 80
+
+
+def create_parser(**kwargs) -> argparse.ArgumentParser:
+    """ArgumentParser preconfigured for fast startup"""
+    kwargs.setdefault('formatter_class', FastHelpFormatter)
+    return argparse.ArgumentParser(**kwargs)
+
+
+def parse_args(parser, argv=None):
+    """Parse arguments and record the time spent as the 'parse' phase"""
+    TIMER.mark('setup')
+    args = parser.parse_args(argv)
+    TIMER.mark('parse')
+    return args
+
+
+def usage_error(message: str):
+    """Exit like argparse does on a bad argument"""
+    print(f"{os.path.basename(sys.argv[0])}: error: {message}", file=sys.stderr)
+    raise SystemExit(2)
+
+
+def pop_flag(name: str, requires_value: bool = False):
+    """Remove --name or --name=VALUE from sys.argv; returns None, True or VALUE
+
+    With requires_value, --name VALUE is accepted too and a bare --name is a
+    usage error.
+    """
+    for i, arg in enumerate(sys.argv[1:], 1):
+        if arg == name:
+            del sys.argv[i]
+            if not requires_value:
+                return True
+            if i >= len(sys.argv):
+                usage_error(f"argument {name}: expected one argument")
+            return sys.argv.pop(i)
+        if arg.startswith(name + '='):
+            del sys.argv[i]
+            return arg[len(name) + 1:]
+    return None
+
+
+def count_value(name: str, value, default: int) -> int:
+    """Positive integer from a flag value (True or None means the default)"""
+    if value is None or value is True:
+        return default
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count < 1:
+        usage_error(f"argument {name}: expected a positive integer, got {value!r}")
+    return count
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for counts where 0 means off"""
+    try:
+        count = int(value)
+    except ValueError:
+        count = -1
+    if count < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got {value!r}")
+    return count
+
+
+def report_profile(profiler, target, top: int, stream=None):
+    """Dump pstats data to target (a path) or print the top functions"""
+    import pstats
+
+    stream = stream or sys.stderr
+    if isinstance(target, str):
+        profiler.dump_stats(target)
+        print(f"Profile written to {target} (view with: python -m pstats {target})", file=stream)
+        return
+    print(f"Profile (top {top} by cumulative time):", file=stream)
+    pstats.Stats(profiler, stream=stream).strip_dirs().sort_stats('cumulative').print_stats(top)
+
+
+def report_malloc(top: int, stream=None):
+    """Peak traced memory and the largest allocation sites still live at exit"""
+    import tracemalloc
+
+    stream = stream or sys.stderr
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ))
+    tracemalloc.stop()
+
+    print(f"Memory: peak {peak / 1024 / 1024:.1f} MB, {current / 1024 / 1024:.1f} MB still allocated at exit", file=stream)
+    print(f"Top {top} allocation sites:", file=stream)
+    for stat in snapshot.statistics('lineno')[:top]:
+        frame = stat.traceback[0]
+        print(f"  {stat.size / 1024:10.1f} KB  {stat.count:8} blocks  {frame.filename}:{frame.lineno}", file=stream)
+
+
+def run_cli(main) -> int:
+    """Run a script's main(), honoring the shared --timing, --profile and --trace-malloc flags"""
+    timing = pop_flag(TIMING_FLAG)
+    profile = pop_flag(PROFILE_FLAG)
+    # Values are checked before main() runs, so a typo cannot mask its exit code
+    profile_top = count_value(PROFILE_TOP_FLAG, pop_flag(PROFILE_TOP_FLAG, requires_value=True), DEFAULT_PROFILE_TOP)
+    trace_malloc = pop_flag(TRACE_MALLOC_FLAG)
+    malloc_top = count_value(TRACE_MALLOC_FLAG, trace_malloc, DEFAULT_MALLOC_TOP)
+
+    if trace_malloc:
+        import tracemalloc
+        tracemalloc.start()
+
+    profiler = None
+    if profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    TIMER.mark('import')
+    try:
+        return main()
+    finally:
+        TIMER.mark('execute')
+        if profiler is not None:
+            profiler.disable()
+            report_profile(profiler, profile, profile_top)
+        if trace_malloc:
+            report_malloc(malloc_top)
+        if timing:
+            TIMER.report()
+        if (timing or profile) and PHASES.phases:
+            PHASES.report_phases()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Color Space Conversions and Color Differences
+
+sRGB -> linear -> XYZ -> CIELAB (D65 white point) and OKLab conversions, and
+the CIE76, CIE94 and CIEDE2000 color differences. Scalar functions are pure
+Python; the *_array variants take NumPy arrays (any shape ending in 3) and
+work on whole images or palettes at once, in float32 by default or float64
+when passed dtype=numpy.float64. delta_e_matrix() compares N colors against M
+colors in cache-sized chunks.
+
+Run as a script to benchmark the array API:
+    python scripts/color_space.py
+    python scripts/color_space.py --pairs 4000000 --dtype float64
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, optional_import, parse_args, run_cli
+
+import math
+import sys
+import time
+
+# D65 reference white, XYZ scaled so Y = 1
+WHITE_D65 = (0.95047, 1.0, 1.08883)
+
+# Linear sRGB -> XYZ (D65)
+SRGB_TO_XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+
+# Linear sRGB -> LMS and cube-rooted LMS -> OKLab (Ottosson, 2020)
+SRGB_TO_LMS = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+LMS_TO_OKLAB = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+
+LAB_EPSILON = 216 / 24389
+LAB_KAPPA = 24389 / 27
+
+# CIE94 weights for graphic arts
+CIE94_K1 = 0.045
+CIE94_K2 = 0.015
+
+METRICS = ('cie76', 'cie94', 'ciede2000')
+
+# Pairs per delta_e_matrix() chunk: keeps CIEDE2000's temporaries in cache
+MATRIX_CHUNK_PAIRS = 1 << 16
+
+
+def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+    """Convert #RGB or #RRGGBB to an (r, g, b) tuple"""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) == 3:
+        hex_color = ''.join(c * 2 for c in hex_color)
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def rgb_to_hex(rgb) -> str:
+    return '#{:02X}{:02X}{:02X}'.format(*(int(round(c)) for c in rgb))
+
+
+def srgb_to_linear(channel: float) -> float:
+    """Undo sRGB gamma for one channel in 0..255"""
+    c = channel / 255
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _lab_f(t: float) -> float:
+    return t ** (1 / 3) if t > LAB_EPSILON else (LAB_KAPPA * t + 16) / 116
+
+
+def rgb_to_lab(rgb) -> tuple[float, float, float]:
+    """Convert an (r, g, b) tuple in 0..255 to CIELAB"""
+    linear = [srgb_to_linear(c) for c in rgb]
+    fx, fy, fz = (
+        _lab_f(sum(m * c for m, c in zip(row, linear)) / white)
+        for row, white in zip(SRGB_TO_XYZ, WHITE_D65)
+    )
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def hex_to_lab(hex_color: str) -> tuple[float, float, float]:
+    return rgb_to_lab(hex_to_rgb(hex_color))
+
+
+def rgb_to_oklab(rgb) -> tuple[float, float, float]:
+    """Convert an (r, g, b) tuple in 0..255 to OKLab"""
+    linear = [srgb_to_linear(c) for c in rgb]
+    lms = [math.copysign(abs(v) ** (1 / 3), v) for v in (sum(m * c for m, c in zip(row, linear)) for row in SRGB_TO_LMS)]
+    return tuple(sum(m * c for m, c in zip(row, lms)) for row in LMS_TO_OKLAB)
+
+
+def delta_e76(lab1, lab2) -> float:
+    """CIE76 color difference (Euclidean distance in Lab)"""
+    return math.dist(lab1, lab2)
+
+
+def delta_e94(lab1, lab2) -> float:
+    """CIE94 color difference (graphic arts weights); lab1 is the reference color"""
+    L1, a1, b1 = lab1
+    L2, a2, b2 = lab2
+    C1 = math.hypot(a1, b1)
+    dC = C1 - math.hypot(a2, b2)
+    dH2 = max(0.0, (a1 - a2) ** 2 + (b1 - b2) ** 2 - dC ** 2)
+    return math.sqrt((L1 - L2) ** 2 + (dC / (1 + CIE94_K1 * C1)) ** 2 + dH2 / (1 + CIE94_K2 * C1) ** 2)
+
+
+def delta_e2000(lab1, lab2) -> float:
+    """CIEDE2000 color difference (kL = kC = kH = 1)"""
+    L1, a1, b1 = lab1
+    L2, a2, b2 = lab2
+    C7 = ((math.hypot(a1, b1) + math.hypot(a2, b2)) / 2) ** 7
+    G = 0.5 * (1 - math.sqrt(C7 / (C7 + 25 ** 7)))
+    a1p, a2p = (1 + G) * a1, (1 + G) * a2
+    C1p, C2p = math.hypot(a1p, b1), math.hypot(a2p, b2)
+    h1p = math.degrees(math.atan2(b1, a1p)) % 360
+    h2p = math.degrees(math.atan2(b2, a2p)) % 360
+
+    if C1p * C2p == 0:
+        dhp, hbp = 0.0, h1p + h2p
+    else:
+        dhp = h2p - h1p
+        if dhp > 180:
+            dhp -= 360
+        elif dhp < -180:
+            dhp += 360
+        hbp = (h1p + h2p) / 2
+        if abs(h1p - h2p) > 180:
+            hbp += 180 if hbp < 180 else -180
+
+    dHp = 2 * math.sqrt(C1p * C2p) * math.sin(math.radians(dhp) / 2)
+    Lbp = (L1 + L2) / 2 - 50
+    Cbp = (C1p + C2p) / 2
+    T = (1 - 0.17 * math.cos(math.radians(hbp - 30)) + 0.24 * math.cos(math.radians(2 * hbp))
+         + 0.32 * math.cos(math.radians(3 * hbp + 6)) - 0.20 * math.cos(math.radians(4 * hbp - 63)))
+    Cbp7 = Cbp ** 7
+    RT = -2 * math.sqrt(Cbp7 / (Cbp7 + 25 ** 7)) * math.sin(math.radians(60 * math.exp(-((hbp - 275) / 25) ** 2)))
+    dL = (L2 - L1) / (1 + 0.015 * Lbp ** 2 / math.sqrt(20 + Lbp ** 2))
+    dC = (C2p - C1p) / (1 + 0.045 * Cbp)
+    dH = dHp / (1 + 0.015 * Cbp * T)
+    return math.sqrt(dL ** 2 + dC ** 2 + dH ** 2 + RT * dC * dH)
+
+
+SCALAR_METRICS = {'cie76': delta_e76, 'cie94': delta_e94, 'ciede2000': delta_e2000}
+
+
+def delta_e(lab1, lab2, metric: str = 'cie76') -> float:
+    """Color difference between two Lab colors by metric name"""
+    return SCALAR_METRICS[metric](lab1, lab2)
+
+
+def _numpy():
+    np = optional_import('numpy')
+    if np is None:
+        raise RuntimeError("NumPy is required for array color conversions. Install: pip install numpy")
+    return np
+
+
+def srgb_array_to_linear(rgb, dtype=None):
+    """(..., 3) sRGB values in 0..255 -> linear RGB in 0..1"""
+    np = _numpy()
+    c = np.asarray(rgb, dtype=dtype or np.float32) / 255
+    return np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+
+
+def linear_array_to_xyz(linear):
+    """(..., 3) linear RGB -> XYZ (D65, Y = 1 for white)"""
+    np = _numpy()
+    return linear @ np.array(SRGB_TO_XYZ, dtype=linear.dtype).T
+
+
+def xyz_array_to_lab(xyz):
+    """(..., 3) XYZ (D65) -> CIELAB"""
+    np = _numpy()
+    xyz = xyz / np.array(WHITE_D65, dtype=xyz.dtype)
+    f = np.where(xyz > LAB_EPSILON, np.cbrt(xyz), (LAB_KAPPA * xyz + 16) / 116)
+
+    lab = np.empty_like(f)
+    lab[..., 0] = 116 * f[..., 1] - 16
+    lab[..., 1] = 500 * (f[..., 0] - f[..., 1])
+    lab[..., 2] = 200 * (f[..., 1] - f[..., 2])
+    return lab
+
+
+def rgb_array_to_lab(rgb, dtype=None):
+    """Convert an (..., 3) array of sRGB values in 0..255 to CIELAB (float32 unless dtype is given)"""
+    return xyz_array_to_lab(linear_array_to_xyz(srgb_array_to_linear(rgb, dtype)))
+
+
+def rgb_array_to_oklab(rgb, dtype=None):
+    """Convert an (..., 3) array of sRGB values in 0..255 to OKLab (float32 unless dtype is given)"""
+    np = _numpy()
+    linear = srgb_array_to_linear(rgb, dtype)
+    lms = np.cbrt(linear @ np.array(SRGB_TO_LMS, dtype=linear.dtype).T)
+    return lms @ np.array(LMS_TO_OKLAB, dtype=linear.dtype).T
+
+
+def _delta_e76_array(np, lab1, lab2):
+    # Per-channel terms: several times faster than a reduction over a trailing axis of 3
+    return np.sqrt((lab1[..., 0] - lab2[..., 0]) ** 2 + (lab1[..., 1] - lab2[..., 1]) ** 2
+                   + (lab1[..., 2] - lab2[..., 2]) ** 2)
+
+
+def _delta_e94_array(np, lab1, lab2):
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+    C1 = np.hypot(a1, b1)
+    dC = C1 - np.hypot(a2, b2)
+    dH2 = np.maximum((a1 - a2) ** 2 + (b1 - b2) ** 2 - dC ** 2, 0)
+    return np.sqrt((L1 - L2) ** 2 + (dC / (1 + CIE94_K1 * C1)) ** 2 + dH2 / (1 + CIE94_K2 * C1) ** 2)
+
+
+def _delta_e2000_array(np, lab1, lab2):
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+    C7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    G = 0.5 * (1 - np.sqrt(C7 / (C7 + 25 ** 7)))
+    a1p, a2p = (1 + G) * a1, (1 + G) * a2
+    C1p, C2p = np.hypot(a1p, b1), np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+
+    achromatic = C1p * C2p == 0
+    dhp = h2p - h1p
+    dhp = np.where(dhp > 180, dhp - 360, np.where(dhp < -180, dhp + 360, dhp))
+    dhp = np.where(achromatic, 0, dhp)
+    hsum = h1p + h2p
+    hbp = np.where(np.abs(h1p - h2p) > 180, np.where(hsum < 360, hsum + 360, hsum - 360), hsum) / 2
+    hbp = np.where(achromatic, hsum, hbp)
+
+    dHp = 2 * np.sqrt(C1p * C2p) * np.sin(np.radians(dhp) / 2)
+    Lbp = (L1 + L2) / 2 - 50
+    Cbp = (C1p + C2p) / 2
+    hbr = np.radians(hbp)
+    T = (1 - 0.17 * np.cos(hbr - math.radians(30)) + 0.24 * np.cos(2 * hbr)
+         + 0.32 * np.cos(3 * hbr + math.radians(6)) - 0.20 * np.cos(4 * hbr - math.radians(63)))
+    Cbp7 = Cbp ** 7
+    RT = -2 * np.sqrt(Cbp7 / (Cbp7 + 25 ** 7)) * np.sin(np.radians(60 * np.exp(-((hbp - 275) / 25) ** 2)))
+    dL = (L2 - L1) / (1 + 0.015 * Lbp ** 2 / np.sqrt(20 + Lbp ** 2))
+    dC = (C2p - C1p) / (1 + 0.045 * Cbp)
+    dH = dHp / (1 + 0.015 * Cbp * T)
+    return np.sqrt(dL ** 2 + dC ** 2 + dH ** 2 + RT * dC * dH)
+
+
+ARRAY_METRICS = {'cie76': _delta_e76_array, 'cie94': _delta_e94_array, 'ciede2000': _delta_e2000_array}
+
+
+def delta_e_array(lab1, lab2, metric: str = 'cie76', dtype=None):
+    """Elementwise color difference of two broadcastable (..., 3) Lab arrays
+
+    For CIE94, lab1 holds the reference colors.
+    """
+    np = _numpy()
+    dtype = dtype or np.float32
+    return ARRAY_METRICS[metric](np, np.asarray(lab1, dtype=dtype), np.asarray(lab2, dtype=dtype))
+
+
+def delta_e_matrix(lab1, lab2, metric: str = 'cie76', dtype=None):
+    """(N, M) color differences between every row of an (N, 3) and an (M, 3) Lab array
+
+    Rows are processed in chunks of about MATRIX_CHUNK_PAIRS pairs, so
+    temporaries stay small however large N x M is.
+    """
+    np = _numpy()
+    dtype = dtype or np.float32
+    lab1 = np.asarray(lab1, dtype=dtype).reshape(-1, 3)
+    lab2 = np.asarray(lab2, dtype=dtype).reshape(-1, 3)
+    out = np.empty((lab1.shape[0], lab2.shape[0]), dtype=dtype)
+    rows = max(1, MATRIX_CHUNK_PAIRS // max(1, lab2.shape[0]))
+    function = ARRAY_METRICS[metric]
+    for start in range(0, lab1.shape[0], rows):
+        out[start:start + rows] = function(np, lab1[start:start + rows, None, :], lab2[None, :, :])
+    return out
+
+
+def benchmark(pairs: int, palette_size: int, dtype_name: str) -> list[tuple[str, float, float]]:
+    """[(metric, array seconds per million pairs, scalar seconds per million pairs)]"""
+    np = _numpy()
+    dtype = np.dtype(dtype_name)
+    rng = np.random.default_rng(0)
+    samples = rng.integers(0, 256, size=(max(1, pairs // palette_size), 3))
+    palette = rng.integers(0, 256, size=(palette_size, 3))
+
+    start = time.perf_counter()
+    sample_lab = rgb_array_to_lab(samples, dtype)
+    palette_lab = rgb_array_to_lab(palette, dtype)
+    conversion = time.perf_counter() - start
+
+    results = [('sRGB -> Lab', conversion / (len(samples) + palette_size) * 1e6, None)]
+    scalar_pairs = [(tuple(map(float, a)), tuple(map(float, b))) for a, b in zip(sample_lab[:20000], palette_lab[np.arange(20000) % palette_size])]
+    for metric in METRICS:
+        start = time.perf_counter()
+        delta_e_matrix(sample_lab, palette_lab, metric, dtype)
+        array_time = (time.perf_counter() - start) / (len(samples) * palette_size) * 1e6
+
+        scalar = SCALAR_METRICS[metric]
+        start = time.perf_counter()
+        for a, b in scalar_pairs:
+            scalar(a, b)
+        scalar_time = (time.perf_counter() - start) / len(scalar_pairs) * 1e6
+        results.append((metric, array_time, scalar_time))
+    return results
+
+
+def main():
+    parser = create_parser(
+        description='Benchmark the vectorized color conversions and color differences',
+        epilog='Example: python color_space.py --pairs 4000000 --dtype float64'
+    )
+
+    parser.add_argument('--pairs', type=int, default=1_000_000, help='Color pairs per metric (default: 1000000)')
+    parser.add_argument('--palette-size', type=int, default=64, help='Colors on the M side of the N x M matrix (default: 64)')
+    parser.add_argument('--dtype', choices=('float32', 'float64'), default='float32', help='Array precision (default: float32)')
+
+    args = parse_args(parser)
+
+    try:
+        results = benchmark(args.pairs, args.palette_size, args.dtype)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    print(f"Color difference benchmark: {args.pairs:,} pairs, palette of {args.palette_size}, {args.dtype}")
+    print()
+    print(f"  {'':<14}{'array (s / M)':>15}{'scalar (s / M)':>16}{'speedup':>10}")
+    for name, array_time, scalar_time in results:
+        if scalar_time is None:
+            print(f"  {name:<14}{array_time:>15.3f}{'':>16}{'':>10}   (per million colors)")
+        else:
+            print(f"  {name:<14}{array_time:>15.3f}{scalar_time:>16.2f}{scalar_time / array_time:>9.0f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Context Budget Analyzer
+
+Measures what a skill costs in a model's context window. The frontmatter
+description of every installed skill is always loaded, SKILL.md is loaded when
+the skill triggers, and references/*.md only when SKILL.md points to them, so
+progressive disclosure means a short description, a lean SKILL.md and detail
+kept in references.
+
+For each skill this estimates tokens for the description, SKILL.md and every
+reference file, and flags SKILL.md sections whose lines repeat a reference (e.g.
+the color blocks written to both SKILL.md and references/color-system.md). Token
+counts are estimates from word and symbol runs, typically within ~15% of a
+real BPE tokenizer on English markdown; no tokenizer is required.
+
+Validation warns about skills over budget; this script reports the biggest
+offenders across a catalog.
+
+Usage:
+    python scripts/context_budget.py pro-sites
+    python scripts/context_budget.py --all --top 20
+    python scripts/context_budget.py --all --skill-md-budget 4000 --json > budget.json
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from design_tokens import FRONTMATTER_FIELD_RE
+from skill_model import SkillTree
+
+# Token budgets per skill; SKILL.md lines follow the playbook's "keep < 500 lines"
+DEFAULT_BUDGETS = {
+    'description': 200,
+    'skill_md': 5000,
+    'skill_md_lines': 500,
+    'reference': 8000,
+}
+
+# A SKILL.md section is reported when at least this share of its tokens sits on
+# lines that also appear verbatim in one reference file
+DUPLICATE_OVERLAP = 0.3
+
+# Repeated content smaller than this is not worth moving out of SKILL.md
+MIN_DUPLICATE_TOKENS = 40
+
+# Lines shorter than this once normalized (fences, braces, bare bullets) never count as repeats
+MIN_LINE_CHARS = 8
+
+# Skills per task sent to a worker process
+BATCH_SIZE = 64
+
+# One match per estimated token: letter runs split every 6, digits every 3, symbols every 2
+TOKEN_RE = re.compile(r'[A-Za-z]{1,6}|[0-9]{1,3}|[^\sA-Za-z0-9]{1,2}')
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate BPE token count
+
+    Common words are one token and long words one per ~6 letters; digit runs
+    split every 3 digits and symbol runs (markdown, punctuation) every 2.
+    """
+    return len(TOKEN_RE.findall(text))
+
+
+def split_sections(content: str) -> list[tuple[str, int, str]]:
+    """(heading, first line number, text) for every heading-delimited section, fenced code included"""
+    sections = []
+    heading, start, lines = '(preamble)', 1, []
+    in_fence = False
+    for number, line in enumerate(content.splitlines(), 1):
+        if line.startswith('```'):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_RE.match(line)
+        if match:
+            if any(l.strip() for l in lines):
+                sections.append((heading, start, '\n'.join(lines)))
+            heading, start, lines = match.group(2), number, []
+        else:
+            lines.append(line)
+    if any(l.strip() for l in lines):
+        sections.append((heading, start, '\n'.join(lines)))
+    return sections
+
+
+def normalize_line(line: str) -> str:
+    """Line key for repeat detection: case and indentation are ignored"""
+    line = line.strip().lower()
+    return line if len(line) >= MIN_LINE_CHARS else ''
+
+
+def line_keys(text: str) -> set:
+    keys = {line.strip() for line in text.lower().splitlines()}
+    return {key for key in keys if len(key) >= MIN_LINE_CHARS}
+
+
+def strip_frontmatter(content: str) -> tuple[dict, str]:
+    if content.startswith('---'):
+        parts = content.split('---', 2)
+        if len(parts) >= 3:
+            return dict(FRONTMATTER_FIELD_RE.findall(parts[1])), parts[2]
+    return {}, content
+
+
+def analyze_skill(skill_path: Path, tree: SkillTree = None) -> dict:
+    """Token estimates and duplicated sections of one skill"""
+    tree = tree if tree is not None else SkillTree(skill_path)
+    report = {
+        'name': Path(skill_path).name,
+        'description_tokens': 0,
+        'skill_md_tokens': 0,
+        'skill_md_lines': 0,
+        'references': {},
+        'duplicates': [],
+        'unreadable': {},
+    }
+    if not tree.is_file('SKILL.md'):
+        return report
+
+    # An unreadable file is reported, not raised: validation must still finish
+    try:
+        content = tree.read_text('SKILL.md')
+    except (OSError, UnicodeDecodeError) as e:
+        report['unreadable']['SKILL.md'] = str(e)
+        return report
+    frontmatter, body = strip_frontmatter(content)
+    report['description_tokens'] = estimate_tokens(frontmatter.get('description', ''))
+    report['skill_md_tokens'] = estimate_tokens(content)
+    report['skill_md_lines'] = content.count('\n') + 1
+
+    reference_lines = {}
+    for name in tree.list_dir('references', suffix='.md'):
+        rel = f'references/{name}'
+        try:
+            text = tree.read_text(rel)
+        except (OSError, UnicodeDecodeError) as e:
+            report['unreadable'][rel] = str(e)
+            continue
+        report['references'][rel] = estimate_tokens(text)
+        reference_lines[rel] = line_keys(text)
+    if not reference_lines:
+        return report
+
+    for heading, line, text in split_sections(body):
+        weighted = [(normalize_line(l), estimate_tokens(l)) for l in text.splitlines()]
+        section_tokens = sum(tokens for _, tokens in weighted)
+        if section_tokens < MIN_DUPLICATE_TOKENS:
+            continue
+        rel, repeated = max(((rel, sum(tokens for key, tokens in weighted if key and key in keys))
+                             for rel, keys in reference_lines.items()), key=lambda item: item[1])
+        if repeated >= MIN_DUPLICATE_TOKENS and repeated >= DUPLICATE_OVERLAP * section_tokens:
+            report['duplicates'].append({
+                'section': heading,
+                'line': line,
+                'tokens': section_tokens,
+                'repeated_tokens': repeated,
+                'reference': rel,
+                'overlap': round(repeated / section_tokens, 2),
+            })
+    return report
+
+
+def budget_findings(report: dict, budgets: dict = DEFAULT_BUDGETS) -> tuple[list[str], list[str]]:
+    """(over-budget warnings, duplicate-content suggestions) for a skill report"""
+    over = []
+    if report['description_tokens'] > budgets['description']:
+        over.append(f"description is ~{report['description_tokens']:,} tokens (budget {budgets['description']:,}); "
+                    "it is loaded for every installed skill")
+    if report['skill_md_tokens'] > budgets['skill_md']:
+        over.append(f"SKILL.md is ~{report['skill_md_tokens']:,} tokens (budget {budgets['skill_md']:,}); "
+                    "move detail into references/")
+    if report['skill_md_lines'] > budgets['skill_md_lines']:
+        over.append(f"SKILL.md is {report['skill_md_lines']:,} lines (budget {budgets['skill_md_lines']:,})")
+    for rel, tokens in report['references'].items():
+        if tokens > budgets['reference']:
+            over.append(f"{rel} is ~{tokens:,} tokens (budget {budgets['reference']:,}); split it by topic")
+    for rel, error in report['unreadable'].items():
+        over.append(f"{rel} could not be read as UTF-8 text, so its cost is unknown ({error})")
+
+    duplicates = [f"SKILL.md section '{d['section']}' (line {d['line']}) repeats ~{d['repeated_tokens']:,} "
+                  f"tokens of {d['reference']} ({d['overlap']:.0%} of the section) - link to it instead"
+                  for d in report['duplicates']]
+    return over, duplicates
+
+
+def check_context_budget(skill_path: Path, result, tree: SkillTree = None, budgets: dict = DEFAULT_BUDGETS):
+    """Add context budget findings to a ValidationResult"""
+    report = analyze_skill(skill_path, tree)
+    over, duplicates = budget_findings(report, budgets)
+    for message in over:
+        result.add_warning(f"Context budget: {message}")
+    for message in duplicates:
+        result.add_suggestion(message)
+    return report
+
+
+def _analyze_batch(skill_paths: list[str]) -> list[dict]:
+    return [analyze_skill(Path(path)) for path in skill_paths]
+
+
+def analyze_catalog(skills: list[Path], workers: int = None) -> list[dict]:
+    """Reports for many skills, spread over a process pool when there is more than one batch"""
+    paths = [str(path) for path in skills]
+    batches = [paths[i:i + BATCH_SIZE] for i in range(0, len(paths), BATCH_SIZE)]
+    reports = []
+    if len(batches) <= 1 or workers == 1:
+        for batch in batches:
+            reports.extend(_analyze_batch(batch))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for batch_reports in executor.map(_analyze_batch, batches):
+                reports.extend(batch_reports)
+    return reports
+
+
+def print_report(reports: list[dict], budgets: dict, top: int):
+    print("=" * 70)
+    print("CONTEXT BUDGET REPORT")
+    print("=" * 70)
+    print()
+
+    skill_md = sorted(r['skill_md_tokens'] for r in reports)
+    descriptions = sum(r['description_tokens'] for r in reports)
+    print(f"Skills analyzed: {len(reports)}")
+    print(f"   • Descriptions (always loaded): ~{descriptions:,} tokens in total")
+    print(f"   • SKILL.md (loaded on trigger): median ~{skill_md[len(skill_md) // 2]:,}, "
+          f"largest ~{skill_md[-1]:,} tokens")
+    print()
+
+    print(f"Largest SKILL.md files (budget ~{budgets['skill_md']:,} tokens, {budgets['skill_md_lines']:,} lines):")
+    for report in sorted(reports, key=lambda r: -r['skill_md_tokens'])[:top]:
+        mark = '⚠' if (report['skill_md_tokens'] > budgets['skill_md']
+                       or report['skill_md_lines'] > budgets['skill_md_lines']) else ' '
+        references = sum(report['references'].values())
+        print(f"   {mark} ~{report['skill_md_tokens']:>7,} tokens  {report['skill_md_lines']:>5} lines  "
+              f"{report['name']:<28} (+ ~{references:,} in references)")
+    print()
+
+    duplicates = sorted(((d, r['name']) for r in reports for d in r['duplicates']),
+                        key=lambda item: -item[0]['repeated_tokens'])
+    if duplicates:
+        wasted = sum(d['repeated_tokens'] for d, _ in duplicates)
+        print(f"Sections repeating a reference (~{wasted:,} tokens in {len(duplicates)} section(s)):")
+        for duplicate, name in duplicates[:top]:
+            print(f"   💡 ~{duplicate['repeated_tokens']:>5,} tokens  {name:<28} '{duplicate['section']}' "
+                  f"repeats {duplicate['reference']} ({duplicate['overlap']:.0%} of the section)")
+        print()
+
+
+def add_budget_arguments(parser):
+    """Register context budget arguments (shared with brandctl budget)"""
+    parser.add_argument('skill_name', nargs='?', help='Skill directory name (e.g., "pro-sites")')
+    parser.add_argument('--all', action='store_true', help='Analyze every skill in the skills directory')
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--top', type=int, default=10, help='Offenders listed per category (default: 10)')
+    for key, label in (('description', 'frontmatter description'), ('skill_md', 'SKILL.md'),
+                       ('skill_md_lines', 'SKILL.md lines'), ('reference', 'each reference file')):
+        parser.add_argument(f"--{key.replace('_', '-')}-budget", type=int, default=DEFAULT_BUDGETS[key],
+                            dest=f'{key}_budget',
+                            help=f"Budget for {label} (default: {DEFAULT_BUDGETS[key]:,}"
+                                 f"{'' if key == 'skill_md_lines' else ' tokens'})")
+    parser.add_argument('--workers', type=int, help='Worker processes for --all (default: CPU count)')
+    parser.add_argument('--json', action='store_true', help='Print per-skill reports as JSON')
+
+
+def run_budget(args, parser) -> int:
+    if not args.skill_name and not args.all:
+        parser.print_help()
+        print("\nError: Must specify skill_name or --all")
+        return 1
+
+    base_path = Path(args.path)
+    if args.all:
+        if not base_path.is_dir():
+            print(f"Error: Skills directory not found: {base_path}")
+            return 1
+        skills = sorted(p.parent for p in base_path.glob('*/SKILL.md'))
+    else:
+        skills = [base_path / args.skill_name]
+        if not (skills[0] / 'SKILL.md').is_file():
+            print(f"Error: Skill not found: {skills[0]}")
+            return 1
+    if not skills:
+        print(f"No skills found in {base_path}")
+        return 1
+
+    budgets = {key: getattr(args, f'{key}_budget') for key in DEFAULT_BUDGETS}
+    start = time.perf_counter()
+    reports = analyze_catalog(skills, args.workers)
+    elapsed = time.perf_counter() - start
+
+    over_budget = {}
+    for report in reports:
+        over, _ = budget_findings(report, budgets)
+        if over:
+            over_budget[report['name']] = over
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+        return 1 if over_budget else 0
+
+    print_report(reports, budgets, args.top)
+    if over_budget:
+        print(f"❌ {len(over_budget)} skill(s) over budget:")
+        for name, messages in list(over_budget.items())[:args.top]:
+            for message in messages:
+                print(f"   • {name}: {message}")
+        if len(over_budget) > args.top:
+            print(f"   • ... and {len(over_budget) - args.top} more")
+        print()
+        return 1
+    print(f"✅ All {len(reports)} skill(s) within budget ({elapsed:.2f}s)")
+    return 0
+
+
+def main():
+    parser = create_parser(
+        description='Estimate the context cost of brand skills and report the biggest offenders',
+        epilog='Example: python context_budget.py --all --top 20'
+    )
+
+    add_budget_arguments(parser)
+
+    args = parse_args(parser)
+
+    return run_budget(args, parser)
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
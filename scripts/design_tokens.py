@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Design Token Exporter
+
+Exports a brand skill's colors and fonts as design tokens so downstream builds
+can load precomputed values instead of parsing SKILL.md.
+
+Writes into the skill's assets/ directory:
+- tokens.json          Design tokens (name -> {$value, $type})
+- brand.css            CSS custom properties
+- _brand.scss          SCSS variables
+- tailwind.theme.js    Tailwind theme fragment (theme.extend)
+
+Usage:
+    python scripts/design_tokens.py pro-sites
+    python scripts/design_tokens.py --all
+    python scripts/design_tokens.py acme-corp --path /custom/path --stdout css
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import json
+import re
+import sys
+from pathlib import Path
+
+COLOR_ROLES = ('primary', 'secondary', 'accent', 'dark', 'light')
+FONT_ROLES = ('heading', 'subheading', 'body')
+
+# Fallback stacks match the ones documented in references/typography.md
+FONT_FALLBACKS = {
+    'heading': ['Arial', 'Helvetica', 'sans-serif'],
+    'subheading': ['Arial', 'sans-serif'],
+    'body': ['Helvetica', 'Arial', 'sans-serif'],
+}
+
+NEUTRAL_COLORS = {
+    'dark': '#1A1A1A',
+    'light': '#F5F5F5',
+}
+
+FRONTMATTER_FIELD_RE = re.compile(r'^(name|description|license):\s*(.*)$', re.MULTILINE)
+TITLE_RE = re.compile(r'^# (.+?) Brand Guidelines\s*$', re.MULTILINE)
+COLOR_LINE_RE = re.compile(
+    r'^- \*\*(?:(.+?) )?(Primary|Secondary|Accent|Dark|Light)\*\*: `(#[0-9A-Fa-f]{6})`',
+    re.MULTILINE
+)
+FONT_LINE_RE = re.compile(r'^- \*\*(Headings|Subheadings|Body Text)\*\*: (.+?)\s*$', re.MULTILINE)
+
+FONT_LABELS = {
+    'Headings': 'heading',
+    'Subheadings': 'subheading',
+    'Body Text': 'body',
+}
+
+TOKEN_FILES = ('tokens.json', 'brand.css', '_brand.scss', 'tailwind.theme.js')
+
+
+def brand_from_args(client_name, slug, args) -> dict:
+    """Build a brand description from init_brand_skill.py arguments"""
+    colors = {}
+    for role in ('primary', 'secondary', 'accent'):
+        value = getattr(args, f'{role}_color', None)
+        if value:
+            colors[role] = value.upper()
+    colors.update(NEUTRAL_COLORS)
+
+    fonts = {}
+    for role in FONT_ROLES:
+        value = getattr(args, f'font_{role}', None)
+        if value:
+            fonts[role] = value
+
+    return {
+        'name': slug,
+        'client_name': client_name,
+        'colors': colors,
+        'fonts': fonts,
+    }
+
+
+def parse_brand_content(content: str, default_name: str = '') -> dict:
+    """Parse brand colors and fonts from SKILL.md content"""
+    frontmatter = {}
+    if content.startswith('---'):
+        parts = content.split('---', 2)
+        if len(parts) >= 3:
+            frontmatter = dict(FRONTMATTER_FIELD_RE.findall(parts[1]))
+
+    title_match = TITLE_RE.search(content)
+    client_name = title_match.group(1) if title_match else frontmatter.get('name', default_name)
+
+    # The first declaration of each role wins; later mentions are usage examples
+    colors = {}
+    for _, role, hex_color in COLOR_LINE_RE.findall(content):
+        colors.setdefault(role.lower(), hex_color.upper())
+
+    fonts = {}
+    for label, font in FONT_LINE_RE.findall(content):
+        fonts.setdefault(FONT_LABELS[label], font)
+
+    return {
+        'name': frontmatter.get('name', default_name),
+        'client_name': client_name,
+        'license': frontmatter.get('license'),
+        'colors': {role: colors[role] for role in COLOR_ROLES if role in colors},
+        'fonts': {role: fonts[role] for role in FONT_ROLES if role in fonts},
+    }
+
+
+def parse_brand_from_skill_md(skill_md_path: Path) -> dict:
+    """Parse brand colors and fonts from an existing SKILL.md"""
+    with open(skill_md_path, 'r') as f:
+        content = f.read()
+    return parse_brand_content(content, default_name=skill_md_path.parent.name)
+
+
+def font_stack(role: str, font: str) -> list[str]:
+    """Return the font family followed by its documented fallbacks"""
+    return [font] + [name for name in FONT_FALLBACKS[role] if name != font]
+
+
+def css_font_stack(stack: list[str]) -> str:
+    """Format a font stack for CSS, quoting family names with spaces"""
+    return ', '.join(name if name == 'sans-serif' else f"'{name}'" for name in stack)
+
+
+def build_tokens(brand: dict) -> dict:
+    """Build a design-token dictionary from a brand description"""
+    tokens = {
+        '$description': f"{brand['client_name']} brand tokens",
+        'color': {},
+        'font': {},
+    }
+    for role, value in brand['colors'].items():
+        tokens['color'][role] = {'$value': value, '$type': 'color'}
+    for role, font in brand['fonts'].items():
+        tokens['font'][role] = {'$value': font_stack(role, font), '$type': 'fontFamily'}
+    return tokens
+
+
+def render_json(tokens: dict) -> str:
+    return json.dumps(tokens, indent=2) + '\n'
+
+
+def render_css(tokens: dict) -> str:
+    lines = [f"/* {tokens['$description']} - generated by design_tokens.py */", ':root {']
+    for role, token in tokens['color'].items():
+        lines.append(f"  --brand-{role}: {token['$value']};")
+    for role, token in tokens['font'].items():
+        lines.append(f"  --font-{role}: {css_font_stack(token['$value'])};")
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def render_scss(tokens: dict) -> str:
+    lines = [f"// {tokens['$description']} - generated by design_tokens.py"]
+    for role, token in tokens['color'].items():
+        lines.append(f"$brand-{role}: {token['$value']};")
+    for role, token in tokens['font'].items():
+        lines.append(f"$font-{role}: {css_font_stack(token['$value'])};")
+
+    lines.append('')
+    lines.append('$brand-colors: (')
+    for role in tokens['color']:
+        lines.append(f"  '{role}': $brand-{role},")
+    lines.append(');')
+    return '\n'.join(lines) + '\n'
+
+
+def render_tailwind(tokens: dict) -> str:
+    theme = {
+        'colors': {'brand': {role: token['$value'] for role, token in tokens['color'].items()}},
+        'fontFamily': {role: token['$value'] for role, token in tokens['font'].items()},
+    }
+    body = json.dumps(theme, indent=2)
+    return (
+        f"// {tokens['$description']} - generated by design_tokens.py\n"
+        f"// Usage: theme: {{ extend: require('./tailwind.theme.js') }}\n"
+        f"module.exports = {body};\n"
+    )
+
+
+RENDERERS = {
+    'tokens.json': render_json,
+    'brand.css': render_css,
+    '_brand.scss': render_scss,
+    'tailwind.theme.js': render_tailwind,
+}
+
+
+def render_token_files(brand: dict) -> dict[str, str]:
+    """Render every token file for a brand, keyed by file name"""
+    tokens = build_tokens(brand)
+    return {filename: RENDERERS[filename](tokens) for filename in TOKEN_FILES}
+
+
+def export_tokens(skill_path: Path, brand: dict) -> list[Path]:
+    """Write token files into the skill's assets/ directory"""
+    assets_dir = skill_path / 'assets'
+    assets_dir.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    for filename, content in render_token_files(brand).items():
+        output_path = assets_dir / filename
+        with open(output_path, 'w') as f:
+            f.write(content)
+        written.append(output_path)
+    return written
+
+
+def export_skill_tokens(skill_path: Path) -> tuple[bool, str]:
+    """Parse a skill's SKILL.md and export its tokens"""
+    skill_md = skill_path / 'SKILL.md'
+    if not skill_md.exists():
+        return False, f"Missing SKILL.md in {skill_path}"
+
+    try:
+        brand = parse_brand_from_skill_md(skill_md)
+    except OSError as e:
+        return False, f"Failed to read SKILL.md: {str(e)}"
+
+    if not brand['colors'] and not brand['fonts']:
+        return False, f"No colors or fonts found in {skill_md}"
+
+    export_tokens(skill_path, brand)
+    return True, f"{len(brand['colors'])} color(s), {len(brand['fonts'])} font(s)"
+
+
+def main():
+    parser = create_parser(
+        description='Export brand colors and fonts as design tokens',
+        epilog='Example: python design_tokens.py pro-sites'
+    )
+
+    parser.add_argument('skill_name', nargs='?', help='Skill directory name (e.g., "pro-sites")')
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--all', action='store_true', help='Export tokens for every skill in the skills directory')
+    parser.add_argument('--stdout', choices=['json', 'css', 'scss', 'tailwind'],
+                        help='Print one format to stdout instead of writing files')
+
+    args = parse_args(parser)
+
+    if not args.skill_name and not args.all:
+        parser.print_help()
+        print("\nError: Must specify skill_name or --all")
+        return 1
+
+    base_path = Path(args.path)
+
+    if args.stdout:
+        if not args.skill_name:
+            print("Error: --stdout requires a skill_name")
+            return 1
+        brand = parse_brand_from_skill_md(base_path / args.skill_name / 'SKILL.md')
+        filename = {
+            'json': 'tokens.json',
+            'css': 'brand.css',
+            'scss': '_brand.scss',
+            'tailwind': 'tailwind.theme.js',
+        }[args.stdout]
+        sys.stdout.write(render_token_files(brand)[filename])
+        return 0
+
+    if args.all:
+        from package_skill import list_skills
+        skills = list_skills(base_path)
+        if not skills:
+            print(f"No skills found in {base_path}")
+            return 1
+    else:
+        skills = [base_path / args.skill_name]
+
+    failed = 0
+    for skill_path in skills:
+        success, message = export_skill_tokens(skill_path)
+        if success:
+            print(f"✓ {skill_path.name}: {message}")
+        else:
+            print(f"✗ {skill_path.name}: {message}")
+            failed += 1
+
+    print()
+    print(f"Exported tokens for {len(skills) - failed} of {len(skills)} skill(s)")
+    return 0 if not failed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
@@ -0,0 +1,95 @@
+"""
+Validation Findings
+
+Compact records for validation results. A finding stores its rule code (an
+interned string), path and raw arguments; the message is only formatted when
+something reads it, so a catalog-wide run that never prints INFO findings
+never builds their strings. Findings below a result's minimum severity are
+not created at all.
+
+Records are kept smaller than the message strings they replace: severity is
+looked up from the rule, a single argument is stored without a tuple, and
+paths under the skill root are stored as interned relative paths (the same
+'assets/logo.png' object for every skill) next to the shared root string.
+"""
+
+import enum
+import os
+import string
+import sys
+from pathlib import Path
+
+
+class Severity(enum.IntEnum):
+    INFO = 0
+    SUGGESTION = 1
+    WARNING = 2
+    ERROR = 3
+
+
+# Rule code -> (severity, message template, positional argument count);
+# templates use {path} and positional args
+RULES: dict[str, tuple[Severity, str, int]] = {}
+
+
+def rule(code: str, severity: Severity, template: str) -> str:
+    """Register a rule and return its interned code"""
+    code = sys.intern(code)
+    arity = max((int(field) + 1 for _, field, _, _ in string.Formatter().parse(template)
+                 if field and field.isdigit()), default=0)
+    RULES[code] = (severity, template, arity)
+    return code
+
+
+class Finding:
+    """One validation finding; message text is formatted on demand"""
+
+    __slots__ = ('code', 'root', 'path', 'args')
+
+    def __init__(self, code: str, args: tuple = (), path=None, root: str = None):
+        self.code = code
+        # One-argument rules (most of them) store the argument itself
+        self.args = args[0] if RULES[code][2] == 1 else args
+        self.root = None
+        self.path = None
+        if path is not None:
+            path = str(path)
+            if root is not None and path.startswith(root) and path[len(root):len(root) + 1] == os.sep:
+                self.root = root
+                path = sys.intern(path[len(root) + 1:])
+            self.path = path
+
+    @property
+    def severity(self) -> Severity:
+        return RULES[self.code][0]
+
+    @property
+    def location(self):
+        """Full path of the finding as a string, or None"""
+        if self.root is None:
+            return self.path
+        return self.root + os.sep + self.path
+
+    @property
+    def message(self) -> str:
+        _, template, arity = RULES[self.code]
+        args = (self.args,) if arity == 1 else self.args
+        location = self.location
+        return template.format(*args, path=None if location is None else Path(location))
+
+    def __str__(self) -> str:
+        return f"{self.severity.name}: {self.message}"
+
+    def __repr__(self) -> str:
+        return f"Finding({self.code!r}, {self.severity.name}, {self.location!r}, {self.args!r})"
+
+    def to_dict(self) -> dict:
+        return {'code': self.code, 'severity': self.severity.name.lower(),
+                'path': self.location, 'message': self.message}
+
+
+# Free-form messages (e.g. from context_budget.py) are recorded under these codes
+ERROR = rule('error', Severity.ERROR, '{0}')
+WARNING = rule('warning', Severity.WARNING, '{0}')
+SUGGESTION = rule('suggestion', Severity.SUGGESTION, '{0}')
+INFO = rule('info', Severity.INFO, '{0}')
@@ -9,11 +9,19 @@ Usage:
     python scripts/init_brand_skill.py "TechStart" --primary-color "#FF5733" --secondary-color "#33FF57" --font-body "Open Sans"
 """
 
-import argparse
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import functools
 import os
 import sys
 from pathlib import Path
 import re
+import struct
+import zlib
+
+from color_space import hex_to_lab
+from design_tokens import NEUTRAL_COLORS, brand_from_args, render_token_files
 
 
 def slugify(text):
@@ -234,7 +242,7 @@ For detailed specifications, consult:
 
 To complete this brand skill:
 
-1. **Add Logo Assets**: Place {client_name}'s logo files in `assets/`
+1. **Add Logo Assets**: Replace the placeholder logos in `assets/` with {client_name}'s logo files
    - `logo.png` (required)
    - `logo-white.png` (for dark backgrounds)
    - `logo-horizontal.png` (alternative orientation)
@@ -715,31 +723,302 @@ If distributing custom fonts (ensure proper licensing):
 
 ## Next Steps
 
-1. Add logo files (PNG at minimum, SVG recommended)
+1. Replace the generated placeholder logos (brand initials) with the real logo files
 2. Add any pre-branded templates
 3. Remove this README.md file once assets are in place
 """
 
 
-def create_placeholder_logo(path, logo_type="primary"):
-    """Create a placeholder text file for logo"""
-    content = f"""PLACEHOLDER: {logo_type.upper()} LOGO
+# 5x7 bitmap glyphs for placeholder logo initials (one string per row)
+GLYPHS = {
+    'A': ('01110', '10001', '10001', '11111', '10001', '10001', '10001'),
+    'B': ('11110', '10001', '10001', '11110', '10001', '10001', '11110'),
+    'C': ('01110', '10001', '10000', '10000', '10000', '10001', '01110'),
+    'D': ('11110', '10001', '10001', '10001', '10001', '10001', '11110'),
+    'E': ('11111', '10000', '10000', '11110', '10000', '10000', '11111'),
+    'F': ('11111', '10000', '10000', '11110', '10000', '10000', '10000'),
+    'G': ('01110', '10001', '10000', '10111', '10001', '10001', '01111'),
+    'H': ('10001', '10001', '10001', '11111', '10001', '10001', '10001'),
+    'I': ('01110', '00100', '00100', '00100', '00100', '00100', '01110'),
+    'J': ('00111', '00010', '00010', '00010', '00010', '10010', '01100'),
+    'K': ('10001', '10010', '10100', '11000', '10100', '10010', '10001'),
+    'L': ('10000', '10000', '10000', '10000', '10000', '10000', '11111'),
+    'M': ('10001', '11011', '10101', '10101', '10001', '10001', '10001'),
+    'N': ('10001', '10001', '11001', '10101', '10011', '10001', '10001'),
+    'O': ('01110', '10001', '10001', '10001', '10001', '10001', '01110'),
+    'P': ('11110', '10001', '10001', '11110', '10000', '10000', '10000'),
+    'Q': ('01110', '10001', '10001', '10001', '10101', '10010', '01101'),
+    'R': ('11110', '10001', '10001', '11110', '10100', '10010', '10001'),
+    'S': ('01111', '10000', '10000', '01110', '00001', '00001', '11110'),
+    'T': ('11111', '00100', '00100', '00100', '00100', '00100', '00100'),
+    'U': ('10001', '10001', '10001', '10001', '10001', '10001', '01110'),
+    'V': ('10001', '10001', '10001', '10001', '10001', '01010', '00100'),
+    'W': ('10001', '10001', '10001', '10101', '10101', '10101', '01010'),
+    'X': ('10001', '10001', '01010', '00100', '01010', '10001', '10001'),
+    'Y': ('10001', '10001', '01010', '00100', '00100', '00100', '00100'),
+    'Z': ('11111', '00001', '00010', '00100', '01000', '10000', '11111'),
+    '0': ('01110', '10001', '10011', '10101', '11001', '10001', '01110'),
+    '1': ('00100', '01100', '00100', '00100', '00100', '00100', '01110'),
+    '2': ('01110', '10001', '00001', '00010', '00100', '01000', '11111'),
+    '3': ('11111', '00010', '00100', '00010', '00001', '10001', '01110'),
+    '4': ('00010', '00110', '01010', '10010', '11111', '00010', '00010'),
+    '5': ('11111', '10000', '11110', '00001', '00001', '10001', '01110'),
+    '6': ('00110', '01000', '10000', '11110', '10001', '10001', '01110'),
+    '7': ('11111', '00001', '00010', '00100', '01000', '01000', '01000'),
+    '8': ('01110', '10001', '10001', '01110', '10001', '10001', '01110'),
+    '9': ('01110', '10001', '10001', '01111', '00001', '00010', '01100'),
+}
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+
+# Placeholder logos meet the validator's recommended 100px+ height, and at
+# 1000x500 logo_renditions.py can render every size (up to the social cards'
+# 960px-wide logo area) without upscaling
+PLACEHOLDER_LOGO_SIZE = (1000, 500)
+# The validator's optional horizontal variant
+PLACEHOLDER_HORIZONTAL_SIZE = (1200, 300)
+
+
+def brand_initials(client_name, max_letters=2):
+    """Return up to two initials for a client name (e.g., "Acme Corp" -> "AC")"""
+    words = [w for w in re.split(r'[^A-Za-z0-9]+', client_name) if w]
+    if not words:
+        return 'B'
+    if len(words) == 1:
+        return words[0][:max_letters].upper()
+    return ''.join(w[0] for w in words[:max_letters]).upper()
+
+
+def png_chunk(chunk_type, data):
+    """Encode a single PNG chunk"""
+    return (struct.pack('>I', len(data)) + chunk_type + data +
+            struct.pack('>I', zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+
+def encode_png(width, height, rows):
+    """Encode RGBA scanlines (bytes of width * 4) as a PNG file"""
+    # Filter type 0 (None) on every scanline; solid fills compress to almost nothing
+    raw = b''.join(b'\x00' + row for row in rows)
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' +
+            png_chunk(b'IHDR', header) +
+            png_chunk(b'IDAT', zlib.compress(raw, 6)) +
+            png_chunk(b'IEND', b''))
+
+
+@functools.lru_cache(maxsize=256)
+def render_initials_png(initials, width, height, foreground, background=None):
+    """Render initials centered on a solid (or transparent) background as PNG bytes"""
+    fg = bytes(hex_to_rgb(foreground)) + b'\xff'
+    bg = bytes(hex_to_rgb(background)) + b'\xff' if background else b'\x00\x00\x00\x00'
+
+    glyphs = [GLYPHS[c] for c in initials if c in GLYPHS] or [GLYPHS['B']]
+
+    # One blank column between letters; scale the text to ~60% of the height
+    grid_width = len(glyphs) * (GLYPH_WIDTH + 1) - 1
+    scale = max(1, min(int(height * 0.6) // GLYPH_HEIGHT, int(width * 0.8) // grid_width))
+    text_width = grid_width * scale
+    text_height = GLYPH_HEIGHT * scale
+    left = (width - text_width) // 2
+    top = (height - text_height) // 2
+
+    # Only GLYPH_HEIGHT distinct text scanlines exist; build each once and repeat it
+    blank_row = bg * width
+    glyph_rows = []
+    for y in range(GLYPH_HEIGHT):
+        bits = '0'.join(glyph[y] for glyph in glyphs)
+        row = bytearray(bg * left)
+        for bit in bits:
+            row += (fg if bit == '1' else bg) * scale
+        row += bg * (width - left - text_width)
+        glyph_rows.append(bytes(row))
+
+    rows = [blank_row] * top
+    for row in glyph_rows:
+        rows.extend([row] * scale)
+    rows.extend([blank_row] * (height - top - text_height))
+
+    return encode_png(width, height, rows)
+
+
+def _xml_escape(value: str) -> str:
+    """Escape text for an XML attribute or element"""
+    return value.replace('&', '&amp;').replace('"', '&quot;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def render_initials_svg(initials, width, height, foreground, background=None, font_family=None):
+    """Render initials centered on a solid (or transparent) background as SVG markup"""
+    if font_family:
+        # From --font-heading: escape it for the CSS string here and for XML below
+        css_name = font_family.replace('\\', '\\\\').replace("'", "\\'")
+        font = f"'{css_name}', Arial, sans-serif"
+    else:
+        font = 'Arial, sans-serif'
+    font, initials = _xml_escape(font), _xml_escape(initials)
+    rect = f'  <rect width="{width}" height="{height}" fill="{background}"/>\n' if background else ''
+    return (
+        f'<?xml version="1.0" encoding="utf-8"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">\n'
+        f'{rect}'
+        f'  <text x="50%" y="50%" dominant-baseline="central" text-anchor="middle" '
+        f'font-family="{font}" font-size="{int(height * 0.6)}" font-weight="700" fill="{foreground}">{initials}</text>\n'
+        f'</svg>\n'
+    )
+
+
+def create_placeholder_logos(client_name, args):
+    """Create placeholder PNG and SVG logos from the brand initials and primary color"""
+    initials = brand_initials(client_name)
+    primary = args.primary_color or '#0066CC'
+    width, height = PLACEHOLDER_LOGO_SIZE
+
+    return {
+        # Primary logo: white initials on the primary color
+        'logo.png': render_initials_png(initials, width, height, '#FFFFFF', primary),
+        'logo.svg': render_initials_svg(initials, width, height, '#FFFFFF', primary, args.font_heading),
+        # White logo: white initials on a transparent background for dark surfaces
+        'logo-white.png': render_initials_png(initials, width, height, '#FFFFFF'),
+        'logo-white.svg': render_initials_svg(initials, width, height, '#FFFFFF', None, args.font_heading),
+        'logo-horizontal.png': render_initials_png(initials, *PLACEHOLDER_HORIZONTAL_SIZE, '#FFFFFF', primary),
+    }
+
+
+def create_example_script(client_name, args):
+    """Generate scripts/example_brand_script.py"""
+    palette = {
+        'Primary': args.primary_color or '#0066CC',
+        'Secondary': args.secondary_color or '#FF6600',
+    }
+    if args.accent_color:
+        palette['Accent'] = args.accent_color
+    palette.update({role.capitalize(): hex_color for role, hex_color in NEUTRAL_COLORS.items()})
+
+    # Lab coordinates are precomputed here so the skill script stays dependency-free
+    palette_lines = '\n'.join(
+        f'    "{name}": ("{hex_color.upper()}", ({", ".join(f"{round(v, 2) + 0.0:.2f}" for v in hex_to_lab(hex_color))})),'
+        for name, hex_color in palette.items()
+    )
+
+    return f"""#!/usr/bin/env python3
+\"\"\"
+Example script for applying {client_name} brand colors
+
+This is a placeholder - customize based on your needs.
+
+Includes nearest-brand-color helpers for bringing third-party assets on-brand:
+    python example_brand_script.py "#0A5BD3"              # nearest brand color
+    python example_brand_script.py input.png output.png   # snap image (needs numpy + Pillow)
+\"\"\"
 
-Replace this file with the actual logo image file.
+import math
+import sys
 
-Recommended formats:
-- PNG (with transparency)
-- SVG (vector, scalable)
+# {client_name} brand colors
+PRIMARY_COLOR = "{palette['Primary']}"
+SECONDARY_COLOR = "{palette['Secondary']}"
+DARK = "{NEUTRAL_COLORS['dark']}"
+LIGHT = "{NEUTRAL_COLORS['light']}"
+
+# Brand palette: name -> (hex, CIELAB D65)
+BRAND_PALETTE = {{
+{palette_lines}
+}}
 
-Minimum requirements:
-- Digital: 50px height minimum
-- Print: 300 DPI, 0.5" height minimum
 
-For detailed logo specifications, see:
-references/logo-usage.md
+def hex_to_lab(hex_color):
+    \"\"\"Convert #RRGGBB to CIELAB (D65)\"\"\"
+    rgb = [int(hex_color.lstrip("#")[i:i + 2], 16) / 255 for i in (0, 2, 4)]
+    r, g, b = [c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in rgb]
+    xyz = (
+        (0.4124564 * r + 0.3575761 * g + 0.1804375 * b) / 0.95047,
+        0.2126729 * r + 0.7151522 * g + 0.0721750 * b,
+        (0.0193339 * r + 0.1191920 * g + 0.9503041 * b) / 1.08883,
+    )
+    fx, fy, fz = [t ** (1 / 3) if t > 216 / 24389 else (24389 / 27 * t + 16) / 116 for t in xyz]
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def nearest_brand_color(hex_color):
+    \"\"\"Return (name, hex, delta E) of the brand color closest to hex_color\"\"\"
+    lab = hex_to_lab(hex_color)
+    name, (brand_hex, brand_lab) = min(BRAND_PALETTE.items(), key=lambda item: math.dist(lab, item[1][1]))
+    return name, brand_hex, math.dist(lab, brand_lab)
+
+
+def snap_image(source, destination, grid_bits=5):
+    \"\"\"Snap every pixel of an image to the nearest brand color\"\"\"
+    import numpy as np
+    from PIL import Image
+
+    # Nearest brand color for every cell of a quantized RGB grid, computed once;
+    # each pixel is then a single lookup instead of a search over the palette
+    size = 1 << grid_bits
+    step = 256 // size
+    centers = np.arange(size) * step + step // 2
+    cells = np.stack(np.meshgrid(centers, centers, centers, indexing="ij"), axis=-1).reshape(-1, 3)
+    cell_labs = np.array([hex_to_lab("#%02X%02X%02X" % tuple(cell)) for cell in cells])
+    brand_labs = np.array([lab for _, lab in BRAND_PALETTE.values()])
+    brand_rgb = np.array([[int(h[i:i + 2], 16) for i in (1, 3, 5)] for h, _ in BRAND_PALETTE.values()], dtype=np.uint8)
+    nearest = np.argmin(((cell_labs[:, None, :] - brand_labs[None, :, :]) ** 2).sum(-1), axis=1)
+    grid = nearest.reshape(size, size, size)
+
+    with Image.open(source) as img:
+        pixels = np.array(img.convert("RGBA"))
+    shift = 8 - grid_bits
+    rgb = pixels[..., :3] >> shift
+    pixels[..., :3] = brand_rgb[grid[rgb[..., 0], rgb[..., 1], rgb[..., 2]]]
+    Image.fromarray(pixels).save(destination)
+
+
+def apply_brand_colors():
+    \"\"\"Example function to apply brand colors\"\"\"
+    print(f"Applying {client_name} brand colors...")
+    print(f"Primary: {{PRIMARY_COLOR}}")
+    print(f"Secondary: {{SECONDARY_COLOR}}")
+    # Add your implementation here
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2:
+        name, brand_hex, delta_e = nearest_brand_color(sys.argv[1])
+        print(f"{{sys.argv[1]}} -> {{name}} {{brand_hex}} (delta E {{delta_e:.1f}})")
+    elif len(sys.argv) == 3:
+        snap_image(sys.argv[1], sys.argv[2])
+    else:
+        apply_brand_colors()
 """
-    with open(path, 'w') as f:
-        f.write(content)
+
+
+def build_skill_files(client_name, slug, args):
+    """Generate every skill file in memory, keyed by path relative to the skill root"""
+    files = {
+        'SKILL.md': create_skill_md(client_name, slug, args),
+        'references/color-system.md': create_color_system_md(client_name, args),
+        'references/typography.md': create_typography_md(client_name, args),
+        'references/logo-usage.md': create_logo_usage_md(client_name),
+        'assets/README.md': create_readme_for_assets(),
+    }
+
+    for filename, content in create_placeholder_logos(client_name, args).items():
+        files[f'assets/{filename}'] = content
+
+    files['scripts/example_brand_script.py'] = create_example_script(client_name, args)
+
+    # Export design tokens from the same arguments
+    if getattr(args, 'tokens', False):
+        for filename, content in render_token_files(brand_from_args(client_name, slug, args)).items():
+            files[f'assets/{filename}'] = content
+
+    return files
+
+
+def write_skill_files(skill_path, files):
+    """Write generated skill files below skill_path"""
+    for rel_path, content in files.items():
+        path = skill_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        mode = 'wb' if isinstance(content, bytes) else 'w'
+        with open(path, mode) as f:
+            f.write(content)
 
 
 def init_brand_skill(client_name, args):
@@ -775,64 +1054,10 @@ def init_brand_skill(client_name, args):
     (skill_path / 'references').mkdir(exist_ok=True)
     (skill_path / 'scripts').mkdir(exist_ok=True)
 
-    # Create SKILL.md
-    print("Creating SKILL.md...")
-    skill_md_content = create_skill_md(client_name, slug, args)
-    with open(skill_path / 'SKILL.md', 'w') as f:
-        f.write(skill_md_content)
-
-    # Create reference files
-    print("Creating reference documentation...")
-
-    color_system_content = create_color_system_md(client_name, args)
-    with open(skill_path / 'references' / 'color-system.md', 'w') as f:
-        f.write(color_system_content)
-
-    typography_content = create_typography_md(client_name, args)
-    with open(skill_path / 'references' / 'typography.md', 'w') as f:
-        f.write(typography_content)
-
-    logo_usage_content = create_logo_usage_md(client_name)
-    with open(skill_path / 'references' / 'logo-usage.md', 'w') as f:
-        f.write(logo_usage_content)
-
-    # Create assets README
-    print("Creating assets directory...")
-    assets_readme = create_readme_for_assets()
-    with open(skill_path / 'assets' / 'README.md', 'w') as f:
-        f.write(assets_readme)
-
-    # Create placeholder logo files
-    create_placeholder_logo(skill_path / 'assets' / 'logo.png.placeholder', 'primary')
-    create_placeholder_logo(skill_path / 'assets' / 'logo-white.png.placeholder', 'white')
-
-    # Create a simple example script
-    print("Creating example script...")
-    example_script = f"""#!/usr/bin/env python3
-\"\"\"
-Example script for applying {client_name} brand colors
-
-This is a placeholder - customize based on your needs.
-\"\"\"
-
-# {client_name} brand colors
-PRIMARY_COLOR = "{args.primary_color or '#0066CC'}"
-SECONDARY_COLOR = "{args.secondary_color or '#FF6600'}"
-DARK = "#1A1A1A"
-LIGHT = "#F5F5F5"
-
-def apply_brand_colors():
-    \"\"\"Example function to apply brand colors\"\"\"
-    print(f"Applying {client_name} brand colors...")
-    print(f"Primary: {{PRIMARY_COLOR}}")
-    print(f"Secondary: {{SECONDARY_COLOR}}")
-    # Add your implementation here
-
-if __name__ == "__main__":
-    apply_brand_colors()
-"""
-    with open(skill_path / 'scripts' / 'example_brand_script.py', 'w') as f:
-        f.write(example_script)
+    # Generate all files in memory, then write them out
+    print("Creating SKILL.md, reference documentation, assets and example script...")
+    files = build_skill_files(client_name, slug, args)
+    write_skill_files(skill_path, files)
 
     # Create success summary
     print()
@@ -850,12 +1075,14 @@ if __name__ == "__main__":
     print(f"  • references/typography.md")
     print(f"  • references/logo-usage.md")
     print(f"  • assets/README.md")
-    print(f"  • assets/logo.png.placeholder")
-    print(f"  • assets/logo-white.png.placeholder")
+    print(f"  • assets/logo.png, logo.svg (placeholder initials)")
+    print(f"  • assets/logo-white.png, logo-white.svg (placeholder initials)")
     print(f"  • scripts/example_brand_script.py")
+    if getattr(args, 'tokens', False):
+        print(f"  • assets/tokens.json, brand.css, _brand.scss, tailwind.theme.js")
     print()
     print("Next steps:")
-    print(f"  1. Add logo files to: {skill_path / 'assets'}/")
+    print(f"  1. Replace placeholder logos in: {skill_path / 'assets'}/")
     print(f"  2. Review and customize: {skill_path / 'SKILL.md'}")
     print(f"  3. Add detailed specs to files in: {skill_path / 'references'}/")
     print(f"  4. Run validation: python scripts/validate_brand_assets.py {slug}")
@@ -881,12 +1108,8 @@ if __name__ == "__main__":
     return 0
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Initialize a new brand guideline skill',
-        epilog='Example: python init_brand_skill.py "Acme Corp" --primary-color "#0066CC" --font-heading "Montserrat"'
-    )
-
+def add_init_arguments(parser):
+    """Register init arguments (shared with brandctl init)"""
     # Required arguments
     parser.add_argument('client_name', help='Client/brand name (e.g., "Acme Corp")')
 
@@ -904,8 +1127,12 @@ def main():
     parser.add_argument('--path', help='Base path for skill (default: ./brand-skills/)')
     parser.add_argument('--force', action='store_true', help='Overwrite existing skill directory')
 
-    args = parser.parse_args()
+    # Output arguments
+    parser.add_argument('--tokens', action='store_true', help='Also export design tokens (JSON, CSS, SCSS, Tailwind) to assets/')
+
 
+def run_init(args):
+    """Validate and normalize colors, then initialize the skill"""
     # Validate colors
     colors_to_validate = [
         ('primary-color', args.primary_color),
@@ -931,5 +1158,18 @@ def main():
     return init_brand_skill(args.client_name, args)
 
 
+def main():
+    parser = create_parser(
+        description='Initialize a new brand guideline skill',
+        epilog='Example: python init_brand_skill.py "Acme Corp" --primary-color "#0066CC" --font-heading "Montserrat"'
+    )
+
+    add_init_arguments(parser)
+
+    args = parse_args(parser)
+
+    return run_init(args)
+
+
 if __name__ == '__main__':
-    sys.exit(main())
+    sys.exit(run_cli(main))
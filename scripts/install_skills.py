@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Skill Installer
+
+Installs or syncs packaged .skill files into a skills directory
+(~/.claude/skills by default) without re-extracting unchanged files.
+
+For each package the CRC-32 and size of every member are read from the zip
+central directory and compared with the installed files. Only changed members
+are decompressed; files no longer in the package are removed. The new version
+is assembled in a staging directory next to the installed one (unchanged files
+are hard-linked, not copied) and swapped in with two renames, so a skill is
+never seen half-updated.
+
+A small manifest per skill (in <target>/.skill-sync/) remembers each installed
+file's CRC with its size and mtime, so unchanged files are not even read on the
+next sync; a file edited by hand no longer matches and is re-checked by CRC.
+
+Usage:
+    python scripts/install_skills.py                         # every dist/*.skill
+    python scripts/install_skills.py dist/pro-sites.skill --target .claude/skills
+    python scripts/install_skills.py /Volumes/Shared/brand-skills --prune --dry-run
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+from skill_model import SkillTree
+
+DEFAULT_TARGET = Path.home() / '.claude' / 'skills'
+
+MANIFEST_DIR = '.skill-sync'
+
+CRC_CHUNK_SIZE = 1024 * 1024
+
+_claims_lock = threading.Lock()
+
+# Threads, not processes: the work is file I/O plus zlib, which releases the GIL
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def package_members(zf) -> tuple[str, dict]:
+    """(skill name, {relative path: ZipInfo}) of a package; raises ValueError on unsafe or mixed paths"""
+    skill_name = None
+    members = {}
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        name = info.filename
+        parts = name.split('/')
+        if name.startswith('/') or '\\' in name or ':' in parts[0] or any(p in ('', '.', '..') for p in parts):
+            raise ValueError(f"Unsafe path in package: {name}")
+        if len(parts) < 2:
+            raise ValueError(f"File outside the skill directory: {name}")
+        if skill_name is None:
+            skill_name = parts[0]
+        elif parts[0] != skill_name:
+            raise ValueError(f"Package contains more than one skill: {skill_name}, {parts[0]}")
+        members['/'.join(parts[1:])] = info
+    if skill_name is None or skill_name.startswith('.'):
+        raise ValueError("Package contains no skill")
+    return skill_name, members
+
+
+def file_crc32(path: Path) -> int:
+    import zlib
+
+    crc = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CRC_CHUNK_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def member_mode(info) -> int:
+    """Permission bits stored in a zip member (0 when the archive has none)"""
+    return (info.external_attr >> 16) & 0o777
+
+
+def manifest_path(target: Path, skill_name: str) -> Path:
+    return target / MANIFEST_DIR / f'{skill_name}.json'
+
+
+def load_manifest(target: Path, skill_name: str) -> dict:
+    try:
+        with open(manifest_path(target, skill_name)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(target: Path, skill_name: str, manifest: dict):
+    path = manifest_path(target, skill_name)
+    path.parent.mkdir(exist_ok=True)
+    temp_path = path.with_name(path.name + '.tmp')
+    temp_path.write_text(json.dumps(manifest, sort_keys=True))
+    os.replace(temp_path, path)
+
+
+def installed_crcs(skill_dir: Path, manifest: dict) -> tuple[dict, dict]:
+    """({rel: crc}, {rel: stat}) of an installed skill; CRCs come from the manifest while size and mtime still match"""
+    known = manifest.get('files', {})
+    files = SkillTree(skill_dir).files
+    crcs = {}
+    for rel, file_stat in files.items():
+        entry = known.get(rel)
+        if entry and entry[1] == file_stat.st_size and entry[2] == file_stat.st_mtime_ns:
+            crcs[rel] = entry[0]
+        else:
+            crcs[rel] = file_crc32(skill_dir / rel)
+    return crcs, files
+
+
+def recover(target: Path):
+    """Undo interrupted syncs: restore moved-aside installs and drop leftover staging dirs"""
+    try:
+        entries = [entry.name for entry in os.scandir(target) if entry.name.startswith('.')]
+    except OSError:
+        return
+    for name in entries:
+        if name.endswith('.previous'):
+            current = target / name[1:-len('.previous')]
+            if current.exists():
+                shutil.rmtree(target / name)
+            else:
+                os.rename(target / name, current)
+        elif '.staging-' in name:
+            shutil.rmtree(target / name, ignore_errors=True)
+
+
+def swap_in(target: Path, skill_name: str, staging: Path):
+    """Replace target/skill_name with staging; the old version is moved aside first and deleted last"""
+    current = target / skill_name
+    previous = target / f'.{skill_name}.previous'
+    if current.exists():
+        os.rename(current, previous)
+        os.rename(staging, current)
+        shutil.rmtree(previous)
+    else:
+        os.rename(staging, current)
+
+
+def sync_package(package: Path, target: Path, dry_run: bool = False, claims: dict = None) -> dict:
+    """Bring one installed skill in line with a package; returns what was done
+
+    claims maps skill names to the package that installs them, so two packages
+    of the same skill in one run are reported instead of racing.
+    """
+    import tempfile
+    import zipfile
+
+    claims = claims if claims is not None else {}
+    result = {'package': str(package), 'skill': package.stem, 'status': 'unchanged',
+              'extracted': 0, 'reused': 0, 'removed': 0, 'bytes': 0}
+    try:
+        with zipfile.ZipFile(package) as zf:
+            skill_name, members = package_members(zf)
+            result['skill'] = skill_name
+            with _claims_lock:
+                owner = claims.setdefault(skill_name, str(package))
+            if owner != str(package):
+                raise ValueError(f"Skill {skill_name} is also in {owner}")
+
+            current = target / skill_name
+            manifest = load_manifest(target, skill_name)
+            installed, stats = installed_crcs(current, manifest) if current.is_dir() else ({}, {})
+
+            changed = []
+            unchanged = []
+            for rel, info in members.items():
+                mode = member_mode(info)
+                if (installed.get(rel) == info.CRC and stats[rel].st_size == info.file_size
+                        and (not mode or stats[rel].st_mode & 0o777 == mode)):
+                    unchanged.append(rel)
+                else:
+                    changed.append(rel)
+            stale = sorted(set(installed) - set(members))
+
+            result['extracted'] = len(changed)
+            result['reused'] = len(unchanged)
+            result['removed'] = len(stale)
+            result['bytes'] = sum(members[rel].file_size for rel in changed)
+            if not changed and not stale:
+                # Record CRCs that had to be recomputed so the next sync can skip reading those files
+                files = {rel: [installed[rel], stats[rel].st_size, stats[rel].st_mtime_ns] for rel in members}
+                if not dry_run and manifest.get('files') != files:
+                    save_manifest(target, skill_name, {'files': files})
+                return result
+            result['status'] = 'updated' if current.is_dir() else 'installed'
+            if dry_run:
+                return result
+
+            target.mkdir(parents=True, exist_ok=True)
+            staging = Path(tempfile.mkdtemp(prefix=f'.{skill_name}.staging-', dir=target))
+            try:
+                for rel in unchanged:
+                    destination = staging / rel
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    try:
+                        os.link(current / rel, destination)
+                    except OSError:
+                        shutil.copy2(current / rel, destination)
+                for rel in changed:
+                    info = members[rel]
+                    destination = staging / rel
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    with zf.open(info) as source, open(destination, 'wb') as f:
+                        shutil.copyfileobj(source, f, CRC_CHUNK_SIZE)
+                    if member_mode(info):
+                        os.chmod(destination, member_mode(info))
+                os.chmod(staging, 0o755)
+                swap_in(target, skill_name, staging)
+            except BaseException:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise
+
+            files = {}
+            for rel, info in members.items():
+                file_stat = os.stat(current / rel)
+                files[rel] = [info.CRC, file_stat.st_size, file_stat.st_mtime_ns]
+            save_manifest(target, skill_name, {'files': files})
+    except (OSError, ValueError, zipfile.BadZipFile) as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+    return result
+
+
+def find_packages(sources) -> list[Path]:
+    """.skill files named directly or found (non-recursively) in source directories"""
+    packages = []
+    for source in sources:
+        source = Path(source)
+        if source.is_dir():
+            packages.extend(sorted(source.glob('*.skill')))
+        else:
+            packages.append(source)
+    return packages
+
+
+def sync_packages(packages: list[Path], target: Path, workers: int = None, dry_run: bool = False) -> list[dict]:
+    """Sync packages in parallel, one skill per worker; results in package order"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not dry_run:
+        recover(target)
+
+    claims = {}
+    workers = max(1, min(workers or DEFAULT_WORKERS, len(packages)))
+    if workers == 1:
+        return [sync_package(package, target, dry_run, claims) for package in packages]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda package: sync_package(package, target, dry_run, claims), packages))
+
+
+def prune_skills(target: Path, keep: set[str], dry_run: bool = False) -> list[str]:
+    """Remove skills installed by a previous sync whose package is no longer present"""
+    manifest_dir = target / MANIFEST_DIR
+    if not manifest_dir.is_dir():
+        return []
+    removed = []
+    for path in sorted(manifest_dir.glob('*.json')):
+        skill_name = path.stem
+        if skill_name in keep:
+            continue
+        removed.append(skill_name)
+        if not dry_run:
+            shutil.rmtree(target / skill_name, ignore_errors=True)
+            path.unlink()
+    return removed
+
+
+def add_install_arguments(parser):
+    """Register install arguments (shared with brandctl install/sync)"""
+    parser.add_argument('packages', nargs='*', default=['dist'],
+                        help='.skill files or directories containing them (default: ./dist/)')
+    parser.add_argument('--target', default=str(DEFAULT_TARGET),
+                        help='Skills directory to install into (default: ~/.claude/skills/)')
+    parser.add_argument('--prune', action='store_true',
+                        help='Remove previously synced skills that no longer have a package')
+    parser.add_argument('--workers', type=int, help=f'Packages synced in parallel (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+
+
+def run_install(args) -> int:
+    packages = find_packages(args.packages)
+    missing = [p for p in packages if not p.is_file()]
+    if missing:
+        print(f"Error: Package not found: {missing[0]}")
+        return 1
+    if not packages:
+        print(f"Error: No .skill files found in {', '.join(args.packages)}")
+        return 1
+
+    target = Path(args.target).expanduser()
+    if args.dry_run:
+        print(f"Checking {len(packages)} package(s) against {target}")
+    else:
+        print(f"Syncing {len(packages)} package(s) into {target}")
+    print()
+
+    start = time.perf_counter()
+    results = sync_packages(packages, target, args.workers, args.dry_run)
+
+    # A package that failed to open still protects its skill from --prune
+    keep = {result['skill'] for result in results}
+    pruned = prune_skills(target, keep, args.dry_run) if args.prune else []
+    elapsed = time.perf_counter() - start
+
+    counts = {'installed': 0, 'updated': 0, 'unchanged': 0, 'error': 0}
+    for result in results:
+        counts[result['status']] += 1
+        if result['status'] == 'error':
+            print(f"   ✗ {result['package']}: {result['error']}")
+        elif result['status'] != 'unchanged':
+            print(f"   ✓ {result['skill']:<28} {result['status']}: {result['extracted']} extracted "
+                  f"({result['bytes'] / 1024:.1f} KB), {result['reused']} unchanged, {result['removed']} removed")
+    for skill_name in pruned:
+        print(f"   ✓ {skill_name:<28} pruned")
+
+    print()
+    summary = ', '.join(f"{count} {status}" for status, count in counts.items() if count)
+    if pruned:
+        summary += f", {len(pruned)} pruned"
+    if counts['error']:
+        print(f"❌ Sync finished with errors in {elapsed:.2f}s: {summary}")
+        return 1
+    print(f"✅ {'Dry run' if args.dry_run else 'Sync'} finished in {elapsed:.2f}s: {summary}")
+    return 0
+
+
+def main():
+    parser = create_parser(
+        description='Install or sync packaged .skill files, extracting only changed files',
+        epilog='Example: python install_skills.py dist --target ~/.claude/skills'
+    )
+
+    add_install_arguments(parser)
+
+    args = parse_args(parser)
+
+    return run_install(args)
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
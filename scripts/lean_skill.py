@@ -0,0 +1,211 @@
+"""
+Lean Skill Builder
+
+Builds the compact SKILL.md shipped by `package_skill.py --lean`: frontmatter,
+title, a one-paragraph summary and a table pointing into references/, with
+every long top-level section moved into a generated reference file. Claude
+loads the lean SKILL.md when the skill triggers and reads a moved section only
+when the task needs it.
+
+The transform depends only on SKILL.md and the names of the existing reference
+files, so it is deterministic and cached per skill in <skills dir>/.lean-cache/.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from context_budget import estimate_tokens
+from skill_model import SkillTree
+
+# Bump when the transform changes so cached builds are regenerated
+LEAN_VERSION = 1
+
+# Top-level sections up to this many tokens stay in SKILL.md
+INLINE_TOKENS = 100
+
+CACHE_DIR = '.lean-cache'
+
+H2_RE = re.compile(r'^##\s+(.+?)\s*#*\s*$')
+H3_RE = re.compile(r'^###\s+(.+?)\s*#*\s*$')
+POINTER_RE = re.compile(r'`(references/[^`]+\.md)`\s*[-–—:]?\s*(.*)')
+SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
+def split_top_sections(body: str) -> tuple[list[str], list[tuple[str, list[str]]]]:
+    """(lines before the first ## heading, [(## title, lines)]), ignoring headings in code fences"""
+    preamble, sections = [], []
+    current = preamble
+    in_fence = False
+    for line in body.splitlines():
+        if line.startswith('```'):
+            in_fence = not in_fence
+        match = None if in_fence else H2_RE.match(line)
+        if match:
+            current = []
+            sections.append((match.group(1), current))
+        else:
+            current.append(line)
+    return preamble, sections
+
+
+def first_paragraph(lines: list[str]) -> str:
+    """First run of plain text lines (not headings, fences, lists or bold labels)"""
+    paragraph = []
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not stripped.startswith(('#', '```', '-', '*', '|', '>')):
+            paragraph.append(stripped)
+        elif paragraph:
+            break
+    return ' '.join(paragraph)
+
+
+def without_first_paragraph(lines: list[str]) -> list[str]:
+    """Lines with the first_paragraph() run removed"""
+    start = end = None
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped and not stripped.startswith(('#', '```', '-', '*', '|', '>')):
+            start = index if start is None else start
+            end = index + 1
+        elif start is not None:
+            break
+    return lines if start is None else lines[:start] + lines[end:]
+
+
+def first_sentence(text: str, limit: int = 100) -> str:
+    sentence = text.split('. ', 1)[0].rstrip('.')
+    return sentence if len(sentence) <= limit else sentence[:limit - 1].rstrip() + '…'
+
+
+def promote_headings(lines: list[str]) -> str:
+    """Section text with subheadings raised one level, for a file whose title is the section heading"""
+    out = []
+    in_fence = False
+    for line in lines:
+        if line.startswith('```'):
+            in_fence = not in_fence
+        out.append(line[1:] if not in_fence and line.startswith('###') else line)
+    return '\n'.join(out).strip('\n')
+
+
+def is_pointer_section(lines: list[str]) -> bool:
+    """True for sections that only list references/ files (superseded by the contents table)"""
+    content = [line.strip() for line in lines if line.strip()]
+    return bool(content) and all(POINTER_RE.search(line) or line.endswith(':') for line in content) \
+        and any(POINTER_RE.search(line) for line in content)
+
+
+def table_cell(text: str) -> str:
+    return text.replace('|', '\\|')
+
+
+def lean_skill_md(content: str, reference_names: list[str]) -> tuple[str, dict]:
+    """(lean SKILL.md, {references/<file>.md: text}) for a SKILL.md
+
+    Returns the content unchanged with no references when no section is long
+    enough to move.
+    """
+    frontmatter, body = '', content
+    if content.startswith('---'):
+        parts = content.split('---', 2)
+        if len(parts) >= 3:
+            frontmatter, body = f'---{parts[1]}---\n', parts[2]
+
+    preamble, sections = split_top_sections(body)
+    existing = [f'references/{name}' for name in reference_names]
+    taken = set(existing)
+    descriptions = {}
+    for _, lines in sections:
+        for line in lines:
+            match = POINTER_RE.search(line)
+            if match and match.group(2):
+                descriptions.setdefault(match.group(1), match.group(2).strip())
+
+    # The summary stays in SKILL.md; drop it from its section so it is not shipped twice
+    summary = first_paragraph(preamble)
+    if not summary:
+        for index, (title, lines) in enumerate(sections):
+            summary = first_paragraph(lines)
+            if summary:
+                sections[index] = (title, without_first_paragraph(lines))
+                break
+
+    moved = {}
+    rows = []
+    kept = []
+    for title, lines in sections:
+        if not any(line.strip() for line in lines):
+            continue
+        text = '\n'.join(lines).strip('\n')
+        if is_pointer_section(lines):
+            continue
+        if estimate_tokens(text) <= INLINE_TOKENS:
+            kept.append(f'## {title}\n\n{text}\n')
+            continue
+        slug = SLUG_RE.sub('-', title.lower()).strip('-') or 'section'
+        rel, suffix = f'references/{slug}.md', 2
+        while rel in taken:
+            rel, suffix = f'references/{slug}-{suffix}.md', suffix + 1
+        taken.add(rel)
+        moved[rel] = f'# {title}\n\n{promote_headings(lines)}\n'
+        topics = [match.group(1) for match in map(H3_RE.match, lines) if match]
+        rows.append((title, ', '.join(topics) or first_sentence(first_paragraph(lines)), rel))
+
+    if not moved:
+        return content, {}
+
+    for rel in existing:
+        label = Path(rel).stem.replace('-', ' ').replace('_', ' ').capitalize()
+        rows.append((label, descriptions.get(rel, ''), rel))
+
+    title_lines = '\n'.join(preamble).strip('\n')
+
+    out = [frontmatter]
+    if title_lines:
+        out.append(f'\n{title_lines}\n')
+    if summary and not first_paragraph(preamble):
+        out.append(f'\n{summary}\n')
+    out.append('\n## Contents\n\n'
+               'Read the file for a topic before producing artifacts that depend on it.\n\n'
+               '| Topic | Covers | File |\n'
+               '|-------|--------|------|\n')
+    out.extend(f'| {table_cell(topic)} | {table_cell(covers)} | `{rel}` |\n' for topic, covers, rel in rows)
+    out.extend(f'\n{section}' for section in kept)
+    return ''.join(out), moved
+
+
+def lean_build(skill_path: Path, tree: SkillTree = None) -> dict:
+    """Lean SKILL.md and generated references for a skill, from the cache when SKILL.md is unchanged
+
+    Returns {'skill_md': str, 'references': {rel: text}, 'original_bytes': int, 'cached': bool}.
+    """
+    skill_path = Path(skill_path)
+    tree = tree if tree is not None else SkillTree(skill_path)
+    content = tree.read_bytes('SKILL.md')
+    names = tree.list_dir('references', suffix='.md')
+    key = hashlib.sha256(b'\0'.join([str(LEAN_VERSION).encode(), content, *(n.encode() for n in names)])).hexdigest()
+
+    cache_file = skill_path.parent / CACHE_DIR / f'{skill_path.name}.json'
+    try:
+        with open(cache_file, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('key') == key:
+            return {'skill_md': cached['skill_md'], 'references': cached['references'],
+                    'original_bytes': len(content), 'cached': True}
+    except (OSError, ValueError):
+        pass
+
+    skill_md, references = lean_skill_md(content.decode('utf-8'), names)
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        temp_path = cache_file.with_name(cache_file.name + '.tmp')
+        temp_path.write_text(json.dumps({'key': key, 'skill_md': skill_md, 'references': references}),
+                             encoding='utf-8')
+        os.replace(temp_path, cache_file)
+    except OSError:
+        pass  # Read-only skills directory: build without caching
+    return {'skill_md': skill_md, 'references': references, 'original_bytes': len(content), 'cached': False}
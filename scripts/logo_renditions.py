@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Logo Rendition Pipeline
+
+Renders the standard web sizes of a skill's assets/logo.png into
+assets/renditions/: favicons, app icons, 1x/2x/3x header logos and social
+cards.
+
+The source is decoded once (in draft mode where the format supports it) and
+every rendition comes off one progressive downscale chain: a shared working
+image is halved with a cheap box reduce while it is still more than twice the
+next size, and only the final step uses a high-quality filter. Outputs are kept
+in a content-addressed cache keyed by the source bytes, so unchanged logos are
+never decoded again. Skills are rendered in parallel.
+
+Requires Pillow (pip install Pillow).
+
+Usage:
+    python scripts/logo_renditions.py pro-sites
+    python scripts/logo_renditions.py --all --workers 8
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, optional_import, parse_args, run_cli
+
+import hashlib
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from design_tokens import parse_brand_from_skill_md
+from init_brand_skill import hex_to_rgb
+from logo_variants import file_sha256, same_content
+
+# (file name, kind, width, height, padding fraction)
+#   square - logo centered on a transparent square canvas
+#   canvas - logo centered on an opaque canvas in the brand's light color
+#   height - logo scaled to a fixed height, no canvas
+#   ico    - like square, saved as a multi-size .ico
+RENDITIONS = (
+    ('favicon-16.png', 'square', 16, 16, 0.0),
+    ('favicon-32.png', 'square', 32, 32, 0.0),
+    ('favicon.ico', 'ico', 48, 48, 0.0),
+    ('apple-touch-icon.png', 'square', 180, 180, 0.1),
+    ('icon-192.png', 'square', 192, 192, 0.1),
+    ('icon-512.png', 'square', 512, 512, 0.1),
+    ('logo-header.png', 'height', 0, 40, 0.0),
+    ('logo-header@2x.png', 'height', 0, 80, 0.0),
+    ('logo-header@3x.png', 'height', 0, 120, 0.0),
+    ('social-card.png', 'canvas', 1200, 630, 0.2),
+    ('social-square.png', 'canvas', 1080, 1080, 0.2),
+)
+
+ICO_SIZES = [(16, 16), (32, 32), (48, 48)]
+
+# Bump when rendering changes, to invalidate cached renditions
+RENDITION_VERSION = '1'
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'brand-skills' / 'renditions'
+
+RENDITIONS_DIR = 'renditions'
+
+
+def require_pillow():
+    Image = optional_import('PIL.Image')
+    if Image is None:
+        raise RuntimeError("Pillow is required. Install: pip install Pillow")
+    return Image
+
+
+def content_size(spec, source_size: tuple[int, int]) -> tuple[int, int]:
+    """Size of the scaled logo inside a rendition"""
+    _, kind, width, height, padding = spec
+    source_width, source_height = source_size
+    if kind == 'height':
+        scale = height / source_height
+    else:
+        scale = min(width * (1 - 2 * padding) / source_width, height * (1 - 2 * padding) / source_height)
+    return max(1, round(source_width * scale)), max(1, round(source_height * scale))
+
+
+def downscale_chain(Image, image, specs):
+    """Yield (spec, scaled logo) from largest to smallest along one shared chain
+
+    `image` must be premultiplied ('RGBa') so transparent edges don't bleed
+    dark fringes into the resampled pixels.
+    """
+    working = image
+    for spec in sorted(specs, key=lambda s: -max(content_size(s, image.size))):
+        width, height = content_size(spec, image.size)
+        # Box-reduce the shared image while it stays at least 2x the target,
+        # so the LANCZOS step below always works on a small input
+        while working.width // 2 >= 2 * width and working.height // 2 >= 2 * height:
+            working = working.reduce(2)
+        yield spec, working.resize((width, height), Image.LANCZOS)
+
+
+def compose(Image, spec, logo, background):
+    """Place a scaled (RGBa) logo on the rendition's canvas; returns an RGBA image"""
+    _, kind, width, height, _ = spec
+    logo = logo.convert('RGBA')
+    if kind == 'height':
+        return logo
+    fill = (*background, 255) if kind == 'canvas' else (0, 0, 0, 0)
+    canvas = Image.new('RGBA', (width, height), fill)
+    canvas.alpha_composite(logo, ((width - logo.width) // 2, (height - logo.height) // 2))
+    return canvas
+
+
+def cache_path(cache_dir: Path, source_hash: str, spec, background) -> Path:
+    key = hashlib.sha256(f'{RENDITION_VERSION}:{source_hash}:{spec}:{background}'.encode()).hexdigest()
+    return cache_dir / key[:2] / f'{key}{Path(spec[0]).suffix}'
+
+
+def save_rendition(image, spec, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(path.name + '.tmp')
+    if spec[1] == 'ico':
+        image.save(temp, format='ICO', sizes=ICO_SIZES)
+    else:
+        image.save(temp, format='PNG', optimize=True)
+    os.replace(temp, path)
+
+
+def render_skill(skill_path: Path, cache_dir: Path, specs=RENDITIONS) -> dict:
+    """Bring assets/renditions/ of one skill up to date
+
+    Returns counts of renditions 'rendered', served from 'cached' and 'written'
+    to the skill (the rest were already current).
+    """
+    source = skill_path / 'assets' / 'logo.png'
+    source_hash = file_sha256(source)
+
+    colors = parse_brand_from_skill_md(skill_path / 'SKILL.md')['colors'] if (skill_path / 'SKILL.md').exists() else {}
+    background = hex_to_rgb(colors.get('light', '#FFFFFF'))
+
+    cached = {spec[0]: cache_path(cache_dir, source_hash, spec, background) for spec in specs}
+    missing = [spec for spec in specs if not cached[spec[0]].exists()]
+
+    if missing:
+        Image = require_pillow()
+        with Image.open(source) as image:
+            # Lets JPEG sources decode at reduced scale; no-op for PNG
+            largest = max((content_size(spec, image.size) for spec in missing), key=max)
+            image.draft('RGB', (largest[0] * 2, largest[1] * 2))
+            working = image.convert('RGBA').convert('RGBa')
+        for spec, logo in downscale_chain(Image, working, missing):
+            save_rendition(compose(Image, spec, logo, background), spec, cached[spec[0]])
+
+    output_dir = skill_path / 'assets' / RENDITIONS_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for name, path in cached.items():
+        destination = output_dir / name
+        if not same_content(path, destination):
+            shutil.copyfile(path, destination)
+            written += 1
+
+    return {'rendered': len(missing), 'cached': len(specs) - len(missing), 'written': written}
+
+
+def _render_job(job):
+    skill_path, cache_dir = job
+    try:
+        return skill_path, render_skill(skill_path, cache_dir), ''
+    except Exception as e:
+        return skill_path, None, str(e)
+
+
+def main():
+    parser = create_parser(
+        description="Render favicon, header and social sizes of a skill's logo",
+        epilog='Example: python logo_renditions.py --all --workers 8'
+    )
+
+    parser.add_argument('skill_name', nargs='?', help='Skill directory name (e.g., "pro-sites")')
+    parser.add_argument('--all', action='store_true', help='Render every skill with an assets/logo.png')
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR),
+                        help=f'Rendition cache directory (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--workers', type=int, help='Skills rendered in parallel (default: CPU count)')
+
+    args = parse_args(parser)
+
+    try:
+        require_pillow()
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    base_path = Path(args.path)
+    if args.all:
+        skills = sorted(p for p in base_path.iterdir() if (p / 'assets' / 'logo.png').is_file()) if base_path.is_dir() else []
+    elif args.skill_name:
+        skills = [base_path / args.skill_name]
+        if not (skills[0] / 'assets' / 'logo.png').is_file():
+            print(f"Error: No assets/logo.png in {skills[0]}")
+            return 1
+    else:
+        parser.print_help()
+        return 1
+
+    jobs = [(skill_path, Path(args.cache_dir)) for skill_path in skills]
+    if len(jobs) > 1 and args.workers != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            results = list(executor.map(_render_job, jobs))
+    else:
+        results = [_render_job(job) for job in jobs]
+
+    failed = []
+    for skill_path, counts, error in results:
+        if error:
+            print(f"❌ {skill_path.name}: {error}")
+            failed.append(skill_path.name)
+        else:
+            print(f"✅ {skill_path.name}: {counts['rendered']} rendered, {counts['cached']} cached, "
+                  f"{counts['written']} written to assets/{RENDITIONS_DIR}/")
+
+    print()
+    print(f"✓ {len(results) - len(failed)} skill(s) up to date")
+    if failed:
+        print(f"✗ Failed: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Logo Variant Generator
+
+Generates color variants of a skill's SVG logo (white, monochrome, inverted)
+so hand-maintained copies like logo-white.svg can't drift from logo.svg.
+
+SVGs are streamed through a SAX filter that rewrites fill/stroke/stop-color
+attributes, inline style declarations and <style> sheets on the way to the
+output file, so even large illustrations are never held in memory as a DOM.
+Variants are cached by a hash of the source file and the variant settings;
+unchanged logos are not re-rendered.
+
+Usage:
+    python scripts/logo_variants.py pro-sites
+    python scripts/logo_variants.py pro-sites --variants white inverted
+    python scripts/logo_variants.py pro-sites --variants monochrome --mono-color primary
+    python scripts/logo_variants.py --all --check     # CI: fail if any variant is stale
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import hashlib
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from color_space import hex_to_rgb, rgb_to_hex
+from css_colors import CSS_NAMED_COLORS
+from design_tokens import NEUTRAL_COLORS, parse_brand_from_skill_md
+
+VARIANTS = ('white', 'monochrome', 'inverted')
+
+# Bump when the output for a given input changes, to invalidate cached variants
+GENERATOR_VERSION = '1'
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'brand-skills' / 'logo-variants'
+
+COLOR_PROPERTIES = ('fill', 'stroke', 'stop-color', 'flood-color', 'lighting-color', 'color')
+
+STYLE_COLOR_RE = re.compile(r'(?P<prop>(?<![\w-])(?:' + '|'.join(COLOR_PROPERTIES) + r'))(?P<sep>\s*:\s*)(?P<value>[^;}"\']+)')
+
+RGB_FUNCTION_RE = re.compile(r'^rgba?\(\s*([\d.]+%?)[\s,]+([\d.]+%?)[\s,]+([\d.]+%?)')
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def variant_mapper(variant: str, mono_color: str = '#000000'):
+    """Function mapping a #RRGGBB color to its color in the variant"""
+    if variant == 'white':
+        return lambda hex_color: '#FFFFFF'
+    if variant == 'monochrome':
+        return lambda hex_color: mono_color.upper()
+    if variant == 'inverted':
+        return lambda hex_color: rgb_to_hex(255 - c for c in hex_to_rgb(hex_color))
+    raise ValueError(f"Unknown variant: {variant}")
+
+
+def parse_color(value: str):
+    """#RRGGBB for a CSS/SVG color value, or None for none/url()/currentColor/..."""
+    value = value.strip()
+    if value.startswith('#') and len(value) in (4, 5, 7, 9):
+        try:
+            rgb = hex_to_rgb(value[:4] if len(value) in (4, 5) else value[:7])
+        except ValueError:
+            return None
+        return rgb_to_hex(rgb)
+    match = RGB_FUNCTION_RE.match(value)
+    if match:
+        channels = [float(c[:-1]) * 2.55 if c.endswith('%') else float(c) for c in match.groups()]
+        return rgb_to_hex(min(255, c) for c in channels)
+    return CSS_NAMED_COLORS.get(value.lower())
+
+
+class ColorRewriter:
+    """Rewrites color values in attributes and CSS text through a mapping"""
+
+    def __init__(self, mapper):
+        self.mapper = mapper
+        self._values = {}
+
+    def value(self, value: str) -> str:
+        # Illustrations reuse a handful of colors across thousands of shapes
+        if value not in self._values:
+            hex_color = parse_color(value)
+            self._values[value] = value if hex_color is None else self.mapper(hex_color)
+        return self._values[value]
+
+    def css(self, text: str) -> str:
+        return STYLE_COLOR_RE.sub(lambda m: m['prop'] + m['sep'] + self.value(m['value']), text)
+
+
+def make_svg_filter(out, rewriter: ColorRewriter):
+    """SAX handler that writes a recolored copy of the parsed SVG to out"""
+    from xml.sax.saxutils import XMLGenerator
+
+    class RecolorHandler(XMLGenerator):
+        def __init__(self):
+            super().__init__(out, encoding='utf-8', short_empty_elements=True)
+            self.depth = 0
+            self.style_text = None
+
+        def startElement(self, name, attrs):
+            local = name.rsplit(':', 1)[-1]
+            rewritten = {}
+            for key, value in attrs.items():
+                if key in COLOR_PROPERTIES:
+                    value = rewriter.value(value)
+                elif key == 'style':
+                    value = rewriter.css(value)
+                rewritten[key] = value
+
+            # Shapes without a fill inherit black; pin the root fill so the variant applies to them too
+            if self.depth == 0 and local == 'svg' and 'fill' not in rewritten:
+                rewritten['fill'] = rewriter.mapper('#000000')
+
+            self.depth += 1
+            super().startElement(name, rewritten)
+            if local == 'style':
+                self.style_text = []
+
+        def characters(self, content):
+            if self.style_text is not None:
+                # Buffered: a CSS declaration may arrive split across several calls
+                self.style_text.append(content)
+            else:
+                super().characters(content)
+
+        def endElement(self, name):
+            if self.style_text is not None:
+                super().characters(rewriter.css(''.join(self.style_text)))
+                self.style_text = None
+            self.depth -= 1
+            super().endElement(name)
+
+    return RecolorHandler()
+
+
+def recolor_svg(source: Path, destination: Path, mapper):
+    """Stream source through the recolor filter into destination (atomically)"""
+    import xml.sax
+
+    temp = destination.with_name(destination.name + '.tmp')
+    try:
+        with open(temp, 'w', encoding='utf-8') as out:
+            parser = xml.sax.make_parser()
+            # Never fetch external DTDs or entities
+            parser.setFeature(xml.sax.handler.feature_external_ges, False)
+            parser.setFeature(xml.sax.handler.feature_external_pes, False)
+            parser.setContentHandler(make_svg_filter(out, ColorRewriter(mapper)))
+            parser.parse(str(source))
+            out.write('\n')
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+    os.replace(temp, destination)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def same_content(a: Path, b: Path) -> bool:
+    """True if both files hold the same bytes; compared in chunks so large files are never loaded whole"""
+    if not b.exists() or a.stat().st_size != b.stat().st_size:
+        return False
+    with open(a, 'rb') as fa, open(b, 'rb') as fb:
+        while True:
+            chunk = fa.read(HASH_CHUNK_SIZE)
+            if chunk != fb.read(HASH_CHUNK_SIZE):
+                return False
+            if not chunk:
+                return True
+
+
+def cached_variant(source: Path, source_hash: str, variant: str, mono_color: str, cache_dir: Path) -> tuple[Path, bool]:
+    """Path of the cached variant, generating it on a miss; returns (path, was_cached)"""
+    key = hashlib.sha256(f'{GENERATOR_VERSION}:{variant}:{mono_color}:{source_hash}'.encode()).hexdigest()
+    path = cache_dir / f'{key}.svg'
+    if path.exists():
+        return path, True
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    recolor_svg(source, path, variant_mapper(variant, mono_color))
+    return path, False
+
+
+def generate_variants(skill_path: Path, variants, mono_color: str, cache_dir: Path,
+                      check: bool = False) -> list[tuple[str, str]]:
+    """Bring assets/logo-<variant>.svg in sync with assets/logo.svg
+
+    Returns [(file name, status)] where status is 'updated', 'up to date' or,
+    with check=True, 'stale' (nothing is written).
+    """
+    source = skill_path / 'assets' / 'logo.svg'
+    source_hash = file_sha256(source)
+
+    results = []
+    for variant in variants:
+        destination = source.with_name(f'logo-{variant}.svg')
+        cached, _ = cached_variant(source, source_hash, variant, mono_color, cache_dir)
+        if same_content(cached, destination):
+            results.append((destination.name, 'up to date'))
+        elif check:
+            results.append((destination.name, 'stale'))
+        else:
+            shutil.copyfile(cached, destination)
+            results.append((destination.name, 'updated'))
+    return results
+
+
+def main():
+    parser = create_parser(
+        description="Generate white, monochrome and inverted variants of a skill's SVG logo",
+        epilog='Example: python logo_variants.py pro-sites --variants white inverted'
+    )
+
+    parser.add_argument('skill_name', nargs='?', help='Skill directory name (e.g., "pro-sites")')
+    parser.add_argument('--all', action='store_true', help='Process every skill with an assets/logo.svg')
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--variants', nargs='+', choices=VARIANTS, default=list(VARIANTS),
+                        help='Variants to generate (default: all)')
+    parser.add_argument('--mono-color', default='dark',
+                        help='Monochrome color: brand role or hex (default: dark)')
+    parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR),
+                        help=f'Variant cache directory (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--check', action='store_true',
+                        help='Report stale variants and exit 1 instead of writing them')
+
+    args = parse_args(parser)
+
+    base_path = Path(args.path)
+    if args.all:
+        skills = sorted(p for p in base_path.iterdir() if (p / 'assets' / 'logo.svg').is_file()) if base_path.is_dir() else []
+    elif args.skill_name:
+        skills = [base_path / args.skill_name]
+        if not (skills[0] / 'assets' / 'logo.svg').is_file():
+            print(f"Error: No assets/logo.svg in {skills[0]}")
+            return 1
+    else:
+        parser.print_help()
+        return 1
+
+    failed = False
+    for skill_path in skills:
+        colors = dict(NEUTRAL_COLORS)
+        if (skill_path / 'SKILL.md').exists():
+            colors.update(parse_brand_from_skill_md(skill_path / 'SKILL.md')['colors'])
+        mono_color = parse_color(colors.get(args.mono_color.lower(), args.mono_color))
+        if mono_color is None:
+            print(f"Error: Invalid --mono-color for {skill_path.name}: {args.mono_color}")
+            return 1
+
+        print(f"{skill_path.name}:")
+        try:
+            results = generate_variants(skill_path, args.variants, mono_color, Path(args.cache_dir), args.check)
+        except Exception as e:
+            print(f"  ❌ Failed: {e}")
+            failed = True
+            continue
+        for name, status in results:
+            mark = '❌' if status == 'stale' else '✅'
+            print(f"  {mark} {name}: {status}")
+            failed = failed or status == 'stale'
+
+    if args.check and failed:
+        print()
+        print("Run without --check to regenerate stale variants.")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
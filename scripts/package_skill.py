@@ -8,49 +8,61 @@ Usage:
     python scripts/package_skill.py pro-sites
     python scripts/package_skill.py pro-sites --output custom-output-dir
     python scripts/package_skill.py --all
+    python scripts/package_skill.py --all --lean
 """
 
-import argparse
+# Imported first so --timing can measure the imports below
+from cli_runtime import PHASES, create_parser, non_negative_int, parse_args, run_cli
+
 import os
 import sys
-import zipfile
+import time
 from pathlib import Path
-from datetime import datetime
+
+from skill_model import SkillTree, iter_trees
+
+DEFAULT_EXCLUDE_PATTERNS = [
+    '.placeholder',
+    '__pycache__',
+    '.pyc',
+    '.DS_Store',
+    '.git',
+    'node_modules',
+    '.vscode',
+    '.idea'
+]
 
 
-def validate_skill_structure(skill_path: Path) -> tuple[bool, list[str]]:
+def validate_skill_structure(skill_path: Path, tree: SkillTree = None) -> tuple[bool, list[str]]:
     """Validate skill has required structure"""
     errors = []
+    tree = tree if tree is not None else SkillTree(skill_path)
 
     # Check SKILL.md exists
-    skill_md = skill_path / 'SKILL.md'
-    if not skill_md.exists():
+    if not tree.is_file('SKILL.md'):
         errors.append(f"Missing required file: SKILL.md")
         return False, errors
 
     # Check SKILL.md has YAML frontmatter
     try:
-        with open(skill_md, 'r') as f:
-            content = f.read()
-            if not content.startswith('---'):
-                errors.append("SKILL.md missing YAML frontmatter (must start with '---')")
-
-            # Check for required fields
-            if 'name:' not in content[:500]:
-                errors.append("SKILL.md frontmatter missing 'name:' field")
-            if 'description:' not in content[:500]:
-                errors.append("SKILL.md frontmatter missing 'description:' field")
+        content = tree.read_text('SKILL.md')
+        if not content.startswith('---'):
+            errors.append("SKILL.md missing YAML frontmatter (must start with '---')")
+
+        # Check for required fields
+        if 'name:' not in content[:500]:
+            errors.append("SKILL.md frontmatter missing 'name:' field")
+        if 'description:' not in content[:500]:
+            errors.append("SKILL.md frontmatter missing 'description:' field")
     except Exception as e:
         errors.append(f"Error reading SKILL.md: {str(e)}")
         return False, errors
 
     # Check required directories
-    assets_dir = skill_path / 'assets'
-    if not assets_dir.exists():
+    if not tree.is_dir('assets'):
         errors.append("Missing required directory: assets/")
 
-    references_dir = skill_path / 'references'
-    if not references_dir.exists():
+    if not tree.is_dir('references'):
         errors.append("Missing required directory: references/")
 
     if errors:
@@ -59,6 +71,29 @@ def validate_skill_structure(skill_path: Path) -> tuple[bool, list[str]]:
     return True, []
 
 
+class TimedWriter:
+    """File wrapper that attributes time spent in write() to the 'package.write' phase
+
+    zipfile compresses and writes inside one writestr() call; timing the writes
+    separately lets the packager report compression and I/O apart.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.seconds = 0.0
+
+    def write(self, data):
+        start = time.perf_counter()
+        written = self.raw.write(data)
+        elapsed = time.perf_counter() - start
+        self.seconds += elapsed
+        PHASES.add('package.write', elapsed)
+        return written
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+
 def should_exclude(file_path: str, exclude_patterns: list[str]) -> bool:
     """Check if file should be excluded from package"""
     file_path = file_path.lower()
@@ -70,8 +105,15 @@ def should_exclude(file_path: str, exclude_patterns: list[str]) -> bool:
     return False
 
 
-def package_skill(skill_path: Path, output_dir: Path, exclude_patterns: list[str]) -> tuple[bool, str]:
-    """Package a skill into a .skill file"""
+def package_skill(skill_path: Path, output_dir: Path, exclude_patterns: list[str],
+                  tree: SkillTree = None, lean: bool = False) -> tuple[bool, str]:
+    """Package a skill into a .skill file
+
+    Pass the SkillTree used for validation to reuse its directory walk and any
+    file contents it already read. With lean=True the package ships a compact
+    SKILL.md whose long sections are moved into references/ (see lean_skill.py).
+    """
+    tree = tree if tree is not None else SkillTree(skill_path)
 
     skill_name = skill_path.name
     output_file = output_dir / f"{skill_name}.skill"
@@ -83,7 +125,7 @@ def package_skill(skill_path: Path, output_dir: Path, exclude_patterns: list[str
 
     # Validate structure
     print("Validating skill structure...")
-    valid, errors = validate_skill_structure(skill_path)
+    valid, errors = validate_skill_structure(skill_path, tree)
 
     if not valid:
         print("❌ Validation failed:")
@@ -97,41 +139,94 @@ def package_skill(skill_path: Path, output_dir: Path, exclude_patterns: list[str
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # zipfile is only needed once validation passes; keep it out of startup
+    import zipfile
+
+    build = None
+    if lean:
+        from lean_skill import lean_build
+        build = lean_build(skill_path, tree)
+
     # Create zip file
     print("Creating package...")
     file_count = 0
 
     try:
-        with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through skill directory
-            for root, dirs, files in os.walk(skill_path):
-                # Filter out excluded directories
-                dirs[:] = [d for d in dirs if not should_exclude(d, exclude_patterns)]
-
-                for file in files:
-                    file_path = Path(root) / file
-
-                    # Check if file should be excluded
-                    rel_path = file_path.relative_to(skill_path.parent)
-                    if should_exclude(str(rel_path), exclude_patterns):
-                        print(f"   Skipping: {rel_path}")
-                        continue
-
-                    # Add to zip
-                    arcname = rel_path
-                    zipf.write(file_path, arcname)
+        with open(output_file, 'wb') as raw, zipfile.ZipFile(TimedWriter(raw), 'w', zipfile.ZIP_DEFLATED) as zipf:
+            out = zipf.fp
+            # Files come from the tree's single walk, in walk order
+            for rel, file_stat in tree.files.items():
+                # Skip files below excluded directories
+                if any(should_exclude(d, exclude_patterns) for d in rel.split('/')[:-1]):
+                    continue
+
+                # Check if file should be excluded
+                arcname = f"{skill_name}/{rel}"
+                if should_exclude(arcname, exclude_patterns):
+                    print(f"   Skipping: {Path(arcname)}")
+                    continue
+
+                # Add to zip, reusing the cached stat for the member header
+                zinfo = zipfile.ZipInfo(arcname, time.localtime(file_stat.st_mtime)[:6])
+                zinfo.external_attr = (file_stat.st_mode & 0xFFFF) << 16
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                zinfo.file_size = file_stat.st_size
+                chunks = tree.iter_chunks(rel)
+                if build is not None and rel == 'SKILL.md':
+                    chunks = [build['skill_md'].encode('utf-8')]
+                    zinfo.file_size = len(chunks[0])
+
+                # Contents already read during validation come from memory; the rest is
+                # streamed in chunks, so large assets never sit in memory whole. Writes
+                # are timed by TimedWriter, the remainder is compression.
+                start, written = time.perf_counter(), out.seconds
+                with zipf.open(zinfo, 'w') as dest:
+                    for chunk in chunks:
+                        dest.write(chunk)
+                PHASES.add('package.compress', time.perf_counter() - start - (out.seconds - written))
+                file_count += 1
+
+            # Sections moved out of a lean SKILL.md, dated like SKILL.md so builds are reproducible
+            if build is not None:
+                skill_md_stat = tree.stat('SKILL.md')
+                for rel, text in build['references'].items():
+                    zinfo = zipfile.ZipInfo(f"{skill_name}/{rel}", time.localtime(skill_md_stat.st_mtime)[:6])
+                    zinfo.external_attr = (skill_md_stat.st_mode & 0xFFFF) << 16
+                    zipf.writestr(zinfo, text.encode('utf-8'), zipfile.ZIP_DEFLATED)
                     file_count += 1
 
         print()
         print(f"✅ Package created: {output_file}")
         print(f"   Files included: {file_count}")
         print(f"   Size: {output_file.stat().st_size / 1024:.1f} KB")
-        return True, str(output_file)
-
+        if build is not None:
+            print_lean_report(build)
     except Exception as e:
         print(f"❌ Error creating package: {str(e)}")
         return False, str(output_file)
 
+    # Only pays for sqlite3 when the skills directory has a registry
+    from brand_registry import record_packaged
+    record_packaged(skill_path, output_file, tree)
+    return True, str(output_file)
+
+
+def print_lean_report(build: dict):
+    """Print what the lean SKILL.md saves over the original"""
+    from context_budget import estimate_tokens
+
+    lean_bytes = len(build['skill_md'].encode('utf-8'))
+    original = build['original_bytes']
+    source = ' (cached)' if build['cached'] else ''
+    if not build['references']:
+        print(f"   Lean SKILL.md: already compact, shipped unchanged ({original:,} bytes){source}")
+        return
+    saved = original - lean_bytes
+    print(f"   Lean SKILL.md: {original:,} → {lean_bytes:,} bytes "
+          f"({saved:,} saved, {saved / original:.0%}){source}")
+    print(f"   • Loaded on trigger: ~{estimate_tokens(build['skill_md']):,} tokens")
+    print(f"   • Moved to references/: {', '.join(rel.split('/', 1)[1] for rel in build['references'])}")
+
 
 def list_skills(base_path: Path) -> list[Path]:
     """List all skill directories"""
@@ -140,19 +235,17 @@ def list_skills(base_path: Path) -> list[Path]:
     if not base_path.exists():
         return skills
 
-    for item in base_path.iterdir():
-        if item.is_dir() and (item / 'SKILL.md').exists():
-            skills.append(item)
+    # scandir knows which entries are directories without a stat() per entry
+    with os.scandir(base_path) as entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, 'SKILL.md')):
+                skills.append(base_path / entry.name)
 
     return sorted(skills)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Package brand skills into distributable .skill files',
-        epilog='Example: python package_skill.py pro-sites'
-    )
-
+def add_package_arguments(parser):
+    """Register packaging arguments (shared with brandctl package/pipeline)"""
     parser.add_argument(
         'skill_name',
         nargs='?',
@@ -180,71 +273,59 @@ def main():
     parser.add_argument(
         '--exclude',
         nargs='*',
-        default=[
-            '.placeholder',
-            '__pycache__',
-            '.pyc',
-            '.DS_Store',
-            '.git',
-            'node_modules',
-            '.vscode',
-            '.idea'
-        ],
+        default=DEFAULT_EXCLUDE_PATTERNS,
         help='Patterns to exclude from package'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--lean',
+        action='store_true',
+        help='Ship a compact SKILL.md with long sections moved into references/'
+    )
+
+    parser.add_argument(
+        '--io-workers',
+        type=non_negative_int,
+        default=0,
+        metavar='N',
+        help='Load skills with N concurrent filesystem operations, for skills on NFS/SMB (default: off)'
+    )
 
+
+def resolve_skills(args, parser) -> list[Path]:
+    """Return the skill directories selected by skill_name/--all, or None on error"""
     # Validate arguments
     if not args.skill_name and not args.all:
         parser.print_help()
         print("\nError: Must specify skill_name or --all")
-        return 1
+        return None
 
     base_path = Path(args.path)
-    output_dir = Path(args.output)
 
     if not base_path.exists():
         print(f"Error: Skills directory not found: {base_path}")
-        return 1
+        return None
 
     # Get skills to package
     if args.all:
         skills = list_skills(base_path)
         if not skills:
             print(f"No skills found in {base_path}")
-            return 1
+            return None
         print(f"Found {len(skills)} skill(s) to package")
         print()
     else:
         skill_path = base_path / args.skill_name
         if not skill_path.exists():
             print(f"Error: Skill not found: {skill_path}")
-            return 1
+            return None
         skills = [skill_path]
 
-    # Package skills
-    print("=" * 70)
-    print("BRAND SKILL PACKAGER")
-    print("=" * 70)
-    print()
-
-    successful = []
-    failed = []
-
-    for skill_path in skills:
-        success, output_file = package_skill(skill_path, output_dir, args.exclude)
-
-        if success:
-            successful.append(output_file)
-        else:
-            failed.append(skill_path.name)
+    return skills
 
-        print()
-        print("-" * 70)
-        print()
 
-    # Summary
+def print_packaging_summary(successful: list[str], failed: list[str]):
+    """Print the end-of-run summary and install hints"""
     print("=" * 70)
     print("PACKAGING SUMMARY")
     print("=" * 70)
@@ -268,12 +349,71 @@ def main():
         print(f"   unzip {successful[0]} -d /tmp/test/")
     print("2. Install the skill:")
     if successful:
-        print(f"   unzip {successful[0]} -d ~/.claude/skills/")
+        print(f"   python scripts/install_skills.py {successful[0]}")
     print("3. Use the skill in your projects")
     print()
 
+
+def update_search_index(base_path: Path):
+    """Bring the skill search index up to date after a packaging run"""
+    from skill_search import build_index
+
+    # The index is derived data; a failure here must not fail a packaging run that already wrote its archives
+    try:
+        counts = build_index(base_path)
+    except Exception as e:
+        print(f"⚠ Could not update search index: {e}")
+        return
+    print(f"✓ Search index updated: {counts['indexed']} re-indexed, {counts['reused']} unchanged")
+
+
+def run_package(args, parser) -> int:
+    """Package the selected skills and return an exit code"""
+    skills = resolve_skills(args, parser)
+    if skills is None:
+        return 1
+
+    output_dir = Path(args.output)
+
+    # Package skills
+    print("=" * 70)
+    print("BRAND SKILL PACKAGER")
+    print("=" * 70)
+    print()
+
+    successful = []
+    failed = []
+
+    for skill_path, tree in iter_trees(skills, args.io_workers):
+        success, output_file = package_skill(skill_path, output_dir, args.exclude, tree=tree, lean=args.lean)
+
+        if success:
+            successful.append(output_file)
+        else:
+            failed.append(skill_path.name)
+
+        print()
+        print("-" * 70)
+        print()
+
+    print_packaging_summary(successful, failed)
+    update_search_index(Path(args.path))
+
     return 0 if not failed else 1
 
 
+def main():
+    parser = create_parser(
+        description='Package brand skills into distributable .skill files',
+        epilog='Example: python package_skill.py pro-sites'
+    )
+
+    add_package_arguments(parser)
+
+    args = parse_args(parser)
+
+    return run_package(args, parser)
+
+
 if __name__ == '__main__':
-    sys.exit(main())
+    sys.exit(run_cli(main))
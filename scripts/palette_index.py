@@ -0,0 +1,134 @@
+"""
+Brand Palette Index
+
+Nearest-brand-color lookups in CIELAB, built once from a skill's declared colors.
+
+Single colors (CSS values, SVG fills) are answered in pure Python and cached.
+Pixel batches go through a precomputed 3D grid over quantized RGB: every grid
+cell stores the index of its nearest palette color, so snapping an image is one
+NumPy indexing operation regardless of palette size. `exact=True` instead
+resolves each distinct pixel color exactly, which is still vectorized over the
+unique colors rather than palette x pixels.
+
+Distances are CIE76 by default; pass metric='cie94' or 'ciede2000' for the
+more perceptual color differences from color_space.
+"""
+
+import re
+from pathlib import Path
+
+from cli_runtime import optional_import
+from color_space import delta_e, delta_e_array, hex_to_lab, hex_to_rgb, rgb_array_to_lab, rgb_to_hex
+from design_tokens import parse_brand_content
+
+# Bits per RGB channel of the lookup grid: 6 -> 64^3 cells, max error ~1.5/255 per channel
+GRID_BITS = 6
+
+# Max delta E from the nearest brand color before a color counts as off-palette
+OFF_PALETTE_DELTA_E = 5.0
+
+# Always acceptable alongside a brand palette (knockout and single-color variants)
+BASE_NEUTRALS = {'White': '#FFFFFF', 'Black': '#000000'}
+
+DECLARED_HEX_RE = re.compile(r'`(#[0-9A-Fa-f]{6})`')
+
+
+class PaletteIndex:
+    """Nearest-color index over a named brand palette"""
+
+    def __init__(self, colors: dict[str, str], metric: str = 'cie76'):
+        self.metric = metric
+        self.names = list(colors)
+        self.hexes = [colors[name].upper() for name in self.names]
+        self.labs = [hex_to_lab(h) for h in self.hexes]
+        self._nearest_cache = {}
+        self._grids = {}
+        self._palette_rgb = None
+
+    @classmethod
+    def from_skill_content(cls, content: str, metric: str = 'cie76') -> 'PaletteIndex':
+        """Palette of a SKILL.md: named role colors plus every other declared hex code"""
+        colors = {role.capitalize(): hex_color for role, hex_color in parse_brand_content(content)['colors'].items()}
+        known = {h.upper() for h in colors.values()}
+        for hex_color in DECLARED_HEX_RE.findall(content):
+            if hex_color.upper() not in known:
+                known.add(hex_color.upper())
+                colors[hex_color.upper()] = hex_color
+        return cls(colors, metric)
+
+    @classmethod
+    def from_skill(cls, skill_path: Path, metric: str = 'cie76') -> 'PaletteIndex':
+        with open(Path(skill_path) / 'SKILL.md', 'r') as f:
+            return cls.from_skill_content(f.read(), metric)
+
+    @property
+    def colors(self) -> dict[str, str]:
+        """Palette as name -> hex"""
+        return dict(zip(self.names, self.hexes))
+
+    def __len__(self):
+        return len(self.names)
+
+    def nearest(self, color) -> tuple[str, str, float]:
+        """Nearest palette color to a hex string or (r, g, b): (name, hex, delta E)"""
+        key = color.upper() if isinstance(color, str) else tuple(color)
+        if key not in self._nearest_cache:
+            lab = hex_to_lab(key) if isinstance(key, str) else hex_to_lab(rgb_to_hex(key))
+            distances = [delta_e(palette_lab, lab, self.metric) for palette_lab in self.labs]
+            i = min(range(len(distances)), key=distances.__getitem__)
+            self._nearest_cache[key] = (self.names[i], self.hexes[i], distances[i])
+        return self._nearest_cache[key]
+
+    def index_dtype(self):
+        """Smallest unsigned integer dtype holding every palette index"""
+        np = optional_import('numpy')
+        return np.uint8 if len(self.labs) <= 0x100 else np.uint16 if len(self.labs) <= 0x10000 else np.uint32
+
+    def _argmin_lab(self, lab):
+        """Index of the nearest palette color for each row of an (N, 3) Lab array"""
+        np = optional_import('numpy')
+        best = np.full(lab.shape[0], np.inf, dtype=np.float32)
+        index = np.zeros(lab.shape[0], dtype=self.index_dtype())
+        # Running minimum: memory stays O(N) however large the palette is
+        for i, palette_lab in enumerate(self.labs):
+            distance = delta_e_array(np.asarray(palette_lab, dtype=np.float32), lab, self.metric)
+            closer = distance < best
+            best[closer] = distance[closer]
+            index[closer] = i
+        return index
+
+    def grid(self, bits: int = GRID_BITS):
+        """(2^bits)^3 grid of nearest palette indices (see index_dtype()), built on first use"""
+        if bits not in self._grids:
+            np = optional_import('numpy')
+            size = 1 << bits
+            step = 256 / size
+            centers = np.arange(size, dtype=np.float32) * step + (step - 1) / 2
+            cells = np.stack(np.meshgrid(centers, centers, centers, indexing='ij'), axis=-1).reshape(-1, 3)
+            self._grids[bits] = self._argmin_lab(rgb_array_to_lab(cells)).reshape(size, size, size)
+        return self._grids[bits]
+
+    def nearest_indices(self, rgb, exact: bool = False, bits: int = GRID_BITS):
+        """Palette index for every pixel of an (..., 3) uint8 array"""
+        np = optional_import('numpy')
+        rgb = np.asarray(rgb, dtype=np.uint8)
+        if not exact:
+            shift = 8 - bits
+            return self.grid(bits)[rgb[..., 0] >> shift, rgb[..., 1] >> shift, rgb[..., 2] >> shift]
+
+        packed = (rgb[..., 0].astype(np.uint32) << 16) | (rgb[..., 1].astype(np.uint32) << 8) | rgb[..., 2]
+        unique, inverse = np.unique(packed.ravel(), return_inverse=True)
+        unique_rgb = np.stack([(unique >> 16) & 0xFF, (unique >> 8) & 0xFF, unique & 0xFF], axis=-1)
+        return self._argmin_lab(rgb_array_to_lab(unique_rgb))[inverse].reshape(packed.shape)
+
+    @property
+    def palette_rgb(self):
+        """(P, 3) uint8 array of palette colors"""
+        if self._palette_rgb is None:
+            np = optional_import('numpy')
+            self._palette_rgb = np.array([hex_to_rgb(h) for h in self.hexes], dtype=np.uint8)
+        return self._palette_rgb
+
+    def quantize(self, rgb, exact: bool = False):
+        """Snap every pixel of an (..., 3) uint8 array to its nearest palette color"""
+        return self.palette_rgb[self.nearest_indices(rgb, exact)]
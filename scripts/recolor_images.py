@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Batch Image Recoloring Engine
+
+Maps source palettes onto a skill's brand colors across whole directories of
+images. Color transforms are precomputed once as lookup tables and applied to
+entire image arrays with NumPy; files are spread across a process pool.
+
+Modes:
+    palette   Replace colors near each source color with a brand color. A 3D LUT
+              over quantized RGB maps every pixel to a palette entry in one
+              indexing operation; shading is kept by shifting, not flattening.
+    duotone   Map luminance onto a gradient between two brand colors using
+              per-channel 256-entry LUTs.
+    snap      Snap every pixel to the nearest brand color in CIELAB, via the
+              palette index's precomputed nearest-color grid.
+
+Requires NumPy and Pillow (pip install numpy Pillow).
+
+Usage:
+    python scripts/recolor_images.py photos/ --skill pro-sites --map "#FF0000=primary" --output branded/
+    python scripts/recolor_images.py photos/ --skill pro-sites --duotone dark primary --output branded/
+    python scripts/recolor_images.py photos/ --skill pro-sites --map "#E53935=secondary" --tolerance 60 --workers 8
+    python scripts/recolor_images.py icons/ --skill pro-sites --snap --output branded/
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, optional_import, parse_args, run_cli
+
+import os
+import sys
+import time
+from pathlib import Path
+
+from design_tokens import parse_brand_from_skill_md
+from init_brand_skill import hex_to_rgb, normalize_hex_color, validate_hex_color
+from palette_index import PaletteIndex
+from skill_model import iter_files
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.tif', '.tiff')
+
+# Bits per channel of the palette LUT: 6 -> 64^3 cells (256 KB of uint8 indices for palettes up to 256 colors)
+LUT_BITS = 6
+
+# LUT value meaning "leave this pixel unchanged"
+NO_MATCH = 255
+
+# Per-worker recolorer, built once by the pool initializer
+_worker_recolorer = None
+
+
+def require_modules():
+    """Return (numpy, PIL.Image) or raise with an install hint"""
+    np = optional_import('numpy')
+    image = optional_import('PIL.Image')
+    missing = [name for name, module in (('numpy', np), ('Pillow', image)) if module is None]
+    if missing:
+        raise RuntimeError(f"Missing required package(s): {', '.join(missing)}. Install: pip install {' '.join(missing)}")
+    return np, image
+
+
+def resolve_color(value: str, brand_colors: dict) -> str:
+    """Resolve a brand role name (e.g., "primary") or hex code to a normalized hex code"""
+    if value.lower() in brand_colors:
+        return brand_colors[value.lower()]
+    if validate_hex_color(value):
+        return normalize_hex_color(value)
+    raise ValueError(f"Unknown color '{value}' (use a hex code or one of: {', '.join(brand_colors)})")
+
+
+class PaletteRecolorer:
+    """Recolor pixels near source colors to target colors via a 3D LUT"""
+
+    def __init__(self, mapping: list[tuple[str, str]], tolerance: float, bits: int = LUT_BITS):
+        np, _ = require_modules()
+        if len(mapping) >= NO_MATCH:
+            raise ValueError(f"At most {NO_MATCH - 1} source colors are supported")
+
+        self.bits = bits
+        self.shift = 8 - bits
+        sources = np.array([hex_to_rgb(src) for src, _ in mapping], dtype=np.float32)
+        targets = np.array([hex_to_rgb(dst) for _, dst in mapping], dtype=np.float32)
+
+        # Shift each matched pixel by (target - source) so antialiasing and
+        # shading around the source color carry over to the brand color
+        self.offsets = (targets - sources).astype(np.int16)
+        self.lut = self._build_lut(np, sources, tolerance)
+
+    def _build_lut(self, np, sources, tolerance):
+        size = 1 << self.bits
+        step = 1 << self.shift
+        centers = np.arange(size, dtype=np.float32) * step + (step - 1) / 2
+
+        lut = np.empty((size, size, size), dtype=np.uint8)
+        tolerance_sq = float(tolerance) ** 2
+        gb = np.stack(np.meshgrid(centers, centers, indexing='ij'), axis=-1).reshape(-1, 2)
+
+        # One red plane at a time keeps the distance matrix small
+        for r_index, r in enumerate(centers):
+            cells = np.column_stack([np.full(len(gb), r, dtype=np.float32), gb])
+            dist_sq = ((cells[:, None, :] - sources[None, :, :]) ** 2).sum(axis=-1)
+            nearest = dist_sq.argmin(axis=1)
+            matched = dist_sq[np.arange(len(cells)), nearest] <= tolerance_sq
+            lut[r_index] = np.where(matched, nearest, NO_MATCH).reshape(size, size)
+
+        return lut
+
+    def apply(self, rgb):
+        """Recolor an (H, W, 3) uint8 array in place and return it"""
+        np, _ = require_modules()
+        s = self.shift
+        index = self.lut[rgb[..., 0] >> s, rgb[..., 1] >> s, rgb[..., 2] >> s]
+        matched = index != NO_MATCH
+        if matched.any():
+            shifted = rgb[matched].astype(np.int16) + self.offsets[index[matched]]
+            rgb[matched] = np.clip(shifted, 0, 255).astype(np.uint8)
+        return rgb
+
+
+class DuotoneRecolorer:
+    """Map luminance onto a shadow -> highlight brand gradient via per-channel LUTs"""
+
+    def __init__(self, shadow: str, highlight: str):
+        np, _ = require_modules()
+        t = np.linspace(0.0, 1.0, 256, dtype=np.float32)[:, None]
+        low = np.array(hex_to_rgb(shadow), dtype=np.float32)
+        high = np.array(hex_to_rgb(highlight), dtype=np.float32)
+        # (256, 3): one lookup per channel, indexed by luminance
+        self.lut = np.rint(low * (1 - t) + high * t).astype(np.uint8)
+
+    def apply(self, rgb):
+        np, _ = require_modules()
+        # Integer Rec. 601 luma: (77 R + 150 G + 29 B) / 256
+        channels = rgb.astype(np.uint16)
+        luma = (channels[..., 0] * 77 + channels[..., 1] * 150 + channels[..., 2] * 29) >> 8
+        rgb[...] = self.lut[luma]
+        return rgb
+
+
+class SnapRecolorer:
+    """Snap pixels to the nearest palette color (CIELAB)"""
+
+    def __init__(self, colors: dict[str, str], exact: bool = False):
+        self.index = PaletteIndex(colors)
+        self.exact = exact
+        if not exact:
+            # Build the nearest-color grid once per worker, not per image
+            self.index.grid()
+
+    def apply(self, rgb):
+        rgb[...] = self.index.quantize(rgb, exact=self.exact)
+        return rgb
+
+
+def build_recolorer(mode: str, params: dict):
+    if mode == 'snap':
+        return SnapRecolorer(params['colors'], params['exact'])
+    if mode == 'duotone':
+        return DuotoneRecolorer(params['shadow'], params['highlight'])
+    return PaletteRecolorer(params['mapping'], params['tolerance'])
+
+
+def _init_worker(mode: str, params: dict):
+    """Pool initializer: build the LUTs once per worker process"""
+    global _worker_recolorer
+    _worker_recolorer = build_recolorer(mode, params)
+
+
+def recolor_file(job: tuple[str, str]) -> tuple[str, int, str]:
+    """Recolor one image; returns (source, pixel count, error message)"""
+    source, destination = job
+    np, Image = require_modules()
+    try:
+        with Image.open(source) as img:
+            img_format = img.format
+            has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+            array = np.asarray(img.convert('RGBA' if has_alpha else 'RGB')).copy()
+
+        _worker_recolorer.apply(array[..., :3])
+
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        Image.fromarray(array).save(destination, format=img_format)
+        return source, array.shape[0] * array.shape[1], ''
+    except Exception as e:
+        return source, 0, str(e)
+
+
+def find_images(input_dir: Path):
+    """Yield image paths below input_dir"""
+    yield from iter_files(input_dir, IMAGE_EXTENSIONS)
+
+
+def recolor_directory(input_dir: Path, output_dir: Path, mode: str, params: dict,
+                      workers: int = None) -> tuple[int, int, list[tuple[str, str]]]:
+    """Recolor every image under input_dir into output_dir (mirroring the tree)
+
+    Returns (files processed, total pixels, [(file, error), ...]).
+    """
+    # Imported here: the process pool machinery costs ~20 ms of CLI startup
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [
+        (str(path), str(output_dir / path.relative_to(input_dir)))
+        for path in find_images(input_dir)
+    ]
+
+    processed = 0
+    pixels = 0
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(mode, params)) as executor:
+        for source, count, error in executor.map(recolor_file, jobs, chunksize=8):
+            if error:
+                failures.append((source, error))
+            else:
+                processed += 1
+                pixels += count
+
+    return processed, pixels, failures
+
+
+def main():
+    parser = create_parser(
+        description='Batch recolor images to a brand palette using NumPy lookup tables',
+        epilog='Example: python recolor_images.py photos/ --skill pro-sites --map "#FF0000=primary" --output branded/'
+    )
+
+    parser.add_argument('input_dir', help='Directory of images to recolor (searched recursively)')
+    parser.add_argument('--skill', help='Skill whose SKILL.md provides brand colors (e.g., "pro-sites")')
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--output', required=True, help='Output directory (mirrors the input tree)')
+    parser.add_argument('--map', action='append', default=[], metavar='SOURCE=TARGET',
+                        help='Palette mapping, e.g. "#FF0000=primary" (repeatable)')
+    parser.add_argument('--tolerance', type=float, default=40.0,
+                        help='Max RGB distance from a source color to recolor (default: 40)')
+    parser.add_argument('--duotone', nargs=2, metavar=('SHADOW', 'HIGHLIGHT'),
+                        help='Duotone mode: map luminance between two colors (e.g., dark primary)')
+    parser.add_argument('--snap', action='store_true',
+                        help="Snap every pixel to the nearest color in the skill's palette (CIELAB)")
+    parser.add_argument('--exact', action='store_true',
+                        help='With --snap: resolve each distinct color exactly instead of via the lookup grid')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+
+    args = parse_args(parser)
+
+    try:
+        require_modules()
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    brand_colors = {}
+    palette = None
+    if args.skill:
+        skill_md = Path(args.path) / args.skill / 'SKILL.md'
+        if not skill_md.exists():
+            print(f"Error: Skill not found: {skill_md.parent}")
+            return 1
+        brand_colors = parse_brand_from_skill_md(skill_md)['colors']
+        palette = PaletteIndex.from_skill(skill_md.parent)
+
+    try:
+        if args.snap:
+            if not palette:
+                raise ValueError("--snap needs a --skill with declared colors")
+            mode = 'snap'
+            params = {'colors': palette.colors, 'exact': args.exact}
+        elif args.duotone:
+            mode = 'duotone'
+            params = {
+                'shadow': resolve_color(args.duotone[0], brand_colors),
+                'highlight': resolve_color(args.duotone[1], brand_colors),
+            }
+        elif args.map:
+            mode = 'palette'
+            mapping = []
+            for entry in args.map:
+                if '=' not in entry:
+                    raise ValueError(f"Invalid --map '{entry}' (expected SOURCE=TARGET)")
+                source, target = entry.split('=', 1)
+                mapping.append((resolve_color(source.strip(), {}), resolve_color(target.strip(), brand_colors)))
+            params = {'mapping': mapping, 'tolerance': args.tolerance}
+        else:
+            print("Error: Specify --snap, --duotone or at least one --map")
+            return 1
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    input_dir = Path(args.input_dir)
+    if not input_dir.is_dir():
+        print(f"Error: Input directory not found: {input_dir}")
+        return 1
+
+    print(f"Recoloring images in {input_dir} ({mode} mode)")
+    start = time.perf_counter()
+    processed, pixels, failures = recolor_directory(input_dir, Path(args.output), mode, params, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print()
+    print(f"✓ Recolored {processed} image(s) in {elapsed:.2f}s "
+          f"({pixels / 1e6 / max(elapsed, 1e-9):.1f} megapixels/s)")
+    if failures:
+        print(f"✗ Failed on {len(failures)} image(s):")
+        for source, error in failures:
+            print(f"   • {source}: {error}")
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
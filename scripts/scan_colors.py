@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Off-Brand Color Scanner
+
+Audits a source tree (CSS, HTML, SVG, ...) for colors that are not in a brand
+skill's palette and reports each hit with its nearest brand color.
+
+Files are scanned as bytes by one precompiled regex covering hex codes, rgb(),
+hsl() and CSS named colors. Large files are memory-mapped instead of read, and
+batches of files are spread across a process pool.
+
+Usage:
+    python scripts/scan_colors.py pro-sites ~/src/client-web
+    python scripts/scan_colors.py pro-sites ~/src/client-web --tolerance 8 --json > report.json
+    python scripts/scan_colors.py pro-sites ~/src/monorepo --ext .css .scss --workers 16
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import colorsys
+import functools
+import json
+import mmap
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from css_colors import CSS_NAMED_COLORS
+from color_space import METRICS
+from palette_index import BASE_NEUTRALS, OFF_PALETTE_DELTA_E, PaletteIndex
+
+DEFAULT_EXTENSIONS = ('.css', '.scss', '.sass', '.less', '.html', '.htm', '.svg', '.vue', '.jsx', '.tsx')
+DEFAULT_EXCLUDE_DIRS = ('.git', '.hg', '.svn', 'node_modules', 'bower_components', 'vendor', 'dist', 'build', '__pycache__')
+
+# Stylesheets, where named colors and short hex are colors inside declarations
+# (selectors such as .red or #bad are not)
+CSS_EXTENSIONS = ('.css', '.scss', '.sass', '.less')
+
+# In other files named colors and 3/4-digit hex are only colors in a value
+# position: after a CSS ':' (style attributes, <style> blocks, JS style
+# objects) or as a color attribute value. Elsewhere they are words ("red" in
+# prose, Math.tan) or anchors (href="#add").
+VALUE_CONTEXT_RE = re.compile(
+    rb'(?:(?<![\w-])(?:fill|stroke|stop-color|flood-color|lighting-color|color|bgcolor|background)\s*=\s*["\']?'
+    rb'|:\s*["\']?(?:[^;:"\'<>{}\n]*\s)?)$'
+)
+VALUE_CONTEXT_CHARS = 80
+
+# Files at least this large are memory-mapped; smaller ones are cheaper to read()
+MMAP_THRESHOLD = 64 * 1024
+
+# Files per task sent to a worker process (amortizes IPC on large monorepos)
+BATCH_SIZE = 256
+
+
+def trie_pattern(words) -> str:
+    """Regex alternation for words, factored by common prefix
+
+    A flat alternation of hundreds of names is tried branch by branch at every
+    position; factoring it into a trie makes most positions fail after one
+    character.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        end = '' in node
+        alternatives = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not alternatives:
+            return ''
+        if len(alternatives) == 1 and not end:
+            return alternatives[0]
+        group = '(?:' + '|'.join(alternatives) + ')'
+        return group + '?' if end else group
+
+    return build(trie)
+
+
+@functools.lru_cache(maxsize=None)
+def color_regex():
+    """The combined color scanner, compiled on first use (~15 ms, kept off CLI startup)
+
+    Named colors are listed as written in practice (lowercase, UPPERCASE and
+    Capitalized) so the scan stays case-sensitive, which is several times
+    faster than re.IGNORECASE on a pattern this size. Every other branch starts
+    with a literal, so its lookbehind only runs after that character matched.
+    """
+    named = {variant for name in CSS_NAMED_COLORS for variant in (name, name.upper(), name.capitalize())}
+    return re.compile((
+        r'#(?<![\w&#]#)(?P<hex>[0-9A-Fa-f]{8}|[0-9A-Fa-f]{6}|[0-9A-Fa-f]{3,4})(?![\w-])'
+        r'|rgba?\(\s*(?P<r>[\d.]+%?)[\s,]+(?P<g>[\d.]+%?)[\s,]+(?P<b>[\d.]+%?)(?:[^()\n]{0,32}\))?'
+        r'|hsla?\(\s*(?P<h>[\d.]+)(?:deg)?[\s,]+(?P<s>[\d.]+)%[\s,]+(?P<l>[\d.]+)%(?:[^()\n]{0,32}\))?'
+        r'|(?<![\w-])(?P<named>' + trie_pattern(named) + r')(?![\w-])'
+    ).encode('ascii'))
+
+
+# Per-worker palette, built once by the pool initializer
+_worker_palette = None
+_worker_tolerance = OFF_PALETTE_DELTA_E
+
+# Matched text -> None (on-palette) or (hex, nearest name, nearest hex, delta E).
+# Codebases repeat the same few color literals, so most hits skip parsing.
+_worker_verdicts = {}
+
+
+def _rgb_channel(value: bytes) -> int:
+    if value.endswith(b'%'):
+        return min(255, round(float(value[:-1]) * 2.55))
+    return min(255, round(float(value)))
+
+
+def match_to_hex(match) -> str:
+    """Normalized #RRGGBB for a color_regex() match (alpha is ignored)"""
+    if match['hex']:
+        digits = match['hex'].decode('ascii').upper()
+        if len(digits) <= 4:
+            digits = ''.join(c * 2 for c in digits[:3])
+        return '#' + digits[:6]
+    if match['r']:
+        return '#{:02X}{:02X}{:02X}'.format(*(_rgb_channel(match[c]) for c in ('r', 'g', 'b')))
+    if match['h']:
+        r, g, b = colorsys.hls_to_rgb(
+            float(match['h']) / 360 % 1,
+            min(float(match['l']), 100) / 100,
+            min(float(match['s']), 100) / 100,
+        )
+        return '#{:02X}{:02X}{:02X}'.format(round(r * 255), round(g * 255), round(b * 255))
+    return CSS_NAMED_COLORS[match['named'].decode('ascii').lower()]
+
+
+def _init_worker(colors: dict, tolerance: float, metric: str = 'cie76'):
+    global _worker_palette, _worker_tolerance
+    _worker_palette = PaletteIndex(colors, metric)
+    _worker_tolerance = tolerance
+    _worker_verdicts.clear()
+
+
+def color_verdict(match):
+    """Cached off-palette verdict for a color_regex() match"""
+    text = match.group(0)
+    if text not in _worker_verdicts:
+        try:
+            hex_color = match_to_hex(match)
+        except ValueError:
+            _worker_verdicts[text] = None
+            return None
+        name, nearest_hex, delta_e = _worker_palette.nearest(hex_color)
+        off_palette = delta_e > _worker_tolerance
+        _worker_verdicts[text] = (hex_color, name, nearest_hex, round(delta_e, 1)) if off_palette else None
+    return _worker_verdicts[text]
+
+
+def in_value_context(data, start: int) -> bool:
+    """True if the text before start puts a match in a CSS value or color attribute"""
+    return VALUE_CONTEXT_RE.search(data[max(0, start - VALUE_CONTEXT_CHARS):start]) is not None
+
+
+def in_declaration(data, start: int, indented: bool = False) -> bool:
+    """True if start is in a stylesheet declaration value rather than a selector
+
+    The declaration starts after the last '{', '}' or ';' (or newline, for
+    indented .sass) and must have reached its ':'. Class names are never values.
+
+    >>> css = b'.red { margin: 0 }  #bad > .navy { padding: 0; color: navy; border: 1px solid #abc }'
+    >>> [in_declaration(css, css.index(word)) for word in (b'red', b'#bad', b'navy {', b'navy;', b'#abc')]
+    [False, False, False, True, True]
+    >>> sass = b'.red\\n  color: red'
+    >>> in_declaration(sass, 1, indented=True), in_declaration(sass, sass.rindex(b'red'), indented=True)
+    (False, True)
+    """
+    if start and data[start - 1:start] == b'.':
+        return False
+    window = data[max(0, start - VALUE_CONTEXT_CHARS):start]
+    boundary = max(window.rfind(b'{'), window.rfind(b'}'), window.rfind(b';'),
+                   window.rfind(b'\n') if indented else -1)
+    return b':' in window[boundary + 1:]
+
+
+def scan_file(path: str) -> list[tuple]:
+    """Off-palette hits in one file: (path, line, column, text, hex, nearest name, nearest hex, delta E)"""
+    hits = []
+    stylesheet = path.lower().endswith(CSS_EXTENSIONS)
+    indented = path.lower().endswith('.sass')
+    try:
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return hits
+            data = f.read() if size < MMAP_THRESHOLD else mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return hits
+
+    try:
+        line = 1
+        line_start = 0
+        last = 0
+        for match in color_regex().finditer(data):
+            verdict = color_verdict(match)
+            if verdict is None:
+                continue
+
+            start = match.start()
+            ambiguous = match['named'] or (match['hex'] and len(match['hex']) <= 4)
+            if ambiguous and not (in_declaration(data, start, indented) if stylesheet
+                                  else in_value_context(data, start)):
+                continue
+
+            # Line numbers are only computed for reported hits
+            newlines = data[last:start].count(b'\n')
+            if newlines:
+                line += newlines
+                line_start = data.rfind(b'\n', 0, start) + 1
+            last = start
+            text = match.group(0).decode('utf-8', 'replace')
+            hits.append((path, line, start - line_start + 1, text) + verdict)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+    return hits
+
+
+def scan_batch(paths: list[str]) -> list[tuple]:
+    hits = []
+    for path in paths:
+        hits.extend(scan_file(path))
+    return hits
+
+
+def find_source_files(root: str, extensions: tuple, exclude_dirs: set):
+    """Yield source file paths below root (iterative os.scandir walk)"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs:
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(extensions):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def scan_tree(root: str, palette: PaletteIndex, tolerance: float = OFF_PALETTE_DELTA_E,
+              extensions: tuple = DEFAULT_EXTENSIONS, exclude_dirs=DEFAULT_EXCLUDE_DIRS,
+              workers: int = None) -> tuple[int, list[tuple]]:
+    """Scan a source tree; returns (files scanned, sorted off-palette hits)"""
+    files = list(find_source_files(root, tuple(e.lower() for e in extensions), set(exclude_dirs)))
+    batches = [files[i:i + BATCH_SIZE] for i in range(0, len(files), BATCH_SIZE)]
+
+    hits = []
+    if len(batches) <= 1 or workers == 1:
+        # Not worth a process pool's startup cost
+        _init_worker(palette.colors, tolerance, palette.metric)
+        for batch in batches:
+            hits.extend(scan_batch(batch))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(palette.colors, tolerance, palette.metric)) as executor:
+            for batch_hits in executor.map(scan_batch, batches):
+                hits.extend(batch_hits)
+
+    hits.sort(key=lambda hit: (hit[0], hit[1], hit[2]))
+    return len(files), hits
+
+
+def add_scan_arguments(parser):
+    parser.add_argument('skill_name', help='Skill whose palette is the reference (e.g., "pro-sites")')
+    parser.add_argument('source_dir', help='Source tree to scan')
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--tolerance', type=float, default=OFF_PALETTE_DELTA_E,
+                        help=f'Max delta E from a brand color still counted on-palette (default: {OFF_PALETTE_DELTA_E:g})')
+    parser.add_argument('--metric', choices=METRICS, default='cie76',
+                        help='Color difference formula (default: cie76)')
+    parser.add_argument('--allow', action='append', default=[], metavar='HEX',
+                        help='Extra color to accept (repeatable; white and black are always accepted)')
+    parser.add_argument('--ext', nargs='+', default=list(DEFAULT_EXTENSIONS),
+                        help='File extensions to scan (default: CSS, HTML, SVG and component files)')
+    parser.add_argument('--exclude-dir', nargs='+', default=list(DEFAULT_EXCLUDE_DIRS),
+                        help='Directory names to skip (default: VCS, dependency and build dirs)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--json', action='store_true', help='Print hits as JSON')
+
+
+def run_scan(args) -> int:
+    skill_md = Path(args.path) / args.skill_name / 'SKILL.md'
+    if not skill_md.exists():
+        print(f"Error: Skill not found: {skill_md.parent}")
+        return 1
+    if not os.path.isdir(args.source_dir):
+        print(f"Error: Source directory not found: {args.source_dir}")
+        return 1
+
+    declared = PaletteIndex.from_skill(skill_md.parent, args.metric)
+    if not len(declared):
+        print(f"Error: No colors declared in {skill_md}")
+        return 1
+    allowed = {hex_color.upper(): hex_color for hex_color in args.allow}
+    palette = PaletteIndex({**declared.colors, **BASE_NEUTRALS, **allowed}, args.metric)
+
+    start = time.perf_counter()
+    file_count, hits = scan_tree(args.source_dir, palette, args.tolerance, tuple(args.ext),
+                                 args.exclude_dir, args.workers)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        keys = ('file', 'line', 'column', 'text', 'color', 'nearest_name', 'nearest_color', 'delta_e')
+        print(json.dumps([dict(zip(keys, hit)) for hit in hits], indent=2))
+        return 1 if hits else 0
+
+    for path, line, column, text, hex_color, name, nearest_hex, delta_e in hits:
+        print(f"{path}:{line}:{column}: {text} ({hex_color}) -> nearest brand color {name} {nearest_hex} (delta E {delta_e})")
+
+    print()
+    print(f"Scanned {file_count} file(s) in {elapsed:.2f}s")
+    if hits:
+        counts = {}
+        for hit in hits:
+            counts[hit[4]] = counts.get(hit[4], 0) + 1
+        print(f"✗ {len(hits)} off-palette color use(s), {len(counts)} distinct color(s)")
+        for hex_color, count in sorted(counts.items(), key=lambda item: -item[1])[:10]:
+            name, nearest_hex, delta_e = palette.nearest(hex_color)
+            print(f"   • {hex_color} x{count} -> {name} {nearest_hex} (delta E {delta_e:.1f})")
+        return 1
+
+    print(f"✓ All colors match the {args.skill_name} palette")
+    return 0
+
+
+def main():
+    parser = create_parser(
+        description="Scan a source tree for colors outside a brand skill's palette",
+        epilog='Example: python scan_colors.py pro-sites ~/src/client-web'
+    )
+    add_scan_arguments(parser)
+    args = parse_args(parser)
+    return run_scan(args)
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
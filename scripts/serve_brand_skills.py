@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Brand Skill Generation Service
+
+Runs a small local HTTP server that generates brand skills without spawning a
+Python process per request. Templates, placeholder logos and generated archives
+stay warm in memory between requests.
+
+Endpoints:
+    POST /generate   Brand JSON in, .skill archive (zip) out
+    POST /validate   Brand JSON in, validation report JSON out
+    GET  /metrics    Request counts, latency percentiles and cache stats (JSON)
+    GET  /health     Liveness check
+
+Brand JSON fields (only client_name is required):
+    client_name, primary_color, secondary_color, accent_color,
+    font_heading, font_subheading, font_body, tokens
+
+Usage:
+    python scripts/serve_brand_skills.py
+    python scripts/serve_brand_skills.py --host 0.0.0.0 --port 8765
+    curl -X POST localhost:8765/generate -d '{"client_name": "Acme Corp", "primary_color": "#0066CC"}' -o acme-corp.skill
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from init_brand_skill import (
+    build_skill_files,
+    normalize_hex_color,
+    slugify,
+    validate_hex_color,
+    write_skill_files,
+)
+from validate_brand_assets import validate_brand_skill
+
+COLOR_FIELDS = ('primary_color', 'secondary_color', 'accent_color')
+FONT_FIELDS = ('font_heading', 'font_subheading', 'font_body')
+
+# Latency samples kept per endpoint for percentile calculation
+LATENCY_WINDOW = 1024
+
+
+class BrandRequestError(ValueError):
+    """Raised when a request is not a valid brand description; status is the HTTP status to send"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_brand_request(body: bytes) -> argparse.Namespace:
+    """Parse and normalize a brand JSON body into init_brand_skill arguments"""
+    try:
+        payload = json.loads(body or b'{}')
+    except json.JSONDecodeError as e:
+        raise BrandRequestError(f"Invalid JSON: {str(e)}")
+
+    if not isinstance(payload, dict):
+        raise BrandRequestError("Request body must be a JSON object")
+
+    for field in ('client_name',) + COLOR_FIELDS + FONT_FIELDS:
+        value = payload.get(field)
+        if value is not None and not isinstance(value, str):
+            raise BrandRequestError(f"Field {field} must be a string, got {type(value).__name__}")
+
+    client_name = (payload.get('client_name') or '').strip()
+    if not client_name or not slugify(client_name):
+        raise BrandRequestError("Missing required field: client_name")
+
+    tokens = payload.get('tokens')
+    if tokens is None:
+        tokens = False
+    elif not isinstance(tokens, bool):
+        raise BrandRequestError(f"Field tokens must be a boolean, got {type(tokens).__name__}")
+
+    args = argparse.Namespace(client_name=client_name, tokens=tokens)
+
+    for field in COLOR_FIELDS:
+        value = payload.get(field)
+        if value and not validate_hex_color(value):
+            raise BrandRequestError(f"Invalid hex color for {field}: {value}")
+        setattr(args, field, normalize_hex_color(value) if value else None)
+
+    for field in FONT_FIELDS:
+        value = payload.get(field)
+        setattr(args, field, value or None)
+
+    return args
+
+
+def cache_key(args: argparse.Namespace) -> str:
+    """Canonical key for a normalized brand request"""
+    return json.dumps(vars(args), sort_keys=True)
+
+
+def build_skill_archive(args: argparse.Namespace) -> tuple[str, bytes]:
+    """Generate a skill and return (slug, .skill archive bytes) without touching disk"""
+    slug = slugify(args.client_name)
+    files = build_skill_files(args.client_name, slug, args)
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for rel_path, content in files.items():
+            zipf.writestr(f"{slug}/{rel_path}", content)
+
+    return slug, buffer.getvalue()
+
+
+def validate_brand_request(args: argparse.Namespace) -> dict:
+    """Generate a skill into a temporary directory and validate it"""
+    slug = slugify(args.client_name)
+    with tempfile.TemporaryDirectory(prefix='brand-skill-') as tmp:
+        skill_path = Path(tmp) / slug
+        write_skill_files(skill_path, build_skill_files(args.client_name, slug, args))
+        result = validate_brand_skill(skill_path, verbose=False)
+
+    # Paths relative to the skill; the temporary directory is an implementation detail
+    def relative(text: str) -> str:
+        return text.replace(f"{skill_path}{os.sep}", '').replace(str(skill_path), '.')
+
+    report = result.to_dict()
+    for severity in ('errors', 'warnings', 'suggestions', 'info'):
+        report[severity] = [relative(message) for message in report[severity]]
+    for finding in report['findings']:
+        finding['message'] = relative(finding['message'])
+        if finding['path'] is not None:
+            finding['path'] = relative(finding['path'])
+    report['skill'] = slug
+    return report
+
+
+class LRUCache:
+    """Thread-safe bounded cache of generated responses"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        if self.max_entries <= 0:
+            return
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
+
+
+class Metrics:
+    """Thread-safe per-endpoint request counters and latency samples"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.endpoints = {}
+        self.lock = threading.Lock()
+
+    def record(self, endpoint: str, status: int, elapsed: float):
+        with self.lock:
+            stats = self.endpoints.setdefault(endpoint, {
+                'count': 0,
+                'errors': 0,
+                'total_seconds': 0.0,
+                'samples': deque(maxlen=LATENCY_WINDOW),
+            })
+            stats['count'] += 1
+            if status >= 400:
+                stats['errors'] += 1
+            stats['total_seconds'] += elapsed
+            stats['samples'].append(elapsed)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            endpoints = {}
+            for endpoint, stats in self.endpoints.items():
+                samples = sorted(stats['samples'])
+                endpoints[endpoint] = {
+                    'count': stats['count'],
+                    'errors': stats['errors'],
+                    'mean_ms': round(stats['total_seconds'] / stats['count'] * 1000, 3),
+                    'p50_ms': round(percentile(samples, 50) * 1000, 3),
+                    'p95_ms': round(percentile(samples, 95) * 1000, 3),
+                    'p99_ms': round(percentile(samples, 99) * 1000, 3),
+                    'max_ms': round(samples[-1] * 1000, 3),
+                }
+        return {'uptime_seconds': round(time.time() - self.started, 1), 'endpoints': endpoints}
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of pre-sorted samples"""
+    if not sorted_samples:
+        return 0.0
+    index = max(0, min(len(sorted_samples) - 1, round(pct / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+class BrandSkillHandler(BaseHTTPRequestHandler):
+    """Request handler; server state lives on self.server"""
+
+    server_version = 'BrandSkillServer/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path == '/metrics':
+            metrics = self.server.metrics.snapshot()
+            metrics['archive_cache'] = self.server.archive_cache.stats()
+            metrics['validation_cache'] = self.server.validation_cache.stats()
+            self.timed('/metrics', lambda: (200, metrics))
+        elif self.path == '/health':
+            self.timed('/health', lambda: (200, {'status': 'ok'}))
+        else:
+            self.timed('unknown', lambda: (404, {'error': f"Not found: {self.path}"}))
+
+    def do_POST(self):
+        if self.path == '/generate':
+            self.timed('/generate', self.handle_generate)
+        elif self.path == '/validate':
+            self.timed('/validate', self.handle_validate)
+        else:
+            self.timed('unknown', lambda: (404, {'error': f"Not found: {self.path}"}))
+
+    def read_body(self) -> bytes:
+        # A body that is not read leaves the keep-alive stream out of sync, so those connections are closed
+        header = self.headers.get('Content-Length') or '0'
+        try:
+            length = int(header)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            raise BrandRequestError(f"Invalid Content-Length: {header}")
+        if length > self.server.max_body:
+            self.close_connection = True
+            raise BrandRequestError(f"Request body too large ({length} bytes)", status=413)
+        return self.rfile.read(length)
+
+    def handle_generate(self):
+        args = parse_brand_request(self.read_body())
+        key = cache_key(args)
+        cached = self.server.archive_cache.get(key)
+        if cached is None:
+            cached = build_skill_archive(args)
+            self.server.archive_cache.put(key, cached)
+        return 200, cached
+
+    def handle_validate(self):
+        args = parse_brand_request(self.read_body())
+        key = cache_key(args)
+        report = self.server.validation_cache.get(key)
+        if report is None:
+            report = validate_brand_request(args)
+            self.server.validation_cache.put(key, report)
+        return 200, report
+
+    def timed(self, endpoint: str, handler):
+        """Run a handler, send its response and record its latency"""
+        start = time.perf_counter()
+        try:
+            status, payload = handler()
+        except BrandRequestError as e:
+            status, payload = e.status, {'error': str(e)}
+        except Exception as e:
+            status, payload = 500, {'error': f"Internal error: {str(e)}"}
+
+        if isinstance(payload, tuple):
+            slug, archive = payload
+            self.send_bytes(status, archive, 'application/zip', {
+                'Content-Disposition': f'attachment; filename="{slug}.skill"',
+            })
+        else:
+            body = json.dumps(payload, indent=2).encode('utf-8')
+            self.send_bytes(status, body, 'application/json')
+
+        self.server.metrics.record(endpoint, status, time.perf_counter() - start)
+
+    def send_bytes(self, status: int, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class BrandSkillServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the warm caches and metrics"""
+
+    daemon_threads = True
+
+    def __init__(self, address, cache_size: int = 256, max_body: int = 64 * 1024, verbose: bool = False):
+        super().__init__(address, BrandSkillHandler)
+        self.archive_cache = LRUCache(cache_size)
+        self.validation_cache = LRUCache(cache_size)
+        self.metrics = Metrics()
+        self.max_body = max_body
+        self.verbose = verbose
+
+
+def warm_up():
+    """Run one generation so templates, regexes and logo glyphs are hot before serving"""
+    args = parse_brand_request(b'{"client_name": "Warm Up", "primary_color": "#0066CC"}')
+    build_skill_archive(args)
+
+
+def main():
+    parser = create_parser(
+        description='Serve brand skill generation and validation over HTTP',
+        epilog='Example: python serve_brand_skills.py --port 8765'
+    )
+
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument('--cache-size', type=int, default=256,
+                        help='Generated archives/reports kept in memory (default: 256, 0 disables)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+
+    args = parse_args(parser)
+
+    warm_up()
+    server = BrandSkillServer((args.host, args.port), cache_size=args.cache_size, verbose=args.verbose)
+
+    print(f"Brand skill service listening on http://{args.host}:{args.port}")
+    print("Endpoints: POST /generate, POST /validate, GET /metrics, GET /health")
+    print("Press Ctrl+C to stop")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print()
+        print("Shutting down...")
+    finally:
+        server.server_close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
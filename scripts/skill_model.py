@@ -0,0 +1,193 @@
+"""
+Skill Model
+
+In-process view of one skill directory shared by validation and packaging.
+The tree is walked once and each small file is read at most once, so a pipeline
+that validates and then packages a skill does not re-stat or re-read anything.
+Large files (template decks, print masters) are never held in memory: they are
+streamed in fixed-size chunks, so memory stays flat however big assets/ gets.
+"""
+
+import io
+import os
+from pathlib import Path
+
+from cli_runtime import phase
+
+# Files up to this size are kept in memory once read; larger ones are streamed
+CACHE_MAX_BYTES = 1024 * 1024
+
+# Read size when streaming a file
+CHUNK_SIZE = 256 * 1024
+
+
+def iter_tree(root, sort: bool = False):
+    """Yield (relative posix path, os.DirEntry) for everything below root, top-down like os.walk
+
+    Directories come from os.scandir, whose entries know their type without a
+    stat() call and cache the stat once taken. Symlinked directories are listed
+    but not followed; unreadable directories are skipped.
+    """
+    root = os.fspath(root)
+    stack = ['']
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(root, rel_dir)) as it:
+                entries = sorted(it, key=lambda entry: entry.name) if sort else it
+                subdirs = []
+                for entry in entries:
+                    rel = rel_dir + entry.name
+                    yield rel, entry
+                    if entry.is_dir() and not entry.is_symlink():
+                        subdirs.append(rel + '/')
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def iter_files(root, suffixes: tuple = ()):
+    """Yield Paths of the files below root (optionally only these lowercase suffixes), sorted per directory"""
+    root = Path(root)
+    for rel, entry in iter_tree(root, sort=True):
+        if entry.is_file() and (not suffixes or entry.name.lower().endswith(suffixes)):
+            yield root / rel
+
+
+def iter_trees(skill_paths, io_workers: int = 0, reads: tuple = None):
+    """Yield (skill path, SkillTree) for each skill
+
+    With io_workers, trees are loaded ahead with that many concurrent filesystem
+    operations (see async_tree.py), which pays off on network filesystems.
+    reads limits which small files are loaded up front (glob patterns; None
+    loads all of them). Without io_workers, trees scan lazily on first use.
+    """
+    if not io_workers:
+        for skill_path in skill_paths:
+            yield skill_path, SkillTree(skill_path)
+        return
+
+    # asyncio adds ~50 ms of imports; only load it when asked to
+    from async_tree import prefetch_trees
+    yield from prefetch_trees(skill_paths, reads=reads, workers=io_workers)
+
+
+class SkillTree:
+    """Lazily scanned, read-once snapshot of a skill directory"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._files = None
+        self._dirs = None
+        self._content = {}
+
+    @classmethod
+    def from_snapshot(cls, root: Path, files: dict, dirs: set, content: dict = None) -> 'SkillTree':
+        """Tree over an already scanned directory (see async_tree.py)
+
+        files maps relative posix paths to stat results in walk order, dirs holds
+        relative directory paths including '', and content holds files already read.
+        """
+        tree = cls(root)
+        tree._files = files
+        tree._dirs = dirs
+        tree._content = {rel: data for rel, data in (content or {}).items() if len(data) <= CACHE_MAX_BYTES}
+        return tree
+
+    def _scan(self):
+        with phase('tree.walk'):
+            self._walk()
+
+    def _walk(self):
+        files = {}
+        dirs = {''}
+        for rel, entry in iter_tree(self.root):
+            if entry.is_dir():
+                dirs.add(rel)
+                continue
+            try:
+                files[rel] = entry.stat()
+            except OSError:
+                continue  # Dangling symlink
+        self._files = files
+        self._dirs = dirs
+
+    def _rel(self, path) -> str:
+        """Normalize a Path under root or a relative string to a posix key"""
+        if isinstance(path, Path):
+            try:
+                path = path.relative_to(self.root)
+            except ValueError:
+                pass
+        return str(path).replace(os.sep, '/').strip('/')
+
+    @property
+    def files(self) -> dict:
+        """Mapping of relative posix path -> os.stat_result for every file"""
+        if self._files is None:
+            if not self.root.is_dir():
+                self._files, self._dirs = {}, set()
+            else:
+                self._scan()
+        return self._files
+
+    def exists(self, path) -> bool:
+        return self.is_file(path) or self.is_dir(path)
+
+    def is_file(self, path) -> bool:
+        return self._rel(path) in self.files
+
+    def is_dir(self, path) -> bool:
+        self.files
+        return self._rel(path) in self._dirs
+
+    def stat(self, path) -> os.stat_result:
+        return self.files[self._rel(path)]
+
+    def list_dir(self, path, suffix: str = '') -> list[str]:
+        """Names of files directly inside a directory, optionally filtered by suffix"""
+        prefix = self._rel(path)
+        prefix = prefix + '/' if prefix else ''
+        names = []
+        for rel in self.files:
+            if rel.startswith(prefix) and '/' not in rel[len(prefix):] and rel.endswith(suffix):
+                names.append(rel[len(prefix):])
+        return sorted(names)
+
+    def read_bytes(self, path) -> bytes:
+        """Whole file contents; kept for later readers when the file is at most CACHE_MAX_BYTES"""
+        rel = self._rel(path)
+        if rel in self._content:
+            return self._content[rel]
+        with phase('tree.read'), open(self.root / rel, 'rb') as f:
+            data = f.read()
+        if len(data) <= CACHE_MAX_BYTES:
+            self._content[rel] = data
+        return data
+
+    def iter_chunks(self, path, chunk_size: int = CHUNK_SIZE):
+        """Yield file contents in chunks, from memory if already read, without caching anything new"""
+        rel = self._rel(path)
+        if rel in self._content:
+            yield self._content[rel]
+            return
+        with open(self.root / rel, 'rb') as f:
+            while True:
+                with phase('tree.read'):
+                    chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def open(self, path):
+        """Binary file object: small files come from (and go into) memory, large ones are opened from disk
+
+        For readers that may only need part of a file, such as image headers.
+        """
+        rel = self._rel(path)
+        if rel in self._content or self.stat(rel).st_size <= CACHE_MAX_BYTES:
+            return io.BytesIO(self.read_bytes(rel))
+        return open(self.root / rel, 'rb')
+
+    def read_text(self, path) -> str:
+        return self.read_bytes(path).decode('utf-8')
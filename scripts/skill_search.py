@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Skill Search
+
+Finds the brand skill that matches a request without reading every SKILL.md.
+An inverted index over each skill's name, frontmatter description, **Keywords**
+line and reference headings is written next to the skills
+(brand-skills/.skill-index) and queried with BM25.
+
+The index is a single binary file that is memory-mapped, not loaded: terms are
+sorted so a lookup is a binary search, and each term's postings hold precomputed
+one-byte BM25 impacts, both in doc order and in impact order. Queries walk the
+impact-ordered postings and stop as soon as the top results are settled, so
+terms shared by every skill ("brand", "colors") are not scanned to the end.
+
+Rebuilds are incremental: a skill is re-tokenized only when SKILL.md or one of
+its references changed size or mtime; everything else is carried over from the
+previous index. The packager refreshes the index after every run.
+
+Usage:
+    python scripts/skill_search.py "web agency blue"
+    python scripts/skill_search.py "corporate typography" --limit 5 --json
+    python scripts/skill_search.py --rebuild --path ~/.claude/skills
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, parse_args, run_cli
+
+import json
+import math
+import os
+import re
+import struct
+import sys
+import time
+from pathlib import Path
+
+from design_tokens import FRONTMATTER_FIELD_RE
+
+INDEX_NAME = '.skill-index'
+
+INDEX_MAGIC = b'BSKI'
+INDEX_VERSION = 1
+
+# magic, version, doc id typecode, doc count, term count, posting count,
+# doc blob bytes, term blob bytes
+HEADER = struct.Struct('<4sBc2xIIIII')
+
+# Term frequencies are stored in one byte
+MAX_TF = 255
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Each occurrence in a field counts this many times towards the term frequency
+FIELD_WEIGHTS = {
+    'name': 3,
+    'keywords': 2,
+    'description': 1,
+    'headings': 1,
+}
+
+# Characters of the description kept in the index for result listings
+DESCRIPTION_CHARS = 160
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+KEYWORDS_RE = re.compile(r'^\*\*Keywords\*\*:\s*(.+?)\s*$', re.MULTILINE)
+HEADING_RE = re.compile(r'^#{1,6}\s+(.+?)\s*#*\s*$')
+
+STOPWORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it', 'of', 'on', 'or',
+    'that', 'the', 'this', 'to', 'when', 'with', 'use', 'any', 'all', 'need', 's',
+))
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased alphanumeric tokens, stopwords dropped and simple plurals folded"""
+    tokens = []
+    for token in TOKEN_RE.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def reference_headings(content: str) -> list[str]:
+    """Markdown headings outside fenced code blocks"""
+    headings = []
+    in_fence = False
+    for line in content.splitlines():
+        if line.startswith('```'):
+            in_fence = not in_fence
+        elif not in_fence:
+            match = HEADING_RE.match(line)
+            if match:
+                headings.append(match.group(1))
+    return headings
+
+
+def index_sources(skill_path: Path) -> list[str]:
+    """SKILL.md and references/*.md, the files the index is built from"""
+    sources = [os.path.join(skill_path, 'SKILL.md')]
+    try:
+        with os.scandir(os.path.join(skill_path, 'references')) as entries:
+            sources.extend(sorted(entry.path for entry in entries if entry.name.endswith('.md') and entry.is_file()))
+    except OSError:
+        pass
+    return sources
+
+
+def sources_signature(sources: list[str]) -> str:
+    """Size and mtime of every source file; changes when any of them is edited, added or removed"""
+    parts = []
+    for source in sources:
+        try:
+            file_stat = os.stat(source)
+        except OSError:
+            continue
+        parts.append(f'{os.path.basename(source)}:{file_stat.st_size}:{file_stat.st_mtime_ns}')
+    return ','.join(parts)
+
+
+def skill_terms(skill_path: Path, sources: list[str]) -> tuple[dict[str, int], str]:
+    """Weighted term frequencies of one skill and its (truncated) description"""
+    with open(sources[0], encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    frontmatter = {}
+    if content.startswith('---'):
+        parts = content.split('---', 2)
+        if len(parts) >= 3:
+            frontmatter = dict(FRONTMATTER_FIELD_RE.findall(parts[1]))
+
+    fields = {
+        'name': frontmatter.get('name') or Path(skill_path).name,
+        'description': frontmatter.get('description', ''),
+        'keywords': ' '.join(KEYWORDS_RE.findall(content)),
+        'headings': '',
+    }
+    headings = []
+    for source in sources[1:]:
+        with open(source, encoding='utf-8', errors='replace') as f:
+            headings.extend(reference_headings(f.read()))
+    fields['headings'] = ' '.join(headings)
+
+    terms = {}
+    for field, text in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        for token in tokenize(text):
+            terms[token] = min(terms.get(token, 0) + weight, MAX_TF)
+    return terms, fields['description'][:DESCRIPTION_CHARS]
+
+
+class SkillIndex:
+    """Memory-mapped, read-only view of an index file"""
+
+    def __init__(self, path: Path):
+        import mmap
+
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self._map.close()
+            raise ValueError(f"Truncated skill index: {self.path}")
+        (magic, version, typecode, self.doc_count, self.term_count, self.posting_count,
+         doc_blob_size, term_blob_size) = HEADER.unpack_from(self._map, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION or typecode not in (b'H', b'I'):
+            self._map.close()
+            raise ValueError(f"Not a version {INDEX_VERSION} skill index: {self.path}")
+        self.doc_typecode = typecode.decode()
+        id_size = struct.calcsize(self.doc_typecode)
+        postings = self.posting_count
+
+        # Section offsets follow from the counts in the header
+        self._doc_offsets = HEADER.size
+        self._doc_blob = self._doc_offsets + 4 * (self.doc_count + 1)
+        self._term_offsets = self._doc_blob + doc_blob_size
+        self._term_blob = self._term_offsets + 4 * (self.term_count + 1)
+        self._posting_offsets = self._term_blob + term_blob_size
+        self._term_scales = self._posting_offsets + 4 * (self.term_count + 1)
+        self._by_doc_ids = self._term_scales + 4 * self.term_count
+        self._by_doc_impacts = self._by_doc_ids + id_size * postings
+        self._tfs = self._by_doc_impacts + postings
+        self._by_impact_ids = self._tfs + postings
+        self._by_impact_impacts = self._by_impact_ids + id_size * postings
+        self._id_size = id_size
+        if self._by_impact_impacts + postings > len(self._map):
+            self._map.close()
+            raise ValueError(f"Truncated skill index: {self.path}")
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.doc_count
+
+    def term(self, i: int) -> bytes:
+        start, end = struct.unpack_from('<II', self._map, self._term_offsets + 4 * i)
+        return self._map[self._term_blob + start:self._term_blob + end]
+
+    def doc(self, doc_id: int) -> tuple[str, str, str]:
+        """(name, signature, description) of a document"""
+        start, end = struct.unpack_from('<II', self._map, self._doc_offsets + 4 * doc_id)
+        name, signature, description = self._map[self._doc_blob + start:self._doc_blob + end].decode().split('\x1f')
+        return name, signature, description
+
+    def find(self, term: str) -> int:
+        """Index of term in the sorted term table, or -1"""
+        key = term.encode()
+        low, high = 0, self.term_count
+        while low < high:
+            mid = (low + high) // 2
+            if self.term(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low if low < self.term_count and self.term(low) == key else -1
+
+    def _ids(self, section: int, start: int, end: int):
+        from array import array
+
+        ids = array(self.doc_typecode)
+        ids.frombytes(self._map[section + start * self._id_size:section + end * self._id_size])
+        if sys.byteorder != 'little':
+            ids.byteswap()
+        return ids
+
+    def postings(self, i: int):
+        """Postings of term number i: (doc ids, impacts, tfs) in doc order,
+        (doc ids, impacts) in impact order, and the impact scale"""
+        start, end = struct.unpack_from('<II', self._map, self._posting_offsets + 4 * i)
+        scale = struct.unpack_from('<f', self._map, self._term_scales + 4 * i)[0]
+        return (self._ids(self._by_doc_ids, start, end),
+                self._map[self._by_doc_impacts + start:self._by_doc_impacts + end],
+                self._map[self._tfs + start:self._tfs + end],
+                self._ids(self._by_impact_ids, start, end),
+                self._map[self._by_impact_impacts + start:self._by_impact_impacts + end],
+                scale)
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[float, str, str]]:
+        """Top skills for query by BM25: (score, name, description)
+
+        Threshold algorithm: postings are walked in impact order, each new
+        document is scored exactly by binary search in the other terms'
+        doc-ordered postings, and the walk stops once the best remaining
+        impacts cannot beat the current top results. Frequent terms are
+        therefore never scanned to the end.
+        """
+        import heapq
+        from bisect import bisect_left
+
+        terms = []
+        for term in dict.fromkeys(tokenize(query)):
+            i = self.find(term)
+            if i >= 0:
+                by_doc, doc_impacts, _, by_impact, impacts, scale = self.postings(i)
+                terms.append((by_doc, doc_impacts, by_impact, impacts, scale))
+        if not terms or limit < 1:
+            return []
+
+        top = []
+        scored = set()
+        for depth in range(max(len(by_impact) for _, _, by_impact, _, _ in terms)):
+            threshold = 0.0
+            for _, _, by_impact, impacts, scale in terms:
+                if depth >= len(by_impact):
+                    continue
+                threshold += impacts[depth] * scale
+                doc_id = by_impact[depth]
+                if doc_id in scored:
+                    continue
+                scored.add(doc_id)
+                score = 0.0
+                for by_doc, doc_impacts, _, _, other_scale in terms:
+                    j = bisect_left(by_doc, doc_id)
+                    if j < len(by_doc) and by_doc[j] == doc_id:
+                        score += doc_impacts[j] * other_scale
+                if len(top) < limit:
+                    heapq.heappush(top, (score, -doc_id))
+                elif score > top[0][0]:
+                    heapq.heapreplace(top, (score, -doc_id))
+            if len(top) == limit and top[0][0] >= threshold:
+                break
+
+        results = []
+        for score, doc_id in sorted(top, reverse=True):
+            name, _, description = self.doc(-doc_id)
+            results.append((score, name, description))
+        return results
+
+    def documents(self) -> dict[str, tuple[int, str]]:
+        """Skill name -> (doc id, signature)"""
+        docs = {}
+        for doc_id in range(self.doc_count):
+            name, signature, _ = self.doc(doc_id)
+            docs[name] = (doc_id, signature)
+        return docs
+
+    def forward(self) -> dict[int, dict[str, int]]:
+        """Doc id -> {term: tf}, rebuilt from the postings (used to carry unchanged skills over)"""
+        forward = {doc_id: {} for doc_id in range(self.doc_count)}
+        for i in range(self.term_count):
+            term = self.term(i).decode()
+            start, end = struct.unpack_from('<II', self._map, self._posting_offsets + 4 * i)
+            for doc_id, tf in zip(self._ids(self._by_doc_ids, start, end), self._map[self._tfs + start:self._tfs + end]):
+                forward[doc_id][term] = tf
+        return forward
+
+
+def index_path(base_path: Path) -> Path:
+    return Path(base_path) / INDEX_NAME
+
+
+def write_index(path: Path, docs: list[tuple[str, str, str, dict[str, int]]]):
+    """Write (name, signature, description, terms) documents as an index file, atomically
+
+    BM25 is evaluated here, once per posting, and stored as one byte per
+    posting scaled to the term's highest impact.
+    """
+    from array import array
+
+    doc_typecode = 'H' if len(docs) <= 0xFFFF else 'I'
+
+    doc_offsets = array('I', [0])
+    doc_blob = bytearray()
+    norms = []
+    inverted = {}
+    lengths = [sum(terms.values()) for _, _, _, terms in docs]
+    avg_length = sum(lengths) / len(docs) if docs else 0.0
+    for doc_id, (name, signature, description, terms) in enumerate(docs):
+        doc_blob += '\x1f'.join((name, signature, description.replace('\x1f', ' '))).encode()
+        doc_offsets.append(len(doc_blob))
+        norms.append(BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / avg_length))
+        for term, tf in terms.items():
+            postings = inverted.get(term)
+            if postings is None:
+                postings = inverted[term] = ([], [])
+            postings[0].append(doc_id)
+            postings[1].append(tf)
+
+    term_offsets = array('I', [0])
+    term_blob = bytearray()
+    posting_offsets = array('I', [0])
+    term_scales = array('f')
+    by_doc_ids = array(doc_typecode)
+    by_doc_impacts = bytearray()
+    tfs = bytearray()
+    by_impact_ids = array(doc_typecode)
+    by_impact_impacts = bytearray()
+    for term in sorted(inverted):
+        doc_ids, term_tfs = inverted[term]
+        idf = math.log(1 + (len(docs) - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+        impacts = [idf * tf * (BM25_K1 + 1) / (tf + norms[doc_id]) for doc_id, tf in zip(doc_ids, term_tfs)]
+        scale = max(impacts) / 255
+        quantized = [round(impact / scale) or 1 for impact in impacts]
+        # Stable, so equal impacts stay in doc order
+        order = sorted(range(len(doc_ids)), key=quantized.__getitem__, reverse=True)
+
+        term_blob += term.encode()
+        term_offsets.append(len(term_blob))
+        term_scales.append(scale)
+        by_doc_ids.extend(doc_ids)
+        by_doc_impacts.extend(quantized)
+        tfs.extend(term_tfs)
+        by_impact_ids.extend([doc_ids[k] for k in order])
+        by_impact_impacts.extend([quantized[k] for k in order])
+        posting_offsets.append(len(by_doc_ids))
+
+    if sys.byteorder != 'little':
+        for packed in (doc_offsets, term_offsets, posting_offsets, term_scales, by_doc_ids, by_impact_ids):
+            packed.byteswap()
+
+    header = HEADER.pack(INDEX_MAGIC, INDEX_VERSION, doc_typecode.encode(), len(docs), len(inverted),
+                         len(by_doc_ids), len(doc_blob), len(term_blob))
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'wb') as f:
+        for section in (header, doc_offsets, doc_blob, term_offsets, term_blob, posting_offsets, term_scales,
+                        by_doc_ids, by_doc_impacts, tfs, by_impact_ids, by_impact_impacts):
+            f.write(section)
+    os.replace(temp_path, path)
+
+
+def build_index(base_path: Path, full: bool = False) -> dict:
+    """Create or incrementally update the index of base_path; returns counts of indexed/reused/removed skills
+
+    full=True re-reads every skill instead of reusing unchanged ones.
+    """
+    base_path = Path(base_path)
+    path = index_path(base_path)
+
+    previous = {}
+    old = None
+    if path.exists() and not full:
+        try:
+            old = SkillIndex(path)
+            previous = old.documents()
+        except (ValueError, struct.error):
+            # Unreadable or corrupt index: rebuild from scratch
+            if old is not None:
+                old.close()
+            old = None
+            previous = {}
+
+    counts = {'indexed': 0, 'reused': 0, 'removed': 0}
+    docs = []
+    carried = []
+    with os.scandir(base_path) as entries:
+        skill_dirs = sorted(entry.path for entry in entries if entry.is_dir() and not entry.name.startswith('.'))
+    for skill_dir in skill_dirs:
+        name = os.path.basename(skill_dir)
+        sources = index_sources(skill_dir)
+        if not os.path.isfile(sources[0]):
+            continue
+        signature = sources_signature(sources)
+        if name in previous and previous[name][1] == signature:
+            carried.append((len(docs), previous[name][0]))
+            docs.append(None)
+            counts['reused'] += 1
+            continue
+        terms, description = skill_terms(skill_dir, sources)
+        docs.append((name, signature, description, terms))
+        counts['indexed'] += 1
+
+    if old is not None:
+        counts['removed'] = len(previous) - len(carried) - sum(1 for doc in docs if doc and doc[0] in previous)
+        if not counts['indexed'] and not counts['removed']:
+            old.close()
+            return counts
+        if carried:
+            # Inverting the old postings is much cheaper than re-reading every unchanged skill
+            forward = old.forward()
+            for position, old_id in carried:
+                name, signature, description = old.doc(old_id)
+                docs[position] = (name, signature, description, forward[old_id])
+        old.close()
+
+    write_index(path, docs)
+    return counts
+
+
+def add_search_arguments(parser):
+    """Register search arguments (shared with brandctl search)"""
+    parser.add_argument('query', nargs='?', help='What the skill should cover (e.g., "web agency blue")')
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--limit', type=int, default=10, help='Maximum number of results (default: 10)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Update the index before searching (only changed skills are re-read)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+
+
+def run_search(args) -> int:
+    base_path = Path(args.path)
+    if not base_path.is_dir():
+        print(f"Error: Skills directory not found: {base_path}")
+        return 1
+
+    path = index_path(base_path)
+    if args.rebuild or not path.exists():
+        start = time.perf_counter()
+        counts = build_index(base_path)
+        elapsed = time.perf_counter() - start
+        if not args.json:
+            print(f"✓ Index updated in {elapsed * 1000:.0f} ms: "
+                  + ', '.join(f"{count} {state}" for state, count in counts.items()))
+
+    if not args.query:
+        return 0
+
+    try:
+        index = SkillIndex(path)
+    except ValueError as e:
+        print(f"Error: {e} (run with --rebuild)")
+        return 1
+    with index:
+        start = time.perf_counter()
+        results = index.search(args.query, args.limit)
+        elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps([{'name': name, 'score': round(score, 4), 'description': description}
+                          for score, name, description in results], indent=2))
+        return 0
+
+    print(f"{len(results)} of {len(index)} skill(s) matched \"{args.query}\" ({elapsed * 1000:.2f} ms)")
+    for score, name, description in results:
+        print(f"   {score:6.2f}  {name:<24} {description}")
+    return 0
+
+
+def main():
+    parser = create_parser(
+        description='Search brand skills by description, keywords and reference headings',
+        epilog='Example: python skill_search.py "web agency blue"'
+    )
+
+    add_search_arguments(parser)
+
+    args = parse_args(parser)
+
+    return run_search(args)
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
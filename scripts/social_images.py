@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Social / Open Graph Image Generator
+
+Renders per-page 1200x630 Open Graph images in a skill's colors, fonts and
+logo from a CSV or JSONL list of page titles.
+
+Everything that is the same on every page (background, frame, logo) is
+rasterized once per brand and template into a base layer and shipped to each
+worker once. Per page, the base is copied and only the title and subtitle are
+drawn on top. A manifest in the output directory records what each image was
+rendered from, so re-runs skip pages whose text and branding haven't changed.
+
+Requires Pillow (pip install Pillow).
+
+Input rows need a `title`; `subtitle` (or `description`) and `slug` are
+optional. Images are written as <slug>.png, with the slug derived from the
+title when not given.
+
+Usage:
+    python scripts/social_images.py pro-sites pages.csv --output og/
+    python scripts/social_images.py pro-sites pages.jsonl --output og/ --template light --format jpg
+    python scripts/social_images.py pro-sites pages.csv --output og/ --heading-font fonts/Inter-Bold.ttf
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, optional_import, parse_args, run_cli
+
+import csv
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from design_tokens import NEUTRAL_COLORS, parse_brand_from_skill_md
+from init_brand_skill import hex_to_rgb
+from watermark_images import bounded_map
+
+CANVAS_SIZE = (1200, 630)
+PADDING = 80
+LOGO_HEIGHT = 56
+FRAME_WIDTH = 12
+
+TITLE_BOX_TOP = 200
+TITLE_SIZES = (72, 64, 56, 48, 42)
+TITLE_MAX_LINES = 3
+SUBTITLE_SIZE = 32
+LINE_SPACING = 1.15
+
+# Colors are brand roles; the first role the skill defines is used
+TEMPLATES = {
+    'bold': {
+        'background': ('primary',),
+        'text': ('light',),
+        'subtitle': ('light',),
+        'frame': ('accent', 'secondary', 'light'),
+        'logo': ('logo-white.png', 'logo.png'),
+    },
+    'light': {
+        'background': ('light',),
+        'text': ('dark',),
+        'subtitle': ('primary', 'dark'),
+        'frame': ('primary',),
+        'logo': ('logo.png',),
+    },
+}
+
+FONT_EXTENSIONS = ('.ttf', '.otf')
+
+# Bump when rendering changes, to invalidate manifest entries
+GENERATOR_VERSION = '1'
+
+MANIFEST_NAME = '.social-images.json'
+
+# Rows per task sent to a worker process
+BATCH_SIZE = 64
+
+SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Per-worker state, set by the pool initializer
+_worker_state = None
+
+
+def require_pillow():
+    Image = optional_import('PIL.Image')
+    if Image is None:
+        raise RuntimeError("Pillow is required. Install: pip install Pillow")
+    return Image
+
+
+def slugify(text: str) -> str:
+    return SLUG_RE.sub('-', text.lower()).strip('-')[:80] or 'page'
+
+
+def read_rows(path: Path):
+    """Yield dict rows from a .csv or .jsonl file"""
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.suffix.lower() in ('.jsonl', '.ndjson'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def role_color(colors: dict, roles) -> tuple[int, int, int]:
+    for role in roles:
+        if colors.get(role):
+            return hex_to_rgb(colors[role])
+    return hex_to_rgb(colors['primary'])
+
+
+def find_font_file(skill_path: Path, family: str):
+    """Font file for a family name from the skill's assets/fonts/, or None"""
+    fonts_dir = skill_path / 'assets' / 'fonts'
+    if not family or not fonts_dir.is_dir():
+        return None
+    key = family.replace(' ', '').lower()
+    candidates = sorted(p for p in fonts_dir.iterdir() if p.suffix.lower() in FONT_EXTENSIONS
+                        and p.stem.replace(' ', '').lower().startswith(key))
+    # Prefer a bold cut for headings when one exists, else the shortest name (the regular cut)
+    bold = [p for p in candidates if 'bold' in p.stem.lower()]
+    return str(min(bold or candidates, key=lambda p: len(p.name))) if candidates else None
+
+
+def build_base_layer(Image, skill_path: Path, colors: dict, template: dict):
+    """Background, frame and logo: the part of the image shared by every page"""
+    width, height = CANVAS_SIZE
+    base = Image.new('RGB', CANVAS_SIZE, role_color(colors, template['background']))
+    base.paste(role_color(colors, template['frame']), (0, height - FRAME_WIDTH, width, height))
+
+    logo_path = next((skill_path / 'assets' / name for name in template['logo']
+                      if (skill_path / 'assets' / name).is_file()), None)
+    if logo_path is not None:
+        with Image.open(logo_path) as logo:
+            logo = logo.convert('RGBA').convert('RGBa')
+        scale = LOGO_HEIGHT / logo.height
+        logo = logo.resize((max(1, round(logo.width * scale)), LOGO_HEIGHT), Image.LANCZOS).convert('RGBA')
+        base.paste(logo, (PADDING, PADDING), logo)
+    return base
+
+
+@functools.lru_cache(maxsize=None)
+def load_font(path, size: int):
+    ImageFont = optional_import('PIL.ImageFont')
+    if path:
+        return ImageFont.truetype(path, size)
+    return ImageFont.load_default(size)
+
+
+def wrap_text(text: str, font, max_width: int) -> list[str]:
+    """Greedy word wrap by rendered width"""
+    space = font.getlength(' ')
+    lines, line, line_width = [], [], 0.0
+    for word in text.split():
+        word_width = font.getlength(word)
+        if line and line_width + space + word_width > max_width:
+            lines.append(' '.join(line))
+            line, line_width = [], 0.0
+        line_width += (space if line else 0) + word_width
+        line.append(word)
+    if line:
+        lines.append(' '.join(line))
+    return lines
+
+
+def fit_title(title: str, font_path, max_width: int):
+    """(font, lines): the largest title size that fits, ellipsized at the smallest"""
+    for size in TITLE_SIZES:
+        font = load_font(font_path, size)
+        lines = wrap_text(title, font, max_width)
+        if len(lines) <= TITLE_MAX_LINES:
+            return font, lines
+    lines = lines[:TITLE_MAX_LINES]
+    lines[-1] = lines[-1].rstrip('.,;: ') + '…'
+    return font, lines
+
+
+def render_page(state: dict, title: str, subtitle: str):
+    """Base layer plus one page's text"""
+    ImageDraw = optional_import('PIL.ImageDraw')
+    image = state['base'].copy()
+    draw = ImageDraw.Draw(image)
+    max_width = CANVAS_SIZE[0] - 2 * PADDING
+
+    font, lines = fit_title(title, state['heading_font'], max_width)
+    y = TITLE_BOX_TOP
+    for line in lines:
+        draw.text((PADDING, y), line, font=font, fill=state['text_color'])
+        y += round(font.size * LINE_SPACING)
+
+    if subtitle:
+        font = load_font(state['body_font'], SUBTITLE_SIZE)
+        line = wrap_text(subtitle, font, max_width)[:1]
+        if line:
+            draw.text((PADDING, y + SUBTITLE_SIZE // 2), line[0], font=font, fill=state['subtitle_color'])
+    return image
+
+
+def _init_worker(state: dict):
+    global _worker_state
+    Image = require_pillow()
+    # The base layer arrives as raw pixels once per worker, not once per page
+    _worker_state = dict(state, base=Image.frombytes('RGB', CANVAS_SIZE, state['base']))
+    load_font.cache_clear()
+
+
+def render_batch(rows: list[tuple]) -> list[tuple[str, str]]:
+    """Render (slug, title, subtitle, destination) rows; returns [(slug, error)]"""
+    results = []
+    for slug, title, subtitle, destination in rows:
+        try:
+            image = render_page(_worker_state, title, subtitle)
+            temp = destination + '.tmp'
+            if _worker_state['format'] == 'jpg':
+                image.save(temp, format='JPEG', quality=90)
+            else:
+                image.save(temp, format='PNG', compress_level=3)
+            os.replace(temp, destination)
+            results.append((slug, ''))
+        except Exception as e:
+            results.append((slug, str(e)))
+    return results
+
+
+def load_manifest(output_dir: Path) -> dict:
+    try:
+        return json.loads((output_dir / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def file_digest(path) -> str:
+    """sha256 of a file's contents ('' for None, e.g. Pillow's default font)"""
+    if path is None:
+        return ''
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def row_text(row: dict, *fields) -> str:
+    """First non-empty field of a row as stripped text (JSONL values may be numbers)"""
+    for field in fields:
+        value = row.get(field)
+        if value is not None and value != '':
+            return str(value).strip()
+    return ''
+
+
+def save_manifest(output_dir: Path, manifest: dict):
+    temp = output_dir / (MANIFEST_NAME + '.tmp')
+    temp.write_text(json.dumps(manifest, indent=0, sort_keys=True))
+    os.replace(temp, output_dir / MANIFEST_NAME)
+
+
+def generate_images(state: dict, rows, output_dir: Path, force: bool = False, workers: int = None) -> dict:
+    """Render every row not already current in output_dir; returns counts and failures"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {} if force else load_manifest(output_dir)
+    # Font contents, not just paths, so a font replaced in place re-renders every page
+    style_key = hashlib.sha256(state['base']).hexdigest() + repr(
+        (GENERATOR_VERSION, state['format'], state['heading_font'], state['body_font'],
+         file_digest(state['heading_font']), file_digest(state['body_font']),
+         state['text_color'], state['subtitle_color']))
+
+    current, jobs, seen = {}, [], set()
+    stats = {'rendered': 0, 'skipped': 0, 'failed': []}
+    for number, row in enumerate(rows, 1):
+        if not isinstance(row, dict):
+            stats['failed'].append((f'row {number}', 'not an object'))
+            continue
+        title = row_text(row, 'title')
+        if not title:
+            stats['failed'].append((f'row {number}', 'missing title'))
+            continue
+        subtitle = row_text(row, 'subtitle', 'description')
+        slug = slugify(row_text(row, 'slug') or title)
+        if slug in seen:
+            stats['failed'].append((f'row {number}', f'duplicate slug "{slug}"'))
+            continue
+        seen.add(slug)
+
+        filename = f"{slug}.{state['format']}"
+        key = hashlib.sha256(f'{style_key}\0{title}\0{subtitle}'.encode()).hexdigest()[:32]
+        current[filename] = key
+        if manifest.get(filename) == key and (output_dir / filename).exists():
+            stats['skipped'] += 1
+        else:
+            jobs.append((slug, title, subtitle, str(output_dir / filename)))
+
+    batches = [jobs[i:i + BATCH_SIZE] for i in range(0, len(jobs), BATCH_SIZE)]
+    if len(batches) <= 1 or workers == 1:
+        # Not worth a process pool's startup cost
+        _init_worker(state)
+        results = [render_batch(batch) for batch in batches]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(state,)) as executor:
+            results = list(bounded_map(executor, render_batch, batches, max_in_flight=workers * 2))
+
+    for batch_results in results:
+        for slug, error in batch_results:
+            if error:
+                stats['failed'].append((slug, error))
+                current.pop(f"{slug}.{state['format']}", None)
+            else:
+                stats['rendered'] += 1
+
+    save_manifest(output_dir, current)
+    return stats
+
+
+def main():
+    parser = create_parser(
+        description="Generate branded Open Graph images from a CSV or JSONL of page titles",
+        epilog='Example: python social_images.py pro-sites pages.csv --output og/'
+    )
+
+    parser.add_argument('skill_name', help='Skill providing colors, fonts and logo (e.g., "pro-sites")')
+    parser.add_argument('input', help='CSV or JSONL file with title, optional subtitle/description and slug')
+    parser.add_argument('--output', required=True, help='Output directory')
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--template', choices=sorted(TEMPLATES), default='bold', help='Layout template (default: bold)')
+    parser.add_argument('--format', choices=('png', 'jpg'), default='png', help='Image format (default: png)')
+    parser.add_argument('--heading-font', help='Title font file (default: heading font from assets/fonts/)')
+    parser.add_argument('--body-font', help='Subtitle font file (default: body font from assets/fonts/)')
+    parser.add_argument('--force', action='store_true', help='Re-render every page, ignoring the manifest')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+
+    args = parse_args(parser)
+
+    try:
+        Image = require_pillow()
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    skill_path = Path(args.path) / args.skill_name
+    if not (skill_path / 'SKILL.md').exists():
+        print(f"Error: Skill not found: {skill_path}")
+        return 1
+    input_path = Path(args.input)
+    if not input_path.is_file():
+        print(f"Error: Input file not found: {input_path}")
+        return 1
+
+    brand = parse_brand_from_skill_md(skill_path / 'SKILL.md')
+    colors = {**NEUTRAL_COLORS, **brand['colors']}
+    template = TEMPLATES[args.template]
+
+    heading_font = args.heading_font or find_font_file(skill_path, brand['fonts'].get('heading'))
+    body_font = args.body_font or find_font_file(skill_path, brand['fonts'].get('body')) or heading_font
+    for label, font in (('Heading', heading_font), ('Body', body_font)):
+        if font is None:
+            print(f"⚠ {label} font not found in {skill_path / 'assets' / 'fonts'}; using Pillow's default font")
+
+    state = {
+        'base': build_base_layer(Image, skill_path, colors, template).tobytes(),
+        'heading_font': heading_font,
+        'body_font': body_font,
+        'text_color': role_color(colors, template['text']),
+        'subtitle_color': role_color(colors, template['subtitle']),
+        'format': args.format,
+    }
+
+    print(f"Generating {args.template} social images for {brand['client_name']} from {input_path}")
+    start = time.perf_counter()
+    try:
+        stats = generate_images(state, read_rows(input_path), Path(args.output), args.force, args.workers)
+    except (ValueError, csv.Error) as e:
+        print(f"Error: Could not read {input_path}: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Rendered {stats['rendered']} image(s), {stats['skipped']} unchanged, in {elapsed:.2f}s "
+          f"({stats['rendered'] / max(elapsed, 1e-9):.0f} images/s)")
+    if stats['failed']:
+        print(f"✗ Failed on {len(stats['failed'])} row(s):")
+        for slug, error in stats['failed'][:20]:
+            print(f"   • {slug}: {error}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Brand Font Subsetter
+
+Subsets a skill's font files (assets/fonts/*.ttf, *.otf) to the characters a
+site actually uses and writes web-ready files plus the CSS to load them into
+assets/fonts/web/:
+
+- <font>.woff2      Subset fonts (or .woff / .ttf with --format)
+- fonts.css         @font-face rules with unicode-range and font-display: swap
+- preload.html      <link rel="preload"> tags for the heading and body fonts
+
+The character set is scanned from content files (--content) and/or built from
+locale alphabets (--locale); basic Latin and common punctuation are always
+kept. Subsets are cached by font hash, character set and format, so re-runs
+only subset fonts or content that changed. Fonts are subset in parallel.
+
+Requires fontTools (pip install fonttools brotli; brotli is needed for WOFF2).
+
+Usage:
+    python scripts/subset_fonts.py pro-sites --content ~/src/client-web/dist
+    python scripts/subset_fonts.py pro-sites --locale en fr de
+    python scripts/subset_fonts.py pro-sites --content site/ --locale en es --format woff
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, optional_import, parse_args, run_cli
+
+import hashlib
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from design_tokens import parse_brand_from_skill_md
+from logo_variants import file_sha256, same_content
+from scan_colors import DEFAULT_EXCLUDE_DIRS, find_source_files
+
+FONT_EXTENSIONS = ('.ttf', '.otf')
+FORMATS = ('woff2', 'woff', 'ttf')
+CSS_FORMATS = {'woff2': 'woff2', 'woff': 'woff', 'ttf': 'truetype'}
+
+CONTENT_EXTENSIONS = ('.html', '.htm', '.md', '.txt', '.json', '.csv', '.yml', '.yaml', '.xml',
+                      '.svg', '.js', '.jsx', '.ts', '.tsx', '.vue', '.po', '.strings')
+
+# Always kept: printable ASCII, no-break space and typographic punctuation that shows up in any copy
+BASE_CHARACTERS = ''.join(chr(c) for c in range(0x20, 0x7F)) + '\u00a0–—‘’‚“”„…•·€£©®™°×'
+
+# Letters beyond ASCII per language
+LOCALE_CHARACTERS = {
+    'en': '',
+    'fr': 'àâæçéèêëîïôœùûüÿÀÂÆÇÉÈÊËÎÏÔŒÙÛÜŸ«»',
+    'de': 'äöüßÄÖÜẞ',
+    'es': 'áéíñóúüÁÉÍÑÓÚÜ¡¿',
+    'it': 'àèéìíîòóùúÀÈÉÌÍÎÒÓÙÚ',
+    'pt': 'ãõáâàçéêíóôúüÃÕÁÂÀÇÉÊÍÓÔÚÜ',
+    'nl': 'áéíóúëïöüÁÉÍÓÚËÏÖÜ',
+    'sv': 'åäöéÅÄÖÉ',
+    'da': 'æøåéÆØÅÉ',
+    'nb': 'æøåéÆØÅÉ',
+    'fi': 'äöåšžÄÖÅŠŽ',
+    'pl': 'ąćęłńóśźżĄĆĘŁŃÓŚŹŻ',
+    'cs': 'áčďéěíňóřšťúůýžÁČĎÉĚÍŇÓŘŠŤÚŮÝŽ',
+    'tr': 'çğıİöşüÇĞÖŞÜ',
+}
+
+# Bump when subsetting options change, to invalidate cached subsets
+SUBSET_VERSION = '1'
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'brand-skills' / 'font-subsets'
+
+WEB_DIR = 'web'
+
+# Target weights when picking which file of a family to preload
+PRELOAD_WEIGHTS = {'heading': 700, 'body': 400}
+
+
+def require_fonttools():
+    subset = optional_import('fontTools.subset')
+    if subset is None:
+        raise RuntimeError("fontTools is required. Install: pip install fonttools brotli")
+    return subset
+
+
+def collect_characters(content_paths, locales) -> set[int]:
+    """Code points used by the content files and locales, plus the base set"""
+    characters = set(BASE_CHARACTERS)
+    for locale in locales:
+        characters.update(LOCALE_CHARACTERS[locale])
+
+    for content_path in content_paths:
+        if os.path.isdir(content_path):
+            files = find_source_files(str(content_path), CONTENT_EXTENSIONS, set(DEFAULT_EXCLUDE_DIRS))
+        else:
+            files = [str(content_path)]
+        for path in files:
+            with open(path, encoding='utf-8', errors='ignore') as f:
+                for line in f:
+                    characters.update(line)
+
+    return {ord(c) for c in characters if c.isprintable() or c in BASE_CHARACTERS}
+
+
+def unicode_range(codepoints) -> str:
+    """CSS unicode-range for a set of code points, as merged U+XXXX-YYYY spans"""
+    spans = []
+    for cp in sorted(codepoints):
+        if spans and cp == spans[-1][1] + 1:
+            spans[-1][1] = cp
+        else:
+            spans.append([cp, cp])
+    return ', '.join(f'U+{a:X}' if a == b else f'U+{a:X}-{b:X}' for a, b in spans)
+
+
+def font_info(path: Path) -> dict:
+    """Family, weight, style and supported code points of a font file"""
+    TTFont = optional_import('fontTools.ttLib').TTFont
+    with TTFont(path, lazy=True) as font:
+        name = font['name']
+        family = name.getDebugName(16) or name.getDebugName(1) or path.stem
+        os2 = font['OS/2'] if 'OS/2' in font else None
+        weight = os2.usWeightClass if os2 else 400
+        italic = bool(os2.fsSelection & 1) if os2 else 'italic' in path.stem.lower()
+        codepoints = set(font.getBestCmap() or {})
+    return {'family': family, 'weight': weight, 'style': 'italic' if italic else 'normal', 'codepoints': codepoints}
+
+
+def cache_path(cache_dir: Path, font_hash: str, codepoints, fmt: str) -> Path:
+    charset = hashlib.sha256(','.join(map(str, sorted(codepoints))).encode()).hexdigest()
+    key = hashlib.sha256(f'{SUBSET_VERSION}:{font_hash}:{charset}:{fmt}'.encode()).hexdigest()
+    return cache_dir / key[:2] / f'{key}.{fmt}'
+
+
+def subset_font(source: Path, destination: Path, codepoints, fmt: str):
+    """Write a subset of source containing only codepoints (atomically)"""
+    import logging
+
+    subset = require_fonttools()
+    # fontTools logs a warning for every table it drops (FFTM, DSIG, ...)
+    logging.getLogger('fontTools').setLevel(logging.ERROR)
+    options = subset.Options()
+    options.flavor = None if fmt == 'ttf' else fmt
+    options.desubroutinize = True
+
+    font = subset.load_font(str(source), options)
+    try:
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp = destination.with_name(destination.name + '.tmp')
+        try:
+            subset.save_font(font, str(temp), options)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+        os.replace(temp, destination)
+    finally:
+        font.close()
+
+
+def _subset_job(job) -> dict:
+    """Subset one font through the cache; returns its entry for the CSS"""
+    source, codepoints, fmt, cache_dir = job
+    info = font_info(source)
+    # Only characters the font can render go into the subset and its unicode-range
+    used = codepoints & info.pop('codepoints')
+    cached = cache_path(cache_dir, file_sha256(source), used, fmt)
+    hit = cached.exists()
+    if not hit:
+        subset_font(source, cached, used, fmt)
+    return dict(info, source=source, cached=cached, hit=hit, codepoints=used)
+
+
+def subset_skill_fonts(skill_path: Path, codepoints, fmt: str, cache_dir: Path, workers: int = None) -> list[dict]:
+    """Subset every font in assets/fonts/ into assets/fonts/web/; returns one entry per font"""
+    fonts_dir = skill_path / 'assets' / 'fonts'
+    sources = sorted(p for p in fonts_dir.iterdir() if p.suffix.lower() in FONT_EXTENSIONS)
+    jobs = [(source, codepoints, fmt, cache_dir) for source in sources]
+
+    if len(jobs) > 1 and workers != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            entries = list(executor.map(_subset_job, jobs))
+    else:
+        entries = [_subset_job(job) for job in jobs]
+
+    web_dir = fonts_dir / WEB_DIR
+    web_dir.mkdir(exist_ok=True)
+    written = set()
+    # Inter.ttf and Inter.otf would both become Inter.woff2; shared stems keep their source format
+    stems = [entry['source'].stem for entry in entries]
+    for entry in entries:
+        stem = entry['source'].stem
+        if stems.count(stem) > 1:
+            stem += '-' + entry['source'].suffix.lstrip('.').lower()
+        entry['file'] = f"{stem}.{fmt}"
+        destination = web_dir / entry['file']
+        if not same_content(entry['cached'], destination):
+            shutil.copyfile(entry['cached'], destination)
+        written.add(entry['file'])
+
+    # Drop subsets of fonts that were removed or renamed, or of another format
+    for path in web_dir.iterdir():
+        if path.suffix.lstrip('.') in FORMATS and path.name not in written:
+            path.unlink()
+
+    return entries
+
+
+def render_css(entries, fmt: str) -> str:
+    rules = []
+    for entry in sorted(entries, key=lambda e: (e['family'], e['weight'], e['style'])):
+        rules.append(f"""@font-face {{
+  font-family: '{entry['family']}';
+  font-style: {entry['style']};
+  font-weight: {entry['weight']};
+  font-display: swap;
+  src: url('{entry['file']}') format('{CSS_FORMATS[fmt]}');
+  unicode-range: {unicode_range(entry['codepoints'])};
+}}
+""")
+    return '/* Generated by scripts/subset_fonts.py - do not edit */\n\n' + '\n'.join(rules)
+
+
+def preload_entries(entries, brand_fonts: dict) -> list[dict]:
+    """The file closest to the usual weight of each brand heading/body font"""
+    chosen = []
+    for role, weight in PRELOAD_WEIGHTS.items():
+        family = (brand_fonts.get(role) or '').lower()
+        candidates = [e for e in entries if e['family'].lower() == family and e['style'] == 'normal']
+        if candidates:
+            best = min(candidates, key=lambda e: abs(e['weight'] - weight))
+            if best not in chosen:
+                chosen.append(best)
+    return chosen
+
+
+def render_preload(entries, fmt: str, href_prefix: str) -> str:
+    mime = 'font/ttf' if fmt == 'ttf' else f'font/{fmt}'
+    return ''.join(
+        f'<link rel="preload" href="{href_prefix}{entry["file"]}" as="font" type="{mime}" crossorigin>\n'
+        for entry in entries
+    )
+
+
+def main():
+    parser = create_parser(
+        description="Subset a brand skill's fonts to the characters in use and write @font-face CSS",
+        epilog='Example: python subset_fonts.py pro-sites --content ~/src/client-web/dist --locale en fr'
+    )
+
+    parser.add_argument('skill_name', help='Skill with fonts in assets/fonts/ (e.g., "pro-sites")')
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--content', nargs='+', default=[], metavar='PATH',
+                        help='Files or directories whose text determines the character set')
+    parser.add_argument('--locale', nargs='+', default=[], choices=sorted(LOCALE_CHARACTERS),
+                        help='Include the letters of these languages (default: en when no --content)')
+    parser.add_argument('--format', choices=FORMATS, default='woff2', help='Output format (default: woff2)')
+    parser.add_argument('--href-prefix', default='', help='URL prefix for the font files in preload.html (e.g., /fonts/)')
+    parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR),
+                        help=f'Subset cache directory (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--workers', type=int, help='Fonts subset in parallel (default: CPU count)')
+
+    args = parse_args(parser)
+
+    try:
+        require_fonttools()
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+    if args.format == 'woff2' and optional_import('brotli') is None:
+        print("Error: WOFF2 output needs brotli. Install: pip install brotli (or use --format woff)")
+        return 1
+
+    skill_path = Path(args.path) / args.skill_name
+    fonts_dir = skill_path / 'assets' / 'fonts'
+    if not fonts_dir.is_dir() or not any(p.suffix.lower() in FONT_EXTENSIONS for p in fonts_dir.iterdir()):
+        print(f"Error: No .ttf or .otf files in {fonts_dir}")
+        return 1
+    for content_path in args.content:
+        if not os.path.exists(content_path):
+            print(f"Error: Content path not found: {content_path}")
+            return 1
+
+    locales = args.locale or ([] if args.content else ['en'])
+    codepoints = collect_characters(args.content, locales)
+    print(f"Subsetting fonts for {args.skill_name} to {len(codepoints)} character(s)")
+    print()
+
+    try:
+        entries = subset_skill_fonts(skill_path, codepoints, args.format, Path(args.cache_dir), args.workers)
+    except Exception as e:
+        print(f"Error: Subsetting failed: {e}")
+        return 1
+
+    web_dir = fonts_dir / WEB_DIR
+    (web_dir / 'fonts.css').write_text(render_css(entries, args.format))
+
+    brand_fonts = parse_brand_from_skill_md(skill_path / 'SKILL.md')['fonts'] if (skill_path / 'SKILL.md').exists() else {}
+    preload = preload_entries(entries, brand_fonts)
+    (web_dir / 'preload.html').write_text(render_preload(preload, args.format, args.href_prefix))
+
+    original_total = subset_total = 0
+    for entry in entries:
+        original = entry['source'].stat().st_size
+        subset_size = entry['cached'].stat().st_size
+        original_total += original
+        subset_total += subset_size
+        source = 'cached' if entry['hit'] else 'subset'
+        print(f"  ✓ {entry['source'].name} -> {entry['file']}: {original / 1024:.0f} KB -> {subset_size / 1024:.0f} KB "
+              f"({entry['family']} {entry['weight']} {entry['style']}, {source})")
+
+    print()
+    print(f"✓ {len(entries)} font(s): {original_total / 1024:.0f} KB -> {subset_total / 1024:.0f} KB "
+          f"({100 * (1 - subset_total / max(original_total, 1)):.0f}% smaller)")
+    print(f"  Wrote {web_dir / 'fonts.css'} and {web_dir / 'preload.html'} ({len(preload)} preloaded)")
+    if not preload:
+        print("⚠ No font file matches the heading or body font in SKILL.md; nothing is preloaded")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))
@@ -10,39 +10,157 @@ Usage:
     python scripts/validate_brand_assets.py acme-corp --strict
 """
 
-import argparse
-import os
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, non_negative_int, optional_import, parse_args, phase, run_cli
+
+import stat
 import sys
 import re
 from pathlib import Path
-from typing import List, Dict, Tuple
+
+import findings
+from context_budget import check_context_budget
+from findings import RULES, Finding, Severity, rule
+from palette_index import BASE_NEUTRALS, OFF_PALETTE_DELTA_E, PaletteIndex
+from skill_model import SkillTree
+
+# Colors set by fill/stroke/stop-color attributes or CSS properties in SVG files
+SVG_COLOR_RE = re.compile(r'(?:fill|stroke|stop-color|color)\s*[:=]\s*["\']?\s*(#[0-9A-Fa-f]{6}\b|#[0-9A-Fa-f]{3}\b)')
+
+# Validation rules: interned code, severity and message template (formatted only when read)
+FOUND_FILE = rule('found-file', Severity.INFO, 'Found: {path.name}')
+FOUND_DIR = rule('found-dir', Severity.INFO, 'Found directory: {0}/')
+FOUND_OPTIONAL_DIR = rule('found-optional-dir', Severity.INFO, 'Found optional directory: {0}/')
+FOUND_COLOR = rule('found-color', Severity.INFO, 'Found color: {0}')
+IMAGE_SIZE = rule('image-size', Severity.INFO, '{path.name}: {0}x{1}px')
+OPTIONAL_LOGO_MISSING = rule('optional-logo-missing', Severity.INFO, 'Optional logo not provided: {0}')
+TEMPLATES_FOUND = rule('templates-found', Severity.INFO, 'Found {0} template file(s)')
+SCRIPTS_FOUND = rule('scripts-found', Severity.INFO, 'Found {0} script file(s)')
+
+INSTALL_PILLOW = rule('install-pillow', Severity.SUGGESTION, 'Install Pillow: pip install Pillow')
+IMAGE_VERY_LARGE = rule('image-very-large', Severity.SUGGESTION,
+                        '{path.name}: Very large dimensions ({0}x{1}). '
+                        'Consider creating optimized versions (scripts/logo_renditions.py)')
+LOGO_VARIANTS = rule('logo-variants', Severity.SUGGESTION,
+                     'Consider adding logo variants (SVG, white version, horizontal)')
+SVG_LOGO = rule('svg-logo', Severity.SUGGESTION, 'Add SVG logo format for better scaling (logo.svg)')
+ADD_TEMPLATES = rule('add-templates', Severity.SUGGESTION, 'Consider adding pre-branded templates in assets/templates/')
+MAKE_EXECUTABLE = rule('make-executable', Severity.SUGGESTION, 'Make executable: chmod +x {path}')
+
+OPTIONAL_FILE_MISSING = rule('optional-file-missing', Severity.WARNING, 'Optional file missing: {path}')
+PILLOW_MISSING = rule('pillow-missing', Severity.WARNING,
+                      'Pillow library not installed - cannot validate image dimensions')
+IMAGE_FORMAT = rule('image-format', Severity.WARNING,
+                    "{path.name}: Unsupported format '{path.suffix}'. Recommended: PNG or SVG")
+IMAGE_TINY_FILE = rule('image-tiny-file', Severity.WARNING,
+                       '{path.name}: Very small file size ({0} bytes) - may be placeholder')
+IMAGE_LARGE_FILE = rule('image-large-file', Severity.WARNING,
+                        '{path.name}: Large file size ({0:.1f}MB) - consider optimizing')
+IMAGE_LOW = rule('image-low', Severity.WARNING, '{path.name}: Height {0}px is low. Recommended: 100px+')
+IMAGE_ASPECT = rule('image-aspect', Severity.WARNING, '{path.name}: Unusual aspect ratio {0:.2f}:1')
+OFF_PALETTE_COLOR = rule('off-palette-color', Severity.WARNING,
+                         '{path.name}: Off-palette color {0} (nearest brand color: {1} {2}, delta E {3:.1f})')
+LICENSE_MISSING = rule('license-missing', Severity.WARNING,
+                       "SKILL.md frontmatter missing 'license:' field (recommended)")
+SECTION_MISSING = rule('section-missing', Severity.WARNING, 'SKILL.md missing recommended section: {0}')
+PLACEHOLDER_TEXT = rule('placeholder-text', Severity.WARNING, 'SKILL.md contains placeholder text: {0}')
+LOGO_PLACEHOLDER = rule('logo-placeholder', Severity.WARNING,
+                        'Logo placeholder found: {0}.placeholder - replace with actual image')
+REFERENCE_SMALL = rule('reference-small', Severity.WARNING, '{0} is very small - may need content')
+TEMPLATES_EMPTY = rule('templates-empty', Severity.WARNING, 'templates/ directory exists but is empty')
+SCRIPT_NOT_EXECUTABLE = rule('script-not-executable', Severity.WARNING, 'Script is not executable: {0}')
+
+REQUIRED_FILE_MISSING = rule('required-file-missing', Severity.ERROR, 'Required file missing: {path}')
+IMAGE_TOO_SHORT = rule('image-too-short', Severity.ERROR, '{path.name}: Height {0}px is below minimum 50px')
+IMAGE_UNREADABLE = rule('image-unreadable', Severity.ERROR, '{path.name}: Failed to read image - {0}')
+IMAGE_ERROR = rule('image-error', Severity.ERROR, '{path.name}: Validation error - {0}')
+INVALID_HEX = rule('invalid-hex', Severity.ERROR, 'Invalid hex color format: {0}')
+INVALID_RGB = rule('invalid-rgb', Severity.ERROR, 'Invalid RGB color values: {0}')
+SKILL_MD_UNREADABLE = rule('skill-md-unreadable', Severity.ERROR, 'Failed to read SKILL.md: {0}')
+SVG_UNREADABLE = rule('svg-unreadable', Severity.ERROR, '{path.name}: Failed to read SVG - {0}')
+FRONTMATTER_MISSING = rule('frontmatter-missing', Severity.ERROR,
+                           "SKILL.md missing YAML frontmatter (should start with '---')")
+FRONTMATTER_MALFORMED = rule('frontmatter-malformed', Severity.ERROR, 'SKILL.md has malformed YAML frontmatter')
+FIELD_MISSING = rule('field-missing', Severity.ERROR, 'SKILL.md frontmatter missing required field: {0}')
+SKILL_MD_INVALID = rule('skill-md-invalid', Severity.ERROR, 'Failed to validate SKILL.md: {0}')
+REQUIRED_DIR_MISSING = rule('required-dir-missing', Severity.ERROR, 'Required directory missing: {0}/')
+NOT_A_DIRECTORY = rule('not-a-directory', Severity.ERROR, '{0} exists but is not a directory')
+SKILL_NOT_FOUND = rule('skill-not-found', Severity.ERROR, 'Skill directory not found: {path}')
+PRIMARY_LOGO_PLACEHOLDER = rule('primary-logo-placeholder', Severity.ERROR,
+                                'Primary logo is still a placeholder: {0}.placeholder - replace with actual image')
+REQUIRED_LOGO_MISSING = rule('required-logo-missing', Severity.ERROR, 'Required logo missing: {0}')
+NO_LOGOS = rule('no-logos', Severity.ERROR, 'No logo files found in assets/')
 
 
 class ValidationResult:
-    def __init__(self):
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
-        self.suggestions: List[str] = []
-        self.info: List[str] = []
+    """Findings of one validation run
+
+    errors, warnings, suggestions and info are lists of formatted strings
+    ("ERROR: ...") built on access. Findings below min_severity are never
+    created, so catalog-wide runs can skip INFO entirely. Paths under root
+    are stored relative to it (see findings.Finding).
+    """
+
+    __slots__ = ('min_severity', 'root', 'findings')
+
+    def __init__(self, min_severity: Severity = Severity.INFO, root=None):
+        self.min_severity = min_severity
+        self.root = None if root is None else str(root)
+        # One list in recording order; most results hold a handful of findings
+        self.findings: list[Finding] = []
+
+    def add(self, code: str, *args, path=None):
+        """Record a finding for a registered rule; args are formatted into its message when read"""
+        severity = RULES[code][0]
+        if severity >= self.min_severity:
+            self.findings.append(Finding(code, args, path, self.root))
 
     def add_error(self, message: str):
-        self.errors.append(f"ERROR: {message}")
+        self.add(findings.ERROR, message)
 
     def add_warning(self, message: str):
-        self.warnings.append(f"WARNING: {message}")
+        self.add(findings.WARNING, message)
 
     def add_suggestion(self, message: str):
-        self.suggestions.append(f"SUGGESTION: {message}")
+        self.add(findings.SUGGESTION, message)
 
     def add_info(self, message: str):
-        self.info.append(f"INFO: {message}")
+        self.add(findings.INFO, message)
+
+    @property
+    def errors(self) -> list[str]:
+        return [str(finding) for finding in self.of_severity(Severity.ERROR)]
+
+    @property
+    def warnings(self) -> list[str]:
+        return [str(finding) for finding in self.of_severity(Severity.WARNING)]
+
+    @property
+    def suggestions(self) -> list[str]:
+        return [str(finding) for finding in self.of_severity(Severity.SUGGESTION)]
+
+    @property
+    def info(self) -> list[str]:
+        return [str(finding) for finding in self.of_severity(Severity.INFO)]
+
+    def of_severity(self, severity: Severity) -> list[Finding]:
+        return [finding for finding in self.findings if finding.severity == severity]
 
     def is_valid(self, strict=False) -> bool:
-        if self.errors:
-            return False
-        if strict and self.warnings:
-            return False
-        return True
+        worst = Severity.WARNING if strict else Severity.ERROR
+        return not any(finding.severity >= worst for finding in self.findings)
+
+    def to_dict(self, strict=False) -> dict:
+        """Return results as a JSON-serializable dictionary"""
+        return {
+            'valid': self.is_valid(strict=strict),
+            'errors': self.errors,
+            'warnings': self.warnings,
+            'suggestions': self.suggestions,
+            'info': self.info,
+            'findings': [finding.to_dict() for finding in
+                         sorted(self.findings, key=lambda finding: finding.severity, reverse=True)],
+        }
 
     def print_results(self):
         """Print validation results"""
@@ -77,78 +195,81 @@ class ValidationResult:
             print()
 
         # Summary
+        errors = len(self.of_severity(Severity.ERROR))
+        warnings = len(self.of_severity(Severity.WARNING))
         print("=" * 70)
-        if not self.errors and not self.warnings:
+        if not errors and not warnings:
             print("✓ All validations passed!")
-        elif not self.errors:
-            print(f"✓ Validation passed with {len(self.warnings)} warning(s)")
+        elif not errors:
+            print(f"✓ Validation passed with {warnings} warning(s)")
         else:
-            print(f"✗ Validation failed with {len(self.errors)} error(s)")
+            print(f"✗ Validation failed with {errors} error(s)")
         print("=" * 70)
         print()
 
 
-def check_file_exists(path: Path, result: ValidationResult, required: bool = True) -> bool:
+def check_file_exists(path: Path, result: ValidationResult, required: bool = True, tree: SkillTree = None) -> bool:
     """Check if a file exists"""
-    if path.exists():
-        result.add_info(f"Found: {path.name}")
+    if (tree.is_file(path) if tree is not None else path.exists()):
+        result.add(FOUND_FILE, path=path)
         return True
     else:
         if required:
-            result.add_error(f"Required file missing: {path}")
+            result.add(REQUIRED_FILE_MISSING, path=path)
         else:
-            result.add_warning(f"Optional file missing: {path}")
+            result.add(OPTIONAL_FILE_MISSING, path=path)
         return False
 
 
-def validate_image_file(path: Path, result: ValidationResult) -> Dict:
+def validate_image_file(path: Path, result: ValidationResult, tree: SkillTree = None) -> dict:
     """Validate image file and return metadata"""
-    if not path.exists():
+    if not (tree.is_file(path) if tree is not None else path.exists()):
         return {}
 
     try:
-        # Try to import PIL (Pillow) for image validation
-        try:
-            from PIL import Image
-            has_pil = True
-        except ImportError:
-            has_pil = False
-            result.add_warning(f"Pillow library not installed - cannot validate image dimensions")
-            result.add_suggestion("Install Pillow: pip install Pillow")
+        # Pillow is loaded lazily, once per process, and only when an image is checked
+        Image = optional_import('PIL.Image')
+        has_pil = Image is not None
+        if not has_pil:
+            result.add(PILLOW_MISSING)
+            result.add(INSTALL_PILLOW)
 
         # Check file extension
         valid_extensions = ['.png', '.jpg', '.jpeg', '.svg', '.gif', '.webp']
         if path.suffix.lower() not in valid_extensions:
-            result.add_warning(f"{path.name}: Unsupported format '{path.suffix}'. Recommended: PNG or SVG")
+            result.add(IMAGE_FORMAT, path=path)
 
         # Check file size
-        file_size = path.stat().st_size
-        if file_size < 1024:  # Less than 1KB
-            result.add_warning(f"{path.name}: Very small file size ({file_size} bytes) - may be placeholder")
+        file_size = (tree.stat(path) if tree is not None else path.stat()).st_size
+        # Vector logos are legitimately tiny; their content is covered by the SVG palette check
+        if file_size < 1024 and path.suffix.lower() != '.svg':  # Less than 1KB
+            result.add(IMAGE_TINY_FILE, file_size, path=path)
         elif file_size > 5 * 1024 * 1024:  # Larger than 5MB
-            result.add_warning(f"{path.name}: Large file size ({file_size / 1024 / 1024:.1f}MB) - consider optimizing")
+            result.add(IMAGE_LARGE_FILE, file_size / 1024 / 1024, path=path)
 
         # If PIL is available, check dimensions
         if has_pil and path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.webp']:
             try:
-                with Image.open(path) as img:
+                # Pillow only needs the header, so large files are not loaded into memory
+                source = tree.open(path) if tree is not None else open(path, 'rb')
+                with source, Image.open(source) as img:
                     width, height = img.size
-                    result.add_info(f"{path.name}: {width}x{height}px")
+                    result.add(IMAGE_SIZE, width, height, path=path)
 
                     # Check minimum dimensions
                     if height < 50:
-                        result.add_error(f"{path.name}: Height {height}px is below minimum 50px")
+                        result.add(IMAGE_TOO_SHORT, height, path=path)
                     elif height < 100:
-                        result.add_warning(f"{path.name}: Height {height}px is low. Recommended: 100px+")
+                        result.add(IMAGE_LOW, height, path=path)
 
                     # Check if image is too large
                     if width > 3000 or height > 3000:
-                        result.add_suggestion(f"{path.name}: Very large dimensions ({width}x{height}). Consider creating optimized version")
+                        result.add(IMAGE_VERY_LARGE, width, height, path=path)
 
                     # Check aspect ratio (warn if very unusual)
                     aspect_ratio = width / height
                     if aspect_ratio > 5 or aspect_ratio < 0.2:
-                        result.add_warning(f"{path.name}: Unusual aspect ratio {aspect_ratio:.2f}:1")
+                        result.add(IMAGE_ASPECT, aspect_ratio, path=path)
 
                     return {
                         'width': width,
@@ -157,12 +278,12 @@ def validate_image_file(path: Path, result: ValidationResult) -> Dict:
                         'mode': img.mode
                     }
             except Exception as e:
-                result.add_error(f"{path.name}: Failed to read image - {str(e)}")
+                result.add(IMAGE_UNREADABLE, str(e), path=path)
 
         return {'exists': True}
 
     except Exception as e:
-        result.add_error(f"{path.name}: Validation error - {str(e)}")
+        result.add(IMAGE_ERROR, str(e), path=path)
         return {}
 
 
@@ -187,13 +308,14 @@ def validate_rgb_color(color_str: str) -> bool:
     return all(0 <= val <= 255 for val in [r, g, b])
 
 
-def extract_colors_from_skill_md(skill_md_path: Path, result: ValidationResult) -> List[str]:
+def extract_colors_from_skill_md(skill_md_path: Path, result: ValidationResult, content: str = None) -> list[str]:
     """Extract color codes from SKILL.md"""
     colors_found = []
 
     try:
-        with open(skill_md_path, 'r') as f:
-            content = f.read()
+        if content is None:
+            with open(skill_md_path, 'r') as f:
+                content = f.read()
 
         # Find hex colors
         hex_pattern = r'`(#[0-9A-Fa-f]{6})`'
@@ -202,9 +324,9 @@ def extract_colors_from_skill_md(skill_md_path: Path, result: ValidationResult)
         for hex_color in hex_matches:
             if validate_hex_color(hex_color):
                 colors_found.append(hex_color)
-                result.add_info(f"Found color: {hex_color}")
+                result.add(FOUND_COLOR, hex_color)
             else:
-                result.add_error(f"Invalid hex color format: {hex_color}")
+                result.add(INVALID_HEX, hex_color)
 
         # Check for RGB format
         rgb_pattern = r'RGB:\s*\d{1,3},\s*\d{1,3},\s*\d{1,3}'
@@ -212,29 +334,44 @@ def extract_colors_from_skill_md(skill_md_path: Path, result: ValidationResult)
 
         for rgb in rgb_matches:
             if not validate_rgb_color(rgb):
-                result.add_error(f"Invalid RGB color values: {rgb}")
+                result.add(INVALID_RGB, rgb)
 
     except Exception as e:
-        result.add_error(f"Failed to read SKILL.md: {str(e)}")
+        result.add(SKILL_MD_UNREADABLE, str(e))
 
     return colors_found
 
 
-def validate_skill_md_structure(skill_md_path: Path, result: ValidationResult) -> bool:
+def check_svg_palette(svg_path: Path, palette: PaletteIndex, result: ValidationResult, tree: SkillTree = None):
+    """Warn about SVG colors that are not close to any declared brand color"""
+    try:
+        content = tree.read_text(svg_path) if tree is not None else svg_path.read_text()
+    except (OSError, UnicodeDecodeError) as e:
+        result.add(SVG_UNREADABLE, str(e), path=svg_path)
+        return
+
+    for hex_color in sorted({c.upper() for c in SVG_COLOR_RE.findall(content)}):
+        name, nearest_hex, delta_e = palette.nearest(hex_color)
+        if delta_e > OFF_PALETTE_DELTA_E:
+            result.add(OFF_PALETTE_COLOR, hex_color, name, nearest_hex, delta_e, path=svg_path)
+
+
+def validate_skill_md_structure(skill_md_path: Path, result: ValidationResult, content: str = None) -> bool:
     """Validate SKILL.md structure and content"""
     try:
-        with open(skill_md_path, 'r') as f:
-            content = f.read()
+        if content is None:
+            with open(skill_md_path, 'r') as f:
+                content = f.read()
 
         # Check for YAML frontmatter
         if not content.startswith('---'):
-            result.add_error("SKILL.md missing YAML frontmatter (should start with '---')")
+            result.add(FRONTMATTER_MISSING)
             return False
 
         # Extract frontmatter
         parts = content.split('---', 2)
         if len(parts) < 3:
-            result.add_error("SKILL.md has malformed YAML frontmatter")
+            result.add(FRONTMATTER_MALFORMED)
             return False
 
         frontmatter = parts[1]
@@ -244,11 +381,11 @@ def validate_skill_md_structure(skill_md_path: Path, result: ValidationResult) -
         required_fields = ['name:', 'description:']
         for field in required_fields:
             if field not in frontmatter:
-                result.add_error(f"SKILL.md frontmatter missing required field: {field.rstrip(':')}")
+                result.add(FIELD_MISSING, field.rstrip(':'))
 
         # Check for license field (recommended)
         if 'license:' not in frontmatter:
-            result.add_warning("SKILL.md frontmatter missing 'license:' field (recommended)")
+            result.add(LICENSE_MISSING)
 
         # Check body sections
         recommended_sections = [
@@ -261,68 +398,90 @@ def validate_skill_md_structure(skill_md_path: Path, result: ValidationResult) -
 
         for section in recommended_sections:
             if section not in body:
-                result.add_warning(f"SKILL.md missing recommended section: {section}")
+                result.add(SECTION_MISSING, section)
 
         # Check for placeholder text that should be replaced
         placeholders = ['[PLACEHOLDER]', 'TODO:', 'FIXME:', 'XXX:']
         for placeholder in placeholders:
             if placeholder in content:
-                result.add_warning(f"SKILL.md contains placeholder text: {placeholder}")
+                result.add(PLACEHOLDER_TEXT, placeholder)
 
         return True
 
     except Exception as e:
-        result.add_error(f"Failed to validate SKILL.md: {str(e)}")
+        result.add(SKILL_MD_INVALID, str(e))
         return False
 
 
-def validate_directory_structure(skill_path: Path, result: ValidationResult) -> bool:
+def validate_directory_structure(skill_path: Path, result: ValidationResult, tree: SkillTree = None) -> bool:
     """Validate the skill directory structure"""
+    tree = tree if tree is not None else SkillTree(skill_path)
 
     # Check required directories
     required_dirs = ['assets', 'references']
     for dir_name in required_dirs:
-        dir_path = skill_path / dir_name
-        if not dir_path.exists():
-            result.add_error(f"Required directory missing: {dir_name}/")
-        elif not dir_path.is_dir():
-            result.add_error(f"{dir_name} exists but is not a directory")
+        if not tree.exists(dir_name):
+            result.add(REQUIRED_DIR_MISSING, dir_name)
+        elif not tree.is_dir(dir_name):
+            result.add(NOT_A_DIRECTORY, dir_name)
         else:
-            result.add_info(f"Found directory: {dir_name}/")
+            result.add(FOUND_DIR, dir_name)
 
     # Check optional directories
     optional_dirs = ['scripts']
     for dir_name in optional_dirs:
-        dir_path = skill_path / dir_name
-        if dir_path.exists():
-            result.add_info(f"Found optional directory: {dir_name}/")
+        if tree.exists(dir_name):
+            result.add(FOUND_OPTIONAL_DIR, dir_name)
 
     return True
 
 
-def validate_brand_skill(skill_path: Path, strict: bool = False) -> ValidationResult:
-    """Main validation function"""
-    result = ValidationResult()
+def validate_brand_skill(skill_path: Path, strict: bool = False, verbose: bool = True,
+                         tree: SkillTree = None, min_severity: Severity = Severity.INFO) -> ValidationResult:
+    """Main validation function
+
+    Pass a SkillTree to share the directory walk and file reads with other
+    steps (e.g., packaging in `brandctl pipeline`). Findings below
+    min_severity are not recorded, except that strict mode always records
+    warnings because they decide the outcome.
+    """
+    if strict:
+        min_severity = min(min_severity, Severity.WARNING)
+    result = ValidationResult(min_severity, root=skill_path)
+    log = print if verbose else (lambda *args, **kwargs: None)
 
-    print(f"Validating brand skill at: {skill_path}")
-    print()
+    log(f"Validating brand skill at: {skill_path}")
+    log()
 
     # Check if skill directory exists
     if not skill_path.exists():
-        result.add_error(f"Skill directory not found: {skill_path}")
+        result.add(SKILL_NOT_FOUND, path=skill_path)
         return result
 
+    tree = tree if tree is not None else SkillTree(skill_path)
+
     # Validate directory structure
-    validate_directory_structure(skill_path, result)
+    with phase('validate.structure'):
+        validate_directory_structure(skill_path, result, tree)
 
-    # Check for SKILL.md
+    # Check for SKILL.md (read once for all checks)
     skill_md = skill_path / 'SKILL.md'
-    if check_file_exists(skill_md, result, required=True):
-        validate_skill_md_structure(skill_md, result)
-        extract_colors_from_skill_md(skill_md, result)
+    palette = None
+    with phase('validate.skill_md'):
+        if check_file_exists(skill_md, result, required=True, tree=tree):
+            try:
+                content = tree.read_text(skill_md)
+            except (OSError, UnicodeDecodeError) as e:
+                result.add(SKILL_MD_UNREADABLE, str(e))
+            else:
+                validate_skill_md_structure(skill_md, result, content)
+                extract_colors_from_skill_md(skill_md, result, content)
+                declared = PaletteIndex.from_skill_content(content)
+                if len(declared):
+                    palette = PaletteIndex({**declared.colors, **BASE_NEUTRALS})
 
     # Check for logo files
-    print("Checking logo files...")
+    log("Checking logo files...")
     assets_dir = skill_path / 'assets'
 
     logo_files = {
@@ -332,33 +491,40 @@ def validate_brand_skill(skill_path: Path, strict: bool = False) -> ValidationRe
         'logo-horizontal.png': {'required': False, 'description': 'Horizontal orientation'},
     }
 
-    logos_found = 0
-    for logo_file, meta in logo_files.items():
-        logo_path = assets_dir / logo_file
-        # Also check for .placeholder files
-        placeholder_path = assets_dir / f"{logo_file}.placeholder"
-
-        if logo_path.exists():
-            validate_image_file(logo_path, result)
-            logos_found += 1
-        elif placeholder_path.exists():
-            if meta['required']:
-                result.add_error(f"Primary logo is still a placeholder: {logo_file}.placeholder - replace with actual image")
+    with phase('validate.logos'):
+        logos_found = 0
+        for logo_file, meta in logo_files.items():
+            logo_path = assets_dir / logo_file
+            # Also check for .placeholder files
+            placeholder_path = assets_dir / f"{logo_file}.placeholder"
+
+            if tree.is_file(logo_path):
+                validate_image_file(logo_path, result, tree)
+                logos_found += 1
+            elif tree.is_file(placeholder_path):
+                if meta['required']:
+                    result.add(PRIMARY_LOGO_PLACEHOLDER, logo_file)
+                else:
+                    result.add(LOGO_PLACEHOLDER, logo_file)
             else:
-                result.add_warning(f"Logo placeholder found: {logo_file}.placeholder - replace with actual image")
-        else:
-            if meta['required']:
-                result.add_error(f"Required logo missing: {logo_file}")
-            else:
-                result.add_info(f"Optional logo not provided: {logo_file}")
-
-    if logos_found == 0:
-        result.add_error("No logo files found in assets/")
-    elif logos_found == 1:
-        result.add_suggestion("Consider adding logo variants (SVG, white version, horizontal)")
+                if meta['required']:
+                    result.add(REQUIRED_LOGO_MISSING, logo_file)
+                else:
+                    result.add(OPTIONAL_LOGO_MISSING, logo_file)
+
+        if logos_found == 0:
+            result.add(NO_LOGOS)
+        elif logos_found == 1:
+            result.add(LOGO_VARIANTS)
+
+    # Check vector assets against the brand palette
+    with phase('validate.svg_palette'):
+        if palette is not None:
+            for svg_name in tree.list_dir(assets_dir, suffix='.svg'):
+                check_svg_palette(assets_dir / svg_name, palette, result, tree)
 
     # Check for reference files
-    print("Checking reference documentation...")
+    log("Checking reference documentation...")
     references_dir = skill_path / 'references'
 
     reference_files = {
@@ -367,57 +533,78 @@ def validate_brand_skill(skill_path: Path, strict: bool = False) -> ValidationRe
         'logo-usage.md': 'Logo placement and clearspace guidelines'
     }
 
-    for ref_file, description in reference_files.items():
-        ref_path = references_dir / ref_file
-        if check_file_exists(ref_path, result, required=False):
-            # Check file is not empty
-            if ref_path.stat().st_size < 100:
-                result.add_warning(f"{ref_file} is very small - may need content")
+    with phase('validate.references'):
+        for ref_file, description in reference_files.items():
+            ref_path = references_dir / ref_file
+            if check_file_exists(ref_path, result, required=False, tree=tree):
+                # Check file is not empty
+                if tree.stat(ref_path).st_size < 100:
+                    result.add(REFERENCE_SMALL, ref_file)
+
+    # Check the context cost of SKILL.md and references (progressive disclosure)
+    with phase('validate.context'):
+        check_context_budget(skill_path, result, tree)
 
     # Suggest optimal formats
-    print("Checking for optimal formats...")
+    log("Checking for optimal formats...")
 
-    if not (assets_dir / 'logo.svg').exists():
-        result.add_suggestion("Add SVG logo format for better scaling (logo.svg)")
+    if not tree.is_file(assets_dir / 'logo.svg'):
+        result.add(SVG_LOGO)
 
     # Check for templates
     templates_dir = assets_dir / 'templates'
-    if templates_dir.exists():
-        template_files = list(templates_dir.glob('*'))
-        if template_files:
-            result.add_info(f"Found {len(template_files)} template file(s)")
+    with phase('validate.templates'):
+        if tree.is_dir(templates_dir):
+            template_files = tree.list_dir(templates_dir)
+            if template_files:
+                result.add(TEMPLATES_FOUND, len(template_files))
+            else:
+                result.add(TEMPLATES_EMPTY)
         else:
-            result.add_warning("templates/ directory exists but is empty")
-    else:
-        result.add_suggestion("Consider adding pre-branded templates in assets/templates/")
+            result.add(ADD_TEMPLATES)
 
     # Check for scripts
     scripts_dir = skill_path / 'scripts'
-    if scripts_dir.exists():
-        script_files = list(scripts_dir.glob('*.py'))
-        if script_files:
-            result.add_info(f"Found {len(script_files)} script file(s)")
-            # Check if scripts are executable
-            for script in script_files:
-                if not os.access(script, os.X_OK):
-                    result.add_warning(f"Script is not executable: {script.name}")
-                    result.add_suggestion(f"Make executable: chmod +x {script}")
+    with phase('validate.scripts'):
+        if tree.is_dir(scripts_dir):
+            script_files = tree.list_dir(scripts_dir, suffix='.py')
+            if script_files:
+                result.add(SCRIPTS_FOUND, len(script_files))
+                # Check if scripts are executable (owner execute bit from the cached stat)
+                for script in script_files:
+                    if not tree.stat(scripts_dir / script).st_mode & stat.S_IXUSR:
+                        result.add(SCRIPT_NOT_EXECUTABLE, script)
+                        result.add(MAKE_EXECUTABLE, path=scripts_dir / script)
 
     return result
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Validate brand skill assets and structure',
-        epilog='Example: python validate_brand_assets.py acme-corp'
-    )
+def add_level_argument(parser):
+    """Register --level (shared with brandctl pipeline)"""
+    parser.add_argument('--level', choices=[severity.name.lower() for severity in Severity],
+                        help='Lowest severity to report; findings below it are skipped '
+                             '(default: info, or warning for catalog-wide runs)')
+
+
+def level_severity(args, catalog: bool = False) -> Severity:
+    """Minimum severity selected by --level; catalog-wide runs default to WARNING"""
+    if args.level:
+        return Severity[args.level.upper()]
+    return Severity.WARNING if catalog else Severity.INFO
 
+
+def add_validate_arguments(parser):
+    """Register validation arguments (shared with brandctl validate)"""
     parser.add_argument('skill_name', help='Skill directory name (e.g., "acme-corp")')
     parser.add_argument('--path', help='Base path to skills directory (default: ./brand-skills/)')
     parser.add_argument('--strict', action='store_true', help='Treat warnings as errors')
+    add_level_argument(parser)
+    parser.add_argument('--io-workers', type=non_negative_int, default=0, metavar='N',
+                        help='Load the skill with N concurrent filesystem operations, for skills on NFS/SMB (default: off)')
 
-    args = parser.parse_args()
 
+def run_validate(args, tree: SkillTree = None) -> int:
+    """Validate one skill, print the report and return an exit code"""
     # Determine skill path
     if args.path:
         base_path = Path(args.path)
@@ -426,8 +613,12 @@ def main():
 
     skill_path = base_path / args.skill_name
 
+    if tree is None and args.io_workers:
+        from async_tree import VALIDATION_READS, load_tree
+        tree = load_tree(skill_path, VALIDATION_READS, args.io_workers)
+
     # Run validation
-    result = validate_brand_skill(skill_path, args.strict)
+    result = validate_brand_skill(skill_path, args.strict, tree=tree, min_severity=level_severity(args))
 
     # Print results
     result.print_results()
@@ -439,5 +630,18 @@ def main():
         return 1
 
 
+def main():
+    parser = create_parser(
+        description='Validate brand skill assets and structure',
+        epilog='Example: python validate_brand_assets.py acme-corp'
+    )
+
+    add_validate_arguments(parser)
+
+    args = parse_args(parser)
+
+    return run_validate(args)
+
+
 if __name__ == '__main__':
-    sys.exit(main())
+    sys.exit(run_cli(main))
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Batch Watermark Compositor
+
+Stamps a skill's logo onto large batches of images (product photos, previews)
+with configurable position, size and opacity. Clearspace from the image edges
+and the minimum logo height are taken from the skill's references/logo-usage.md.
+
+The logo is resized and premultiplied once per target size and cached in each
+worker, so a batch of same-sized photos pays for it once. Blending is a
+vectorized NumPy "over" on the logo's region only. Files stream through a
+bounded process pool: only a few images are in flight at a time, so memory
+stays flat for batches of any size.
+
+Requires NumPy and Pillow (pip install numpy Pillow).
+
+Usage:
+    python scripts/watermark_images.py pro-sites photos/ --output watermarked/
+    python scripts/watermark_images.py pro-sites photos/ --output out/ --position center --opacity 0.3 --scale 0.4
+    python scripts/watermark_images.py pro-sites photos/ --output out/ --logo logo-white.png --workers 8
+"""
+
+# Imported first so --timing can measure the imports below
+from cli_runtime import create_parser, optional_import, parse_args, run_cli
+
+import functools
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from recolor_images import IMAGE_EXTENSIONS, find_images, require_modules
+
+POSITIONS = ('bottom-right', 'bottom-left', 'top-right', 'top-left', 'center')
+
+# Fallbacks when logo-usage.md doesn't state a rule
+DEFAULT_CLEARSPACE_FACTOR = 2.0
+DEFAULT_MIN_HEIGHT_PX = 50
+
+# "Primary logo element" height as a fraction of the whole logo's height; the
+# clearspace rule is written in multiples of it
+ELEMENT_HEIGHT_RATIO = 0.25
+
+CLEARSPACE_FACTOR_RE = re.compile(r'Minimum clearspace:\s*([\d.]+)\s*x', re.IGNORECASE)
+CLEARSPACE_PX_RE = re.compile(r'Minimum clearspace:\s*(\d+)\s*px', re.IGNORECASE)
+MIN_HEIGHT_RE = re.compile(r'Minimum height:\s*(\d+)\s*px', re.IGNORECASE)
+
+# Per-worker state, set by the pool initializer
+_worker_settings = None
+
+
+def parse_logo_rules(skill_path: Path) -> dict:
+    """Clearspace and minimum size rules from references/logo-usage.md"""
+    rules = {'clearspace_factor': DEFAULT_CLEARSPACE_FACTOR, 'clearspace_px': None, 'min_height_px': DEFAULT_MIN_HEIGHT_PX}
+    usage = skill_path / 'references' / 'logo-usage.md'
+    if not usage.exists():
+        return rules
+
+    content = usage.read_text()
+    if match := CLEARSPACE_PX_RE.search(content):
+        rules['clearspace_px'] = int(match.group(1))
+    elif match := CLEARSPACE_FACTOR_RE.search(content):
+        rules['clearspace_factor'] = float(match.group(1))
+    # The first pixel minimum is the digital one (print minimums are in inches)
+    if match := MIN_HEIGHT_RE.search(content):
+        rules['min_height_px'] = int(match.group(1))
+    return rules
+
+
+def logo_box(image_size, logo_size, settings) -> tuple[int, int, int, int]:
+    """(x, y, width, height) of the logo on an image, honoring size and clearspace rules"""
+    image_width, image_height = image_size
+    logo_width, logo_height = logo_size
+    rules = settings['rules']
+
+    width = max(1, round(image_width * settings['scale']))
+    height = max(1, round(width * logo_height / logo_width))
+    if height < rules['min_height_px']:
+        height = rules['min_height_px']
+        width = max(1, round(height * logo_width / logo_height))
+
+    if rules['clearspace_px'] is not None:
+        margin = rules['clearspace_px']
+    else:
+        margin = round(rules['clearspace_factor'] * ELEMENT_HEIGHT_RATIO * height)
+
+    # Shrink to fit when the image is too small for logo plus clearspace
+    fit = min(1.0, (image_width - 2 * margin) / width, (image_height - 2 * margin) / height)
+    if fit <= 0:
+        raise ValueError(f"Image {image_width}x{image_height} is too small for the logo and its clearspace")
+    width, height = max(1, int(width * fit)), max(1, int(height * fit))
+
+    position = settings['position']
+    if position == 'center':
+        x, y = (image_width - width) // 2, (image_height - height) // 2
+    else:
+        vertical, horizontal = position.split('-')
+        x = margin if horizontal == 'left' else image_width - margin - width
+        y = margin if vertical == 'top' else image_height - margin - height
+    return x, y, width, height
+
+
+@functools.lru_cache(maxsize=32)
+def premultiplied_logo(width: int, height: int):
+    """Logo at (width, height) as float32 premultiplied RGB and alpha, opacity applied
+
+    Cached per worker: photo batches come in a few sizes, so each size is
+    resized and premultiplied once rather than per image.
+    """
+    np, Image = require_modules()
+    settings = _worker_settings
+    with Image.open(settings['logo']) as logo:
+        # Resample in premultiplied space so transparent edges don't darken
+        scaled = logo.convert('RGBA').convert('RGBa').resize((width, height), Image.LANCZOS)
+    pixels = np.asarray(scaled, dtype=np.float32) * (settings['opacity'] / 255)
+    return pixels[..., :3], pixels[..., 3:]
+
+
+def blend(np, region, logo_rgb, logo_alpha):
+    """Composite a premultiplied logo over an (h, w, 3) RGB or (h, w, 4) RGBA uint8 region in place
+
+    RGBA regions are composited in premultiplied space and their alpha is
+    updated, so the logo also shows over transparent pixels.
+    """
+    base = region.astype(np.float32) / 255
+    if region.shape[2] == 3:
+        out = logo_rgb + base * (1 - logo_alpha)
+        region[...] = np.clip(out * 255 + 0.5, 0, 255).astype(np.uint8)
+        return
+
+    base_alpha = base[..., 3:]
+    alpha = logo_alpha + base_alpha * (1 - logo_alpha)
+    premultiplied = logo_rgb + base[..., :3] * base_alpha * (1 - logo_alpha)
+    rgb = np.divide(premultiplied, alpha, out=np.zeros_like(premultiplied), where=alpha > 0)
+    region[..., :3] = np.clip(rgb * 255 + 0.5, 0, 255).astype(np.uint8)
+    region[..., 3:] = np.clip(alpha * 255 + 0.5, 0, 255).astype(np.uint8)
+
+
+def _init_worker(settings: dict):
+    global _worker_settings
+    _worker_settings = settings
+    premultiplied_logo.cache_clear()
+
+
+def watermark_file(job: tuple[str, str]) -> tuple[str, str]:
+    """Watermark one image; returns (source, error message)"""
+    source, destination = job
+    np, Image = require_modules()
+    ImageOps = optional_import('PIL.ImageOps')
+    settings = _worker_settings
+    try:
+        with Image.open(source) as img:
+            img_format = img.format
+            # Camera photos are often stored sideways with an EXIF rotation
+            img = ImageOps.exif_transpose(img)
+            has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+            pixels = np.array(img.convert('RGBA' if has_alpha else 'RGB'))
+
+        x, y, width, height = logo_box((pixels.shape[1], pixels.shape[0]), settings['logo_size'], settings)
+        logo_rgb, logo_alpha = premultiplied_logo(width, height)
+        blend(np, pixels[y:y + height, x:x + width], logo_rgb, logo_alpha)
+
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        save_options = {'quality': settings['quality']} if img_format == 'JPEG' else {}
+        Image.fromarray(pixels).save(destination, format=img_format, **save_options)
+        return source, ''
+    except Exception as e:
+        return source, str(e)
+
+
+def bounded_map(executor, fn, jobs, max_in_flight: int):
+    """Like executor.map, but never submits more than max_in_flight jobs ahead
+
+    Yields results in completion order; keeps the pending set (and the images
+    held by workers and result queues) bounded for arbitrarily long job lists.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    pending = set()
+    for job in jobs:
+        if len(pending) >= max_in_flight:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        pending.add(executor.submit(fn, job))
+    for future in pending:
+        yield future.result()
+
+
+def watermark_directory(input_dir: Path, output_dir: Path, settings: dict, workers: int = None):
+    """Watermark every image under input_dir; yields (source, error) as files finish"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = (
+        (str(path), str(output_dir / path.relative_to(input_dir)))
+        for path in find_images(input_dir)
+    )
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(settings,)) as executor:
+        yield from bounded_map(executor, watermark_file, jobs, max_in_flight=workers * 2)
+
+
+def main():
+    parser = create_parser(
+        description="Watermark batches of images with a brand skill's logo",
+        epilog='Example: python watermark_images.py pro-sites photos/ --output watermarked/'
+    )
+
+    parser.add_argument('skill_name', help='Skill providing the logo and logo-usage rules (e.g., "pro-sites")')
+    parser.add_argument('input_dir', help=f"Directory of images (searched recursively; {', '.join(IMAGE_EXTENSIONS)})")
+    parser.add_argument('--output', required=True, help='Output directory (mirrors the input tree)')
+    parser.add_argument('--path', default='brand-skills', help='Base path to skills directory (default: ./brand-skills/)')
+    parser.add_argument('--logo', default='logo.png', help='Logo file in the skill\'s assets/ (default: logo.png)')
+    parser.add_argument('--position', choices=POSITIONS, default='bottom-right', help='Logo position (default: bottom-right)')
+    parser.add_argument('--scale', type=float, default=0.15, help='Logo width as a fraction of image width (default: 0.15)')
+    parser.add_argument('--opacity', type=float, default=0.8, help='Logo opacity, 0-1 (default: 0.8)')
+    parser.add_argument('--quality', type=int, default=90, help='JPEG output quality (default: 90)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+
+    args = parse_args(parser)
+
+    try:
+        require_modules()
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    skill_path = Path(args.path) / args.skill_name
+    logo_path = skill_path / 'assets' / args.logo
+    if not logo_path.is_file():
+        print(f"Error: Logo not found: {logo_path}")
+        return 1
+    input_dir = Path(args.input_dir)
+    if not input_dir.is_dir():
+        print(f"Error: Input directory not found: {input_dir}")
+        return 1
+    if not 0 < args.opacity <= 1 or not 0 < args.scale <= 1:
+        print("Error: --opacity and --scale must be between 0 and 1")
+        return 1
+
+    _, Image = require_modules()
+    with Image.open(logo_path) as logo:
+        logo_size = logo.size
+
+    rules = parse_logo_rules(skill_path)
+    settings = {
+        'logo': str(logo_path),
+        'logo_size': logo_size,
+        'rules': rules,
+        'position': args.position,
+        'scale': args.scale,
+        'opacity': args.opacity,
+        'quality': args.quality,
+    }
+
+    clearspace = f"{rules['clearspace_px']}px" if rules['clearspace_px'] is not None else f"{rules['clearspace_factor']:g}x logo element"
+    print(f"Watermarking images in {input_dir} with {logo_path.name}")
+    print(f"  Position: {args.position}, opacity {args.opacity:g}, clearspace {clearspace}, "
+          f"min logo height {rules['min_height_px']}px")
+    print()
+
+    start = time.perf_counter()
+    processed = 0
+    failures = []
+    for source, error in watermark_directory(input_dir, Path(args.output), settings, args.workers):
+        if error:
+            failures.append((source, error))
+        else:
+            processed += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Watermarked {processed} image(s) in {elapsed:.2f}s ({processed / max(elapsed, 1e-9):.1f} images/s)")
+    if failures:
+        print(f"✗ Failed on {len(failures)} image(s):")
+        for source, error in failures:
+            print(f"   • {source}: {error}")
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(run_cli(main))